@@ -0,0 +1,5 @@
+""" Benchmark suite of the gap energy and conductivity workloads
+
+Run with ``python -m benchmark run`` from the root of the repository, and
+compare two result files with ``python -m benchmark compare``.
+"""
@@ -0,0 +1,131 @@
+""" Command line interface of the benchmark suite
+
+    python -m benchmark run [--filter TEXT] [--repeats N] [--output FILE]
+    python -m benchmark compare BASE NEW [--threshold FRACTION]
+    python -m benchmark list
+    python -m benchmark accuracy [--filter TEXT] [--output FILE]
+    python -m benchmark golden
+
+Without an output file the results are written to
+``benchmark/results/<timestamp>-<revision>.json``, which keeps a history of
+the results on this machine.
+
+``accuracy`` measures the error and runtime of model configurations against
+the golden reference and reports the Pareto front of each model, ``golden``
+regenerates the golden reference.
+"""
+
+import json
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from pathlib import Path
+
+from . import golden
+from .accuracy import configurations, run_accuracy
+from .compare import compare
+from .runner import run_benchmarks
+from .workloads import workloads
+
+RESULTS_DIRECTORY = Path(__file__).parent / "results"
+
+
+def main(arguments=None) -> int:
+    parser = ArgumentParser(prog="python -m benchmark", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument(
+        "--filter", default="", help="only run workloads containing the text"
+    )
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--output", type=Path)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fractional increase of the median time reported as a regression",
+    )
+
+    commands.add_parser("list", help="list the workloads")
+
+    accuracy_parser = commands.add_parser(
+        "accuracy", help="measure the configurations against the golden reference"
+    )
+    accuracy_parser.add_argument(
+        "--filter",
+        default="",
+        help="only measure configurations whose model or name contains the text",
+    )
+    accuracy_parser.add_argument("--output", type=Path)
+
+    commands.add_parser("golden", help="regenerate the golden reference")
+
+    arguments = parser.parse_args(arguments)
+
+    if arguments.command == "list":
+        for workload in workloads():
+            print(f"{workload.name}: {workload.description}")
+        return 0
+
+    if arguments.command == "golden":
+        reference = golden.generate()
+        golden.write(reference)
+
+        for model, error in golden.maximum_errors(reference).items():
+            print(f"{model}: maximum relative error estimate {error:.2e}")
+        print(f"Golden reference written to {golden.REFERENCE_PATH}")
+        return 0
+
+    if arguments.command == "accuracy":
+        selected = [
+            configuration
+            for configuration in configurations()
+            if arguments.filter in f"{configuration.model} {configuration.name}"
+        ]
+        results, table = run_accuracy(selected, golden.load())
+        print(table)
+
+        if arguments.output is not None:
+            arguments.output.parent.mkdir(parents=True, exist_ok=True)
+            arguments.output.write_text(json.dumps(results, indent=2))
+        return 0
+
+    if arguments.command == "compare":
+        base = json.loads(arguments.base.read_text())
+        new = json.loads(arguments.new.read_text())
+        table, regressions = compare(base, new, arguments.threshold)
+        print(table)
+        return 1 if regressions else 0
+
+    selected = [
+        workload for workload in workloads() if arguments.filter in workload.name
+    ]
+    results = run_benchmarks(selected, arguments.repeats)
+
+    output = arguments.output
+    if output is None:
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = RESULTS_DIRECTORY / f"{timestamp}-{results['revision']}.json"
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+
+    for name, result in results["results"].items():
+        print(
+            f"{name}: {1e3 * result['median_time']:.3f} ms, "
+            f"{result['throughput']:.1f} evaluations/s, "
+            f"{result['integrand_evaluations']} integrand evaluations, "
+            f"{result['peak_memory'] / 1024:.1f} KiB peak"
+        )
+    print(f"Results written to {output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
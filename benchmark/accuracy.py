@@ -0,0 +1,323 @@
+""" Accuracy of model and integrator configurations against the golden reference
+
+Every configuration is set up once, outside of the timing, for the material
+of the reference and returns a function that evaluates the model at a
+reference point. A conductivity configuration may replace the integrator of
+the adaptive integrals of its model, which are the real integrals of
+Mattis-Bardeen and every integral of Zimmermann. The error of a configuration is the relative difference of
+its values from the reference values, and its runtime is the wall time of
+evaluating all the reference points of the model.
+"""
+
+from dataclasses import dataclass
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from warnings import catch_warnings, simplefilter
+
+from super_material.conductivity import (
+    MattisBardeenSuperconductorConductivity,
+    ZimmermannSuperconductorConductivity,
+)
+from super_material.gap_energy import (
+    BCSGapEnergy,
+    BCSWeakGapEnergy,
+    GapEnergyInterface,
+    TabulatedGapEnergy,
+)
+from super_material.integrate import (
+    AbsoluteTolerance,
+    ClenshawCurtisIntegrator,
+    GaussKronrodIntegrator,
+    IntegratorInterface,
+    RelativeTolerance,
+)
+
+# Models of the reference, in the order they are reported
+MODELS = ["bcs_gap", "mattis_bardeen", "zimmermann"]
+
+Evaluate = Callable[[Dict[str, Any]], complex]
+
+MakeIntegrator = Callable[[], IntegratorInterface]
+
+
+@dataclass
+class Configuration:
+    name: str
+    model: str
+    make: Callable[[Dict[str, Any]], Evaluate]
+
+
+def gap_configuration(name: str, make_gap_energy) -> Configuration:
+    def make(material):
+        gap_energy = make_gap_energy(material)
+
+        def evaluate(point):
+            return gap_energy.evaluate(point["temperature"])
+
+        return evaluate
+
+    return Configuration(name, "bcs_gap", make)
+
+
+class IntegratorMattisBardeenSuperconductorConductivity(
+    MattisBardeenSuperconductorConductivity
+):
+    """ Mattis-Bardeen conductivity with a fixed integrator of the real
+    integrals and of the imaginary integral near the gap edge """
+
+    def __init__(self, gap_energy, conductivity_0: float, integrator):
+        super().__init__(gap_energy, conductivity_0)
+        self._configured_integrator = integrator
+
+    def integrator(self, omega: float, factor: float):
+        return self._configured_integrator
+
+
+class IntegratorZimmermannSuperconductorConductivity(
+    ZimmermannSuperconductorConductivity
+):
+    """ Zimmermann conductivity with a fixed integrator """
+
+    def __init__(
+        self, gap_energy, conductivity_0: float, scattering_time: float, integrator
+    ):
+        super().__init__(gap_energy, conductivity_0, scattering_time)
+        self._configured_integrator = integrator
+
+    def integrator(self, omega: float):
+        return self._configured_integrator
+
+
+def mattis_bardeen_configuration(
+    name: str,
+    make_gap_energy,
+    tolerance=None,
+    make_integrator: Optional[MakeIntegrator] = None,
+) -> Configuration:
+    def make(material):
+        gap_energy = make_gap_energy(material)
+        if make_integrator is None:
+            conductivity = MattisBardeenSuperconductorConductivity(
+                gap_energy, material["conductivity_0"], tolerance
+            )
+        else:
+            conductivity = IntegratorMattisBardeenSuperconductorConductivity(
+                gap_energy, material["conductivity_0"], make_integrator()
+            )
+
+        def evaluate(point):
+            return conductivity.evaluate(point["temperature"], point["frequency"])
+
+        return evaluate
+
+    return Configuration(name, "mattis_bardeen", make)
+
+
+def zimmermann_configuration(
+    name: str,
+    make_gap_energy,
+    tolerance=None,
+    make_integrator: Optional[MakeIntegrator] = None,
+) -> Configuration:
+    def make(material):
+        gap_energy = make_gap_energy(material)
+        conductivities = {}
+
+        def make_conductivity(scattering_time):
+            if make_integrator is None:
+                return ZimmermannSuperconductorConductivity(
+                    gap_energy, material["conductivity_0"], scattering_time, tolerance
+                )
+
+            return IntegratorZimmermannSuperconductorConductivity(
+                gap_energy,
+                material["conductivity_0"],
+                scattering_time,
+                make_integrator(),
+            )
+
+        def evaluate(point):
+            scattering_time = point["scattering_time"]
+            if scattering_time not in conductivities:
+                conductivities[scattering_time] = make_conductivity(scattering_time)
+
+            conductivity = conductivities[scattering_time]
+            return conductivity.evaluate(point["temperature"], point["frequency"])
+
+        return evaluate
+
+    return Configuration(name, "zimmermann", make)
+
+
+def bcs(material) -> GapEnergyInterface:
+    return BCSGapEnergy(material["gap_energy_0"], material["kappa"])
+
+
+def bcs_universal_table(material) -> GapEnergyInterface:
+    return BCSGapEnergy(material["gap_energy_0"], material["kappa"], True)
+
+
+def bcs_tabulated(relative_tolerance: float):
+    def make(material):
+        tolerance = AbsoluteTolerance(relative_tolerance * material["gap_energy_0"])
+        return TabulatedGapEnergy(bcs(material), tolerance)
+
+    return make
+
+
+def bcs_weak(material) -> GapEnergyInterface:
+    return BCSWeakGapEnergy(material["gap_energy_0"])
+
+
+def configurations() -> List[Configuration]:
+    result = [
+        gap_configuration("bcs", bcs),
+        gap_configuration("bcs_universal_table", bcs_universal_table),
+        gap_configuration("bcs_tabulated_1e-6", bcs_tabulated(1e-6)),
+        gap_configuration("bcs_tabulated_1e-9", bcs_tabulated(1e-9)),
+        gap_configuration("bcs_weak", bcs_weak),
+        mattis_bardeen_configuration("default", bcs),
+        mattis_bardeen_configuration("universal_table", bcs_universal_table),
+        mattis_bardeen_configuration("tabulated_1e-6", bcs_tabulated(1e-6)),
+        zimmermann_configuration("default", bcs),
+        zimmermann_configuration("universal_table", bcs_universal_table),
+    ]
+
+    for relative_tolerance in [1e-3, 1e-6, 1e-9]:
+        tolerance = RelativeTolerance(relative_tolerance)
+        result.append(
+            mattis_bardeen_configuration(
+                f"relative_{relative_tolerance:g}", bcs, tolerance
+            )
+        )
+        result.append(
+            zimmermann_configuration(f"relative_{relative_tolerance:g}", bcs, tolerance)
+        )
+
+    # The integrators of the adaptive integrals, at the tolerances of the
+    # default integrators of the models
+    for integrator_name, make_integrator in [
+        ("gauss_kronrod", lambda: GaussKronrodIntegrator(1e-12, 1e-12, limit=200)),
+        ("clenshaw_curtis", lambda: ClenshawCurtisIntegrator(1e-12, 1e-12)),
+    ]:
+        result.append(
+            mattis_bardeen_configuration(
+                integrator_name, bcs, make_integrator=make_integrator
+            )
+        )
+
+    for integrator_name, make_integrator in [
+        (
+            "gauss_kronrod_order_15",
+            lambda: GaussKronrodIntegrator(1e-6, 1e-6, limit=200, order=15),
+        ),
+        ("clenshaw_curtis", lambda: ClenshawCurtisIntegrator(1e-6, 1e-6)),
+    ]:
+        result.append(
+            zimmermann_configuration(
+                integrator_name, bcs, make_integrator=make_integrator
+            )
+        )
+
+    return result
+
+
+def reference_value(model: str, point: Dict[str, Any]) -> complex:
+    if model == "bcs_gap":
+        return point["gap_energy"]
+
+    return complex(point["real"], point["imag"])
+
+
+def measure_accuracy(
+    configuration: Configuration, reference: Dict[str, Any]
+) -> Dict[str, Any]:
+    """ Measure the errors and the runtime of a configuration
+
+    The warnings of the integrators are counted rather than shown, since
+    loose tolerances are expected to warn.
+    """
+    points = reference[configuration.model]
+
+    with catch_warnings(record=True) as warnings:
+        simplefilter("always")
+
+        start = perf_counter()
+        evaluate = configuration.make(reference["material"])
+        setup_time = perf_counter() - start
+
+        start = perf_counter()
+        values = [evaluate(point) for point in points]
+        runtime = perf_counter() - start
+
+    errors = []
+    for point, value in zip(points, values):
+        expected = reference_value(configuration.model, point)
+        errors.append(abs(value - expected) / abs(expected))
+
+    return {
+        "model": configuration.model,
+        "name": configuration.name,
+        "points": len(points),
+        "max_error": max(errors),
+        "median_error": median(errors),
+        "setup_time": setup_time,
+        "runtime": runtime,
+        "warnings": len(warnings),
+    }
+
+
+def pareto_front(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """ Results no other result beats in both the maximum error and the runtime """
+    return [
+        result
+        for result in results
+        if not any(
+            other["max_error"] <= result["max_error"]
+            and other["runtime"] <= result["runtime"]
+            and (
+                other["max_error"] < result["max_error"]
+                or other["runtime"] < result["runtime"]
+            )
+            for other in results
+        )
+    ]
+
+
+def report(results: List[Dict[str, Any]]) -> str:
+    """ Tabulate the results of each model by runtime, marking the Pareto front """
+    width = max([len("configuration")] + [len(result["name"]) for result in results])
+    lines = []
+
+    for model in MODELS:
+        model_results = [result for result in results if result["model"] == model]
+        if not model_results:
+            continue
+
+        front = pareto_front(model_results)
+        lines.append(f"{model} ({model_results[0]['points']} points)")
+        lines.append(
+            f"  {'configuration':<{width}} {'max error':>10} {'median error':>12} "
+            f"{'runtime ms':>10} {'setup ms':>10} {'warnings':>8}"
+        )
+
+        for result in sorted(model_results, key=lambda result: result["runtime"]):
+            marker = " pareto" if result in front else ""
+            lines.append(
+                f"  {result['name']:<{width}} {result['max_error']:>10.2e} "
+                f"{result['median_error']:>12.2e} {1e3 * result['runtime']:>10.2f} "
+                f"{1e3 * result['setup_time']:>10.2f} "
+                f"{result['warnings']:>8}{marker}"
+            )
+
+    return "\n".join(lines)
+
+
+def run_accuracy(
+    configurations: List[Configuration], reference: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], str]:
+    results = [
+        measure_accuracy(configuration, reference) for configuration in configurations
+    ]
+    return results, report(results)
@@ -0,0 +1,59 @@
+""" Comparison of two benchmark result files """
+
+from typing import Any, Dict, List, Tuple
+
+
+def compare(
+    base: Dict[str, Any], new: Dict[str, Any], threshold: float
+) -> Tuple[str, List[str]]:
+    """ Compare the median times of the workloads in both result files
+
+    Returns a table of the comparison and the workloads whose median time
+    increased by more than the threshold, as a fraction.
+    """
+    base_results = base["results"]
+    new_results = new["results"]
+    names = [name for name in base_results if name in new_results]
+    width = max([len("workload")] + [len(name) for name in names])
+
+    lines = [
+        f"base {base.get('revision')} ({base['timestamp']}), "
+        f"new {new.get('revision')} ({new['timestamp']})",
+        f"{'workload':<{width}} {'base ms':>10} {'new ms':>10} {'ratio':>7} "
+        f"{'calls ratio':>11} {'memory ratio':>12}",
+    ]
+    regressions = []
+
+    for name in names:
+        base_result = base_results[name]
+        new_result = new_results[name]
+
+        ratio = new_result["median_time"] / base_result["median_time"]
+        calls_ratio = ratio_or_nan(
+            new_result["integrand_evaluations"], base_result["integrand_evaluations"]
+        )
+        memory_ratio = ratio_or_nan(
+            new_result["peak_memory"], base_result["peak_memory"]
+        )
+
+        marker = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            marker = " regression"
+        elif ratio < 1 - threshold:
+            marker = " improvement"
+
+        lines.append(
+            f"{name:<{width}} {1e3 * base_result['median_time']:>10.3f} "
+            f"{1e3 * new_result['median_time']:>10.3f} {ratio:>7.3f} "
+            f"{calls_ratio:>11.3f} {memory_ratio:>12.3f}{marker}"
+        )
+
+    return "\n".join(lines), regressions
+
+
+def ratio_or_nan(new: float, base: float) -> float:
+    if base == 0:
+        return float("nan")
+
+    return new / base
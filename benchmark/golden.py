@@ -0,0 +1,395 @@
+""" Golden reference dataset of gap energies and conductivities
+
+The reference is computed in double precision, but independently of the
+default integrators of the models and to a much tighter tolerance:
+
+- The BCS gap energy is solved with Brent's method on the original gap
+  equation, integrated with QUADPACK, and checked against the Newton solver
+  of the gap equation with a high order rule.
+- The Mattis-Bardeen integrals are integrated with QUADPACK, with the
+  algebraic weight of QUADPACK for the imaginary integral, and checked
+  against the adaptive Gauss-Kronrod integrator.
+- The Zimmermann integrals are integrated with the adaptive Gauss-Kronrod
+  integrator and checked against QUADPACK on their real and imaginary parts.
+
+Each reference value records the relative difference between the two
+methods as its error estimate. The integrands are those of the models, so
+the reference measures the error of the integrators, tables and tolerances,
+not of the integrands.
+"""
+
+import json
+from math import log, pi, sinh, sqrt, tanh
+from pathlib import Path
+from typing import Any, Dict
+from warnings import catch_warnings, simplefilter
+
+from numpy import array, imag, real
+from scipy.integrate import quad
+from scipy.optimize import brentq
+
+from super_material.conductivity import ZimmermannSuperconductorConductivity
+from super_material.conductivity.MattisBardeenSuperconductorConductivity import (
+    MattisBardeenImaginaryIntegrand,
+    MattisBardeenRealFirstIntegrand,
+    MattisBardeenRealSecondIntegrand,
+    fermi_dirac_function,
+    remove_chebyshev_singularity,
+)
+from super_material.constants import h_bar, k_B
+from super_material.gap_energy.BCSGapEquation import BCSGapEquation
+from super_material.integrate import (
+    GaussKronrodIntegrator,
+    IntegrandInterface,
+    IntegratorInterface,
+    QuadpackIntegrator,
+    RelativeTolerance,
+)
+
+# Kept with the tests, which check the models against it
+REFERENCE_PATH = (
+    Path(__file__).parent.parent / "tests" / "data" / "golden_reference.json"
+)
+
+# Niobium
+GAP_ENERGY_0 = 1.5e-3
+KAPPA = 4000
+CONDUCTIVITY_0 = 2.4e7
+
+REDUCED_TEMPERATURES = [0.1, 0.3, 0.5, 0.7, 0.9, 0.97]
+
+# Photon energies relative to the gap energy at zero temperature
+REDUCED_FREQUENCIES = [0.1, 0.5, 1.0, 1.9, 2.5, 4.0, 8.0]
+
+# Photon energies relative to twice the gap energy at the temperature, just
+# below and above the gap edge. Just above the gap edge the third Zimmermann
+# integral is over an interval so narrow that its energies round onto its
+# singularities at the tolerances of the reference, so Zimmermann is only
+# referenced below the gap edge.
+GAP_EDGE_FREQUENCIES = [1 - 1e-5, 1 + 1e-5]
+ZIMMERMANN_GAP_EDGE_FREQUENCIES = [1 - 1e-5]
+
+# Scattering rates relative to the gap energy at zero temperature, from the
+# clean to the dirty limit
+SCATTERING_PARAMETERS = [0.01, 1.0, 100.0]
+
+GAP_REDUCED_TEMPERATURES = [
+    0.0,
+    0.05,
+    0.1,
+    0.2,
+    0.3,
+    0.4,
+    0.5,
+    0.6,
+    0.7,
+    0.8,
+    0.9,
+    0.95,
+    0.99,
+    0.999,
+]
+
+RELATIVE_TOLERANCE = 1e-13
+
+# Tighter tolerances make the adaptive Gauss-Kronrod integrator bisect onto
+# the singularities of the integrands at the gap edges
+KRONROD_RELATIVE_TOLERANCE = 1e-11
+
+
+def reference_eta() -> float:
+    """ Eta of the BCS gap equation
+
+    The integrand :math:`\\tanh{(x)} / x` is :math:`1 / x` to double precision
+    above 20, which is integrated in closed form.
+    """
+    head, _ = quad(
+        lambda x: tanh(x) / x, 0, 20, epsabs=0, epsrel=RELATIVE_TOLERANCE, limit=200
+    )
+    return head + log(KAPPA / 20)
+
+
+def reference_critical_temperature(eta: float) -> float:
+    return GAP_ENERGY_0 * sinh(eta) / (2 * KAPPA * k_B)
+
+
+def reference_gap_energy(eta: float, temperature: float) -> Dict[str, float]:
+    """ Solve the gap equation in its original form """
+    debye_energy = GAP_ENERGY_0 * sinh(eta)
+
+    if temperature == 0:
+        return {"gap_energy": GAP_ENERGY_0, "error": 0.0}
+
+    def residual(gap_energy):
+        def integrand(z):
+            energy = sqrt(z ** 2 + gap_energy ** 2)
+            return tanh(energy / (2 * k_B * temperature)) / energy
+
+        # The integrand is thermally active up to a few k_B T
+        knee = min(40 * k_B * temperature, debye_energy)
+        head, _ = quad(
+            integrand, 0, knee, epsabs=0, epsrel=RELATIVE_TOLERANCE, limit=500
+        )
+        tail, _ = quad(
+            integrand,
+            knee,
+            debye_energy,
+            epsabs=0,
+            epsrel=RELATIVE_TOLERANCE,
+            limit=500,
+        )
+        return eta - head - tail
+
+    # At low temperatures the gap energy is the gap energy at zero temperature
+    # to within the rounding of the residual
+    if residual(GAP_ENERGY_0) <= 0:
+        gap_energy = GAP_ENERGY_0
+    else:
+        gap_energy = brentq(
+            residual, 1e-12 * GAP_ENERGY_0, GAP_ENERGY_0, xtol=1e-16 * GAP_ENERGY_0
+        )
+
+    equation = BCSGapEquation(GAP_ENERGY_0, KAPPA, eta, order=256)
+    check = float(equation.solve(array([temperature]))[0])
+
+    return {"gap_energy": gap_energy, "error": abs(check - gap_energy) / gap_energy}
+
+
+def quadpack_weighted_imaginary(
+    gap_energy: float, temperature: float, omega: float
+) -> float:
+    """ Imaginary integral with the inverse square roots as QUADPACK weight
+
+    The remainder of the integrand without its endpoint singularities is
+    written out, since QUADPACK evaluates it on the endpoints.
+    """
+    photon_energy = h_bar * omega
+    start = max(gap_energy - photon_energy, -gap_energy)
+
+    def remainder(E):
+        a = 1 - 2 * fermi_dirac_function(E + photon_energy, temperature)
+        b = E ** 2 + gap_energy ** 2 + photon_energy * E
+
+        if start > -gap_energy:
+            return a * b / (sqrt(gap_energy + E) * sqrt(E + photon_energy + gap_energy))
+
+        return a * b / sqrt((E + photon_energy) ** 2 - gap_energy ** 2)
+
+    value, _ = quad(
+        remainder,
+        start,
+        gap_energy,
+        weight="alg",
+        wvar=(-0.5, -0.5),
+        epsabs=0,
+        epsrel=RELATIVE_TOLERANCE,
+        limit=2000,
+    )
+    return value
+
+
+def reference_mattis_bardeen(
+    gap_energy: float, temperature: float, frequency: float
+) -> Dict[str, float]:
+    omega = 2 * pi * frequency
+    quadpack = QuadpackIntegrator(0, RELATIVE_TOLERANCE, limit=2000)
+    kronrod = GaussKronrodIntegrator(
+        limit=20000, tolerance=RelativeTolerance(KRONROD_RELATIVE_TOLERANCE)
+    )
+
+    first = MattisBardeenRealFirstIntegrand(gap_energy, temperature, omega)
+    first_values = [quadpack.integrate(first), kronrod.integrate(first)]
+
+    if h_bar * omega > 2 * gap_energy:
+        second = MattisBardeenRealSecondIntegrand(gap_energy, temperature, omega)
+        second_values = [quadpack.integrate(second), kronrod.integrate(second)]
+    else:
+        second_values = [0.0, 0.0]
+
+    imaginary = MattisBardeenImaginaryIntegrand(gap_energy, temperature, omega)
+    imaginary_values = [
+        quadpack_weighted_imaginary(gap_energy, temperature, omega),
+        kronrod.integrate(remove_chebyshev_singularity(imaginary)),
+    ]
+
+    scale = CONDUCTIVITY_0 / (h_bar * omega)
+    values = [
+        scale * (2 * first_value - second_value + 1j * imaginary_value)
+        for first_value, second_value, imaginary_value in zip(
+            first_values, second_values, imaginary_values
+        )
+    ]
+
+    return conductivity_record(values)
+
+
+class ComplexQuadpackIntegrator(IntegratorInterface):
+    """ QUADPACK on the real and imaginary parts of a complex integrand
+
+    The parts are integrated separately, since the complex integration of
+    SciPy does not respect reversed intervals.
+    """
+
+    def integrate(self, integrand: IntegrandInterface) -> complex:
+        interval = integrand.interval()
+        start = interval.start().value()
+        end = interval.end().value()
+
+        def integrate_part(part):
+            value, _ = quad(
+                lambda x: part(integrand.evaluate(x)),
+                start,
+                end,
+                epsabs=0,
+                epsrel=KRONROD_RELATIVE_TOLERANCE / 10,
+                limit=2000,
+            )
+            return value
+
+        return integrate_part(real) + 1j * integrate_part(imag)
+
+
+class ReferenceZimmermannSuperconductorConductivity(
+    ZimmermannSuperconductorConductivity
+):
+    """ Zimmermann conductivity with a fixed integrator """
+
+    def __init__(self, scattering_time: float, integrator):
+        super().__init__(None, CONDUCTIVITY_0, scattering_time)
+        self._reference_integrator = integrator
+
+    def integrator(self, omega: float):
+        return self._reference_integrator
+
+
+def reference_zimmermann(
+    gap_energy: float, temperature: float, frequency: float, scattering_time: float
+) -> Dict[str, float]:
+    integrators = [
+        GaussKronrodIntegrator(
+            limit=20000, tolerance=RelativeTolerance(KRONROD_RELATIVE_TOLERANCE)
+        ),
+        ComplexQuadpackIntegrator(),
+    ]
+
+    values = [
+        ReferenceZimmermannSuperconductorConductivity(
+            scattering_time, integrator
+        ).evaluate_with_gap_energy(gap_energy, temperature, frequency)
+        for integrator in integrators
+    ]
+
+    return conductivity_record(values)
+
+
+def conductivity_record(values) -> Dict[str, float]:
+    reference, check = values
+    return {
+        "real": reference.real,
+        "imag": reference.imag,
+        "error": abs(check - reference) / abs(reference),
+    }
+
+
+def generate() -> Dict[str, Any]:
+    """ Compute the golden reference dataset
+
+    The integrators are asked for tolerances close to the rounding of double
+    precision and warn when they do not reach them, the agreement of the two
+    methods in the error of each reference value is the measure of its
+    accuracy instead.
+    """
+    with catch_warnings():
+        simplefilter("ignore")
+        return generate_reference()
+
+
+def generate_reference() -> Dict[str, Any]:
+    eta = reference_eta()
+    critical_temperature = reference_critical_temperature(eta)
+
+    gap_energies = []
+    for reduced_temperature in GAP_REDUCED_TEMPERATURES:
+        temperature = reduced_temperature * critical_temperature
+        record = reference_gap_energy(eta, temperature)
+        gap_energies.append(
+            {
+                "reduced_temperature": reduced_temperature,
+                "temperature": temperature,
+                **record,
+            }
+        )
+
+    mattis_bardeen = []
+    zimmermann = []
+    for reduced_temperature in REDUCED_TEMPERATURES:
+        temperature = reduced_temperature * critical_temperature
+        gap_energy = reference_gap_energy(eta, temperature)["gap_energy"]
+
+        reduced_frequencies = REDUCED_FREQUENCIES + [
+            2 * gap_energy * gap_edge_frequency / GAP_ENERGY_0
+            for gap_edge_frequency in GAP_EDGE_FREQUENCIES
+        ]
+        zimmermann_reduced_frequencies = REDUCED_FREQUENCIES + [
+            2 * gap_energy * gap_edge_frequency / GAP_ENERGY_0
+            for gap_edge_frequency in ZIMMERMANN_GAP_EDGE_FREQUENCIES
+        ]
+
+        for reduced_frequency in reduced_frequencies:
+            frequency = reduced_frequency * GAP_ENERGY_0 / (2 * pi * h_bar)
+            point = {
+                "reduced_temperature": reduced_temperature,
+                "reduced_frequency": reduced_frequency,
+                "temperature": temperature,
+                "frequency": frequency,
+                "gap_energy": gap_energy,
+            }
+
+            record = reference_mattis_bardeen(gap_energy, temperature, frequency)
+            mattis_bardeen.append({**point, **record})
+
+            if reduced_frequency not in zimmermann_reduced_frequencies:
+                continue
+
+            for scattering_parameter in SCATTERING_PARAMETERS:
+                scattering_time = h_bar / (scattering_parameter * GAP_ENERGY_0)
+                record = reference_zimmermann(
+                    gap_energy, temperature, frequency, scattering_time
+                )
+                zimmermann.append(
+                    {
+                        **point,
+                        "scattering_parameter": scattering_parameter,
+                        "scattering_time": scattering_time,
+                        **record,
+                    }
+                )
+
+    return {
+        "material": {
+            "gap_energy_0": GAP_ENERGY_0,
+            "kappa": KAPPA,
+            "conductivity_0": CONDUCTIVITY_0,
+            "eta": eta,
+            "critical_temperature": critical_temperature,
+        },
+        "bcs_gap": gap_energies,
+        "mattis_bardeen": mattis_bardeen,
+        "zimmermann": zimmermann,
+    }
+
+
+def load() -> Dict[str, Any]:
+    return json.loads(REFERENCE_PATH.read_text())
+
+
+def maximum_errors(reference: Dict[str, Any]) -> Dict[str, float]:
+    return {
+        model: max(point["error"] for point in reference[model])
+        for model in ["bcs_gap", "mattis_bardeen", "zimmermann"]
+    }
+
+
+def write(reference: Dict[str, Any]):
+    REFERENCE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    REFERENCE_PATH.write_text(json.dumps(reference, indent=1))
@@ -0,0 +1,120 @@
+""" Measurement of the benchmark workloads """
+
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy
+import scipy
+
+import super_material
+from super_material.instrument import recording
+
+from .workloads import Workload
+
+# Phases that include other phases, and are left out of the integrand counts
+NESTED_PHASES = {"zimmermann.j"}
+
+
+def measure(workload: Workload, repeats: int) -> Dict[str, Any]:
+    """ Measure the wall time, throughput, integrand calls and peak memory
+
+    The workload is run once to warm up, then timed without instrumentation,
+    then run once while recording its phases and once while tracing its
+    memory allocations. The run is closed after the measurement, if it has a
+    close method.
+    """
+    run = workload.setup()
+    try:
+        return measure_run(workload, run, repeats)
+    finally:
+        close = getattr(run, "close", None)
+        if close is not None:
+            close()
+
+
+def measure_run(
+    workload: Workload, run: Callable[[], int], repeats: int
+) -> Dict[str, Any]:
+    run()
+
+    times = []
+    for _ in range(repeats):
+        begin = perf_counter()
+        evaluations = run()
+        times.append(perf_counter() - begin)
+
+    with recording() as recorder:
+        run()
+
+    phases = {
+        name: {
+            "calls": statistics.calls(),
+            "wall_time": statistics.wall_time(),
+            "evaluations": statistics.evaluations(),
+        }
+        for name, statistics in recorder.phases().items()
+    }
+    integrand_evaluations = sum(
+        phase["evaluations"]
+        for name, phase in phases.items()
+        if name not in NESTED_PHASES
+    )
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "description": workload.description,
+        "repeats": repeats,
+        "evaluations": evaluations,
+        "min_time": min(times),
+        "median_time": median(times),
+        "throughput": evaluations / median(times),
+        "integrand_evaluations": integrand_evaluations,
+        "peak_memory": peak_memory,
+        "phases": phases,
+    }
+
+
+def revision() -> Optional[str]:
+    """ The git revision of the working tree, if it is a git repository """
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.stdout.strip()
+
+
+def run_benchmarks(workloads: List[Workload], repeats: int) -> Dict[str, Any]:
+    results = {}
+    for workload in workloads:
+        results[workload.name] = measure(workload, repeats)
+
+    return {
+        "version": super_material.__version__,
+        "revision": revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "numpy": numpy.__version__,
+            "scipy": scipy.__version__,
+        },
+        "results": results,
+    }
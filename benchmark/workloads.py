@@ -0,0 +1,266 @@
+""" Parameterized benchmark workloads
+
+Every workload is set up once, outside of the timing, and returns a function
+that runs it and returns the number of evaluations it made. The evaluations
+are gap energies for the gap energy workloads and complex conductivities for
+the conductivity workloads, and are the unit of the throughput. A function
+holding resources, such as a process pool, has a close method, which is
+called after the measurement.
+
+The import workloads import the package in a fresh interpreter, and their
+time includes starting the interpreter.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Callable, List
+
+from numpy import linspace
+
+from super_material.conductivity import (
+    MattisBardeenSuperconductorConductivity,
+    ParallelSweep,
+    ZimmermannSuperconductorConductivity,
+)
+from super_material.gap_energy import BCSGapEnergy
+
+# Niobium
+GAP_ENERGY_0 = 1.5e-3
+KAPPA = 4000
+CONDUCTIVITY_0 = 2.4e7
+
+# Reduced temperatures of the low temperature and near T_c cases
+REDUCED_TEMPERATURES = {"low_t": 0.2, "near_tc": 0.95}
+
+# Scattering times of the clean and the dirty cases, in seconds
+SCATTERING_TIMES = {"clean": 1e-12, "dirty": 1e-15}
+
+FREQUENCIES = linspace(10e9, 1500e9, 100)
+
+# Reduced temperatures and frequencies of the grid workloads
+GRID_REDUCED_TEMPERATURES = linspace(0.1, 0.95, 8)
+GRID_FREQUENCIES = linspace(10e9, 1500e9, 25)
+
+
+@dataclass
+class Workload:
+    name: str
+    description: str
+    setup: Callable[[], Callable[[], int]]
+
+
+def bcs_gap_sweep(batch: bool, count: int) -> Callable[[], Callable[[], int]]:
+    def setup():
+        gap_energy = BCSGapEnergy(GAP_ENERGY_0, KAPPA)
+        temperatures = linspace(0, gap_energy.critical_temperature(), count)
+
+        if batch:
+
+            def run():
+                gap_energy.evaluate_many(temperatures)
+                return count
+
+        else:
+
+            def run():
+                for temperature in temperatures:
+                    gap_energy.evaluate(temperature)
+                return count
+
+        return run
+
+    return setup
+
+
+def bcs_gap_instances(count: int) -> Callable[[], Callable[[], int]]:
+    def setup():
+        gap_energies_0 = GAP_ENERGY_0 * linspace(0.8, 1.2, count)
+        kappas = KAPPA * linspace(0.5, 2, 10)
+
+        def run():
+            for index, gap_energy_0 in enumerate(gap_energies_0):
+                gap_energy = BCSGapEnergy(gap_energy_0, kappas[index % len(kappas)])
+                gap_energy.evaluate(0.5 * gap_energy.critical_temperature())
+            return count
+
+        return run
+
+    return setup
+
+
+def bcs_gap_live_instances(count: int) -> Callable[[], Callable[[], int]]:
+    def setup():
+        gap_energies = [
+            BCSGapEnergy(gap_energy_0, KAPPA)
+            for gap_energy_0 in GAP_ENERGY_0 * linspace(0.8, 1.2, count)
+        ]
+
+        def run():
+            for _ in range(10):
+                for gap_energy in gap_energies:
+                    gap_energy.critical_temperature()
+            return 10 * count
+
+        return run
+
+    return setup
+
+
+def conductivity_sweep(
+    make_conductivity, reduced_temperature: float
+) -> Callable[[], Callable[[], int]]:
+    def setup():
+        gap_energy = BCSGapEnergy(GAP_ENERGY_0, KAPPA)
+        conductivity = make_conductivity(gap_energy)
+        temperature = reduced_temperature * gap_energy.critical_temperature()
+
+        def run():
+            conductivity.evaluate_sweep(temperature, FREQUENCIES)
+            return len(FREQUENCIES)
+
+        return run
+
+    return setup
+
+
+def conductivity_grid(
+    make_conductivity, max_workers: int
+) -> Callable[[], Callable[[], int]]:
+    def setup():
+        gap_energy = BCSGapEnergy(GAP_ENERGY_0, KAPPA)
+        sweep = ParallelSweep(make_conductivity(gap_energy), max_workers)
+        temperatures = GRID_REDUCED_TEMPERATURES * gap_energy.critical_temperature()
+
+        # Start the workers outside of the timing
+        sweep.evaluate(temperatures[:1], GRID_FREQUENCIES[:1])
+
+        def run():
+            sweep.evaluate(temperatures, GRID_FREQUENCIES)
+            return len(temperatures) * len(GRID_FREQUENCIES)
+
+        # The runner stops the workers after the measurement
+        run.close = sweep.close
+        return run
+
+    return setup
+
+
+def fresh_import(code: str) -> Callable[[], Callable[[], int]]:
+    def setup():
+        def run():
+            subprocess.run([sys.executable, "-c", code], check=True)
+            return 1
+
+        return run
+
+    return setup
+
+
+def mattis_bardeen(gap_energy):
+    return MattisBardeenSuperconductorConductivity(gap_energy, CONDUCTIVITY_0)
+
+
+def zimmermann(scattering_time: float):
+    def make(gap_energy):
+        return ZimmermannSuperconductorConductivity(
+            gap_energy, CONDUCTIVITY_0, scattering_time
+        )
+
+    return make
+
+
+def workloads() -> List[Workload]:
+    result = [
+        Workload(
+            "bcs_gap_sweep_batch",
+            "BCS gap energy at 1000 temperatures on [0, T_c] in one call",
+            bcs_gap_sweep(True, 1000),
+        ),
+        Workload(
+            "bcs_gap_sweep_scalar",
+            "BCS gap energy at 200 temperatures on [0, T_c] one at a time",
+            bcs_gap_sweep(False, 200),
+        ),
+        Workload(
+            "bcs_gap_instances",
+            "BCS gap energy at T_c / 2 of 2000 short-lived gap energies, "
+            "with 10 values of kappa",
+            bcs_gap_instances(2000),
+        ),
+        Workload(
+            "bcs_gap_live_instances",
+            "Critical temperatures of 500 live gap energies, 10 times each",
+            bcs_gap_live_instances(500),
+        ),
+        Workload(
+            "import_interpreter",
+            "Start an interpreter without importing the package, as a baseline",
+            fresh_import("pass"),
+        ),
+        Workload(
+            "import_package",
+            "Start an interpreter and import the package and its constants",
+            fresh_import("import super_material.constants"),
+        ),
+        Workload(
+            "import_models",
+            "Start an interpreter and import the conductivity and gap models",
+            fresh_import(
+                "from super_material import BCSGapEnergy, "
+                "MattisBardeenSuperconductorConductivity"
+            ),
+        ),
+        Workload(
+            "import_and_integrate",
+            "Start an interpreter and evaluate a Mattis-Bardeen conductivity, "
+            "which imports SciPy",
+            fresh_import(
+                "from super_material import BCSGapEnergy, "
+                "MattisBardeenSuperconductorConductivity\n"
+                "MattisBardeenSuperconductorConductivity("
+                "BCSGapEnergy(1.5e-3, 4000), 2.4e7).evaluate(4.2, 100e9)"
+            ),
+        ),
+    ]
+
+    grid = f"{len(GRID_REDUCED_TEMPERATURES)} x {len(GRID_FREQUENCIES)}"
+    cpu_count = os.cpu_count() or 1
+    result += [
+        Workload(
+            "zimmermann_grid_serial",
+            f"Zimmermann on a {grid} temperature and frequency grid in one process",
+            conductivity_grid(zimmermann(SCATTERING_TIMES["clean"]), 1),
+        ),
+        Workload(
+            "zimmermann_grid_parallel",
+            f"Zimmermann on a {grid} temperature and frequency grid in a process "
+            f"pool of the {cpu_count} CPUs",
+            conductivity_grid(zimmermann(SCATTERING_TIMES["clean"]), cpu_count),
+        ),
+    ]
+
+    for case, reduced_temperature in REDUCED_TEMPERATURES.items():
+        result.append(
+            Workload(
+                f"mattis_bardeen_sweep_{case}",
+                f"Mattis-Bardeen at T = {reduced_temperature} T_c, "
+                f"{len(FREQUENCIES)} frequencies",
+                conductivity_sweep(mattis_bardeen, reduced_temperature),
+            )
+        )
+
+        for scattering, scattering_time in SCATTERING_TIMES.items():
+            result.append(
+                Workload(
+                    f"zimmermann_sweep_{scattering}_{case}",
+                    f"Zimmermann with a scattering time of {scattering_time} s at "
+                    f"T = {reduced_temperature} T_c, {len(FREQUENCIES)} frequencies",
+                    conductivity_sweep(
+                        zimmermann(scattering_time), reduced_temperature
+                    ),
+                )
+            )
+
+    return result
@@ -15,8 +15,7 @@ def run():
     frequencies = linspace(10e9, 1500e9, 400)
 
     with Profile() as profile:
-        for frequency in frequencies:
-            conductivity.evaluate(4.2, frequency)
+        conductivity.evaluate_sweep(4.2, frequencies)
 
     profile.print_stats()
 
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+from numpy import linspace
+
+from super_material.gap_energy import BCSGapEnergy
+from super_material.conductivity import (
+    MattisBardeenSuperconductorConductivity,
+    ZimmermannSuperconductorConductivity,
+)
+from super_material.instrument import recording
+
+
+def run():
+    gap_energy = BCSGapEnergy(1.5e-3, 4000)
+    mattis_bardeen = MattisBardeenSuperconductorConductivity(gap_energy, 2.4e7)
+    zimmermann = ZimmermannSuperconductorConductivity(gap_energy, 2.4e7, 3e-14)
+
+    frequencies = linspace(10e9, 1500e9, 200)
+
+    with recording() as recorder:
+        for temperature in linspace(1, 8, 8):
+            mattis_bardeen.evaluate_sweep(temperature, frequencies)
+            zimmermann.evaluate_sweep(temperature, frequencies)
+
+    print(recorder.report())
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,3 @@
+#!/bin/sh
+
+poetry run python -m benchmark "$@"
@@ -1,3 +1,3 @@
 #!/bin/sh
 
-poetry run black --target-version $1 py38 super_material tests examples profile docs/conf.py
+poetry run black --target-version $1 py38 super_material tests examples profile benchmark docs/conf.py
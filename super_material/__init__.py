@@ -1,5 +1,49 @@
 __version__ = "1.0.0a"
 __author__ = "Paul le Roux"
 
-from .conductivity import *
-from .gap_energy import *
+from importlib import import_module
+
+# The subpackages are imported on the first access of one of their names
+# (PEP 562), so that importing the package does not import NumPy and SciPy
+_subpackages = [
+    "cache",
+    "conductivity",
+    "constants",
+    "gap_energy",
+    "instrument",
+    "integrate",
+]
+
+_exports = {
+    "CachedSuperconductorConductivity": "conductivity",
+    "MattisBardeenSuperconductorConductivity": "conductivity",
+    "ParallelSweep": "conductivity",
+    "SuperconductorConductivityInterface": "conductivity",
+    "ZimmermannSuperconductorConductivity": "conductivity",
+    "BCSGapEnergy": "gap_energy",
+    "BCSWeakGapEnergy": "gap_energy",
+    "CachedGapEnergy": "gap_energy",
+    "GapEnergyInterface": "gap_energy",
+    "TabulatedGapEnergy": "gap_energy",
+    "UniversalBCSGapTable": "gap_energy",
+}
+
+
+def __getattr__(name: str):
+    if name in _subpackages:
+        return import_module(f".{name}", __name__)
+
+    if name in _exports:
+        subpackage = import_module(f".{_exports[name]}", __name__)
+        value = getattr(subpackage, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_subpackages) | set(_exports))
+
+
+__all__ = list(_exports)
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Hashable, Tuple, TypeVar
+
+from .CacheStatistics import CacheStatistics
+
+T = TypeVar("T")
+
+
+class CacheInterface(ABC):
+    """ Cache of the values of keys
+
+    The keys are the tuples of the cached gap energies and conductivities.
+    """
+
+    @abstractmethod
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """ Look up the value of the key as whether it is cached and the value """
+
+    @abstractmethod
+    def store(self, key: Hashable, value: Any):
+        """ Store the value of the key """
+
+    @abstractmethod
+    def statistics(self) -> CacheStatistics:
+        """ Statistics of the lookups and the size of the cache """
+
+    @abstractmethod
+    def clear(self):
+        """ Remove the entries and reset the statistics """
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """ Look up the value of the key, or compute and store it on a miss """
+        found, value = self.lookup(key)
+        if found:
+            return value
+
+        value = compute()
+        self.store(key, value)
+        return value
+
+
+__all__ = ["CacheInterface"]
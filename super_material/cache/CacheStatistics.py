@@ -0,0 +1,64 @@
+from typing import Optional
+
+
+class CacheStatistics:
+    """ Snapshot of the lookups and the size of a cache
+
+    The maximum size of an unbounded cache is None.
+    """
+
+    _hits: int
+    _misses: int
+    _evictions: int
+    _size: int
+    _maximum_size: Optional[int]
+
+    def __init__(
+        self,
+        hits: int,
+        misses: int,
+        evictions: int,
+        size: int,
+        maximum_size: Optional[int],
+    ):
+        self._hits = hits
+        self._misses = misses
+        self._evictions = evictions
+        self._size = size
+        self._maximum_size = maximum_size
+
+    def hits(self) -> int:
+        return self._hits
+
+    def misses(self) -> int:
+        return self._misses
+
+    def lookups(self) -> int:
+        return self._hits + self._misses
+
+    def hit_rate(self) -> float:
+        """ Fraction of the lookups that were hits """
+        if self.lookups() == 0:
+            return 0.0
+
+        return self._hits / self.lookups()
+
+    def evictions(self) -> int:
+        return self._evictions
+
+    def size(self) -> int:
+        """ Number of entries in the cache """
+        return self._size
+
+    def maximum_size(self) -> Optional[int]:
+        return self._maximum_size
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStatistics(hits={self._hits}, misses={self._misses}, "
+            f"evictions={self._evictions}, size={self._size}, "
+            f"maximum_size={self._maximum_size})"
+        )
+
+
+__all__ = ["CacheStatistics"]
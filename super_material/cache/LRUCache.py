@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional, Tuple
+
+from .CacheInterface import CacheInterface
+from .CacheStatistics import CacheStatistics
+
+# Entries of the shared cache, each a gap energy or a conductivity
+SHARED_CACHE_MAXIMUM_SIZE = 100000
+
+
+class LRUCache(CacheInterface):
+    """ Cache of a bounded number of entries evicting the least recently used
+
+    Lookups and stores are thread safe. Values are computed outside of the
+    lock, so that evaluations in other threads are not blocked, and concurrent
+    misses of the same key may compute its value more than once.
+
+    Caches pickle with their entries, except for the shared cache, which
+    unpickles as the shared cache of the process, so that cached gap energies
+    and conductivities sent to worker processes use the caches of the workers.
+    """
+
+    _maximum_size: int
+    _entries: "OrderedDict[Hashable, Any]"
+    _lock: Lock
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, maximum_size: int = SHARED_CACHE_MAXIMUM_SIZE):
+        assert maximum_size > 0
+
+        self._maximum_size = maximum_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __reduce_ex__(self, protocol):
+        # The shared cache unpickles as the shared cache of the process
+        if self is _shared_cache:
+            return shared_cache, ()
+
+        return super().__reduce_ex__(protocol)
+
+    def __getstate__(self):
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_entries"] = self._entries.copy()
+
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def maximum_size(self) -> int:
+        return self._maximum_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """ Look up the value of the key as whether it is cached and the value """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, self._entries[key]
+
+    def store(self, key: Hashable, value: Any):
+        """ Store the value of the key, evicting the least recently used entries
+        beyond the maximum size """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maximum_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._maximum_size,
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+_shared_cache: Optional[LRUCache] = None
+_shared_cache_lock = Lock()
+
+
+def shared_cache() -> LRUCache:
+    """ The cache of the cached gap energies and conductivities without one """
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LRUCache()
+
+        return _shared_cache
+
+
+def quantize(value: float, resolution: float) -> int:
+    """ The value as a whole number of the resolution, to use in cache keys """
+    return round(float(value) / resolution)
+
+
+def quantized(value: float, resolution: float) -> float:
+    """ The value rounded to a whole number of the resolution, at which the
+    value of a cache key is evaluated """
+    return quantize(value, resolution) * resolution
+
+
+__all__ = ["LRUCache", "quantize", "quantized", "shared_cache"]
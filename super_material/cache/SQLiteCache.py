@@ -0,0 +1,159 @@
+import os
+import sqlite3
+from hashlib import sha256
+from numbers import Integral, Real
+from threading import Lock, local
+from typing import Any, Hashable, Tuple
+
+from .. import __version__
+
+from .CacheInterface import CacheInterface
+from .CacheStatistics import CacheStatistics
+
+
+def stable_key(key: Hashable) -> Hashable:
+    """ The key with its numbers as Python numbers
+
+    Keys are tuples of strings, numbers, booleans and None. Other keys, such as
+    the default cache keys of models, which are the models themselves, differ
+    between processes and cannot be persisted.
+    """
+    if key is None or isinstance(key, (bool, str)):
+        return key
+
+    if isinstance(key, Integral):
+        return int(key)
+
+    if isinstance(key, Real):
+        return float(key)
+
+    if isinstance(key, tuple):
+        return tuple(stable_key(item) for item in key)
+
+    raise TypeError(
+        f"Cache key {key!r} cannot be persisted, only tuples of strings, "
+        "numbers, booleans and None can"
+    )
+
+
+def key_digest(key: Hashable, version: str) -> str:
+    """ SHA-256 of the stable key and the version """
+    text = repr((version, stable_key(key)))
+    return sha256(text.encode()).hexdigest()
+
+
+class SQLiteCache(CacheInterface):
+    """ Cache of gap energies and conductivities in an SQLite database
+
+    The values persist between processes. Entries are keyed by the SHA-256 of
+    the key, which holds the parameters of the model and its integrators, and
+    the version of the library, so that results of other versions are not
+    returned. The database is in write-ahead logging mode, in which several
+    processes read concurrently with a writer.
+
+    Each thread and process opens its own connection to the database. The
+    cache is unbounded, clear it or remove the file to reclaim the space. The
+    statistics are those of this cache object.
+    """
+
+    _path: str
+    _version: str
+    _timeout: float
+    _connections: local
+    _lock: Lock
+    _hits: int
+    _misses: int
+
+    def __init__(self, path: str, version: str = __version__, timeout: float = 30.0):
+        self._path = os.fspath(path)
+        self._version = version
+        self._timeout = timeout
+        self._connections = local()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, real REAL NOT NULL, imag REAL)"
+            )
+
+    def __getstate__(self):
+        return {"path": self._path, "version": self._version, "timeout": self._timeout}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], state["version"], state["timeout"])
+
+    def path(self) -> str:
+        return self._path
+
+    def version(self) -> str:
+        return self._version
+
+    def _connection(self) -> sqlite3.Connection:
+        """ The connection of this thread, reopened in a forked process """
+        connections = self._connections
+        if getattr(connections, "pid", None) != os.getpid():
+            connections.connection = sqlite3.connect(self._path, timeout=self._timeout)
+            connections.connection.execute("PRAGMA synchronous=NORMAL")
+            connections.pid = os.getpid()
+
+        return connections.connection
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        digest = key_digest(key, self._version)
+        row = (
+            self._connection()
+            .execute("SELECT real, imag FROM entries WHERE key = ?", (digest,))
+            .fetchone()
+        )
+
+        with self._lock:
+            if row is None:
+                self._misses += 1
+                return False, None
+
+            self._hits += 1
+
+        real, imag = row
+        if imag is None:
+            return True, real
+
+        return True, complex(real, imag)
+
+    def store(self, key: Hashable, value: Any):
+        """ Store the value of the key, which is a real or a complex number """
+        digest = key_digest(key, self._version)
+
+        if isinstance(value, complex):
+            real, imag = value.real, value.imag
+        else:
+            real, imag = float(value), None
+
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, real, imag) VALUES (?, ?, ?)",
+                (digest, real, imag),
+            )
+
+    def statistics(self) -> CacheStatistics:
+        (size,) = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()
+
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses, 0, size, None)
+
+    def clear(self):
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM entries")
+
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+__all__ = ["SQLiteCache", "key_digest", "stable_key"]
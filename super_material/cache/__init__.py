@@ -0,0 +1,14 @@
+""" Opt-in caching of gap energy and conductivity evaluations
+
+The gap energies and conductivities are wrapped with
+:class:`~super_material.CachedGapEnergy` and
+:class:`~super_material.CachedSuperconductorConductivity`, which cache their
+evaluations in a bounded :class:`LRUCache` keyed by the parameters of the
+wrapped model and the quantized temperature and frequency. A
+:class:`SQLiteCache` keeps the evaluations on disk between processes.
+"""
+
+from .CacheInterface import *
+from .CacheStatistics import *
+from .LRUCache import *
+from .SQLiteCache import *
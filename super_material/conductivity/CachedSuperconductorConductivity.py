@@ -0,0 +1,161 @@
+from typing import Callable, Dict, Hashable, List, Optional
+
+from numpy import array, asarray, empty, ndarray, ndenumerate
+
+from ..cache.CacheInterface import CacheInterface
+from ..cache.LRUCache import quantize, quantized, shared_cache
+from ..gap_energy.GapEnergyInterface import GapEnergyInterface
+
+from .SuperconductorConductivityInterface import SuperconductorConductivityInterface
+
+
+class CachedSuperconductorConductivity(SuperconductorConductivityInterface):
+    """ Superconductor conductivity with its evaluations cached
+
+    The conductivities are cached by the cache key of the wrapped
+    conductivity, which holds its physical parameters, gap energy, tolerance
+    and integrators, the resolutions of the temperature and the frequency,
+    and the temperature and frequency quantized to their resolutions. The
+    conductivities are evaluated at the quantized temperature and frequency,
+    so that they do not depend on the order of the evaluations. Without
+    a cache the shared in memory cache is used, a
+    :class:`~super_material.cache.SQLiteCache` keeps the conductivities
+    between processes.
+
+    Only the conductivities are cached. To share the gap energies between
+    conductivities of the same material, give the conductivities a
+    :class:`~super_material.CachedGapEnergy`.
+    """
+
+    _base: SuperconductorConductivityInterface
+    _base_key: Hashable
+    _cache: CacheInterface
+    _temperature_resolution: float
+    _frequency_resolution: float
+
+    def __init__(
+        self,
+        base: SuperconductorConductivityInterface,
+        cache: Optional[CacheInterface] = None,
+        temperature_resolution: float = 1e-9,
+        frequency_resolution: float = 1e-3,
+    ):
+        assert temperature_resolution > 0
+        assert frequency_resolution > 0
+
+        self._base = base
+        self._base_key = base.cache_key()
+        self._cache = shared_cache() if cache is None else cache
+        self._temperature_resolution = temperature_resolution
+        self._frequency_resolution = frequency_resolution
+
+    def base(self) -> SuperconductorConductivityInterface:
+        return self._base
+
+    def cache(self) -> CacheInterface:
+        return self._cache
+
+    def temperature_resolution(self) -> float:
+        """ Resolution of the temperatures in Kelvin """
+        return self._temperature_resolution
+
+    def frequency_resolution(self) -> float:
+        """ Resolution of the frequencies in Hertz """
+        return self._frequency_resolution
+
+    def cache_key(self) -> Hashable:
+        return self._base_key
+
+    def gap_energy(self) -> Optional[GapEnergyInterface]:
+        return self._base.gap_energy()
+
+    def key(self, temperature: float, frequency: float) -> Hashable:
+        """ Cache key of the conductivity at the temperature and frequency """
+        return (
+            "conductivity",
+            self._base_key,
+            self._temperature_resolution,
+            self._frequency_resolution,
+            quantize(temperature, self._temperature_resolution),
+            quantize(frequency, self._frequency_resolution),
+        )
+
+    def evaluate(self, temperature: float, frequency: float) -> complex:
+        return self._cache.get_or_compute(
+            self.key(temperature, frequency),
+            lambda: self._base.evaluate(
+                quantized(temperature, self._temperature_resolution),
+                quantized(frequency, self._frequency_resolution),
+            ),
+        )
+
+    def evaluate_sweep(self, temperature: float, frequencies: ndarray) -> ndarray:
+        """ Calculates the complex conductivity at each of the frequencies
+
+        The conductivities missing from the cache are evaluated by the wrapped
+        conductivity in one sweep.
+        """
+        quantized_temperature = quantized(temperature, self._temperature_resolution)
+        return self.evaluate_cached_sweep(
+            temperature,
+            frequencies,
+            lambda missing: self._base.evaluate_sweep(quantized_temperature, missing),
+        )
+
+    def evaluate_sweep_with_gap_energy(
+        self, gap_energy: float, temperature: float, frequencies: ndarray
+    ) -> ndarray:
+        quantized_temperature = quantized(temperature, self._temperature_resolution)
+        return self.evaluate_cached_sweep(
+            temperature,
+            frequencies,
+            lambda missing: self._base.evaluate_sweep_with_gap_energy(
+                gap_energy, quantized_temperature, missing
+            ),
+        )
+
+    def evaluate_cached_sweep(
+        self,
+        temperature: float,
+        frequencies: ndarray,
+        evaluate_missing: Callable[[ndarray], ndarray],
+    ) -> ndarray:
+        """ Looks the conductivities up in the cache, and evaluates and stores
+        the missing ones with a single call of the sweep of missing frequencies
+
+        The sweep of missing frequencies is given each of the missing
+        quantized frequencies once.
+        """
+        frequencies = asarray(frequencies, dtype=float)
+        conductivities = empty(frequencies.shape, dtype=complex)
+
+        missing: Dict[Hashable, List[tuple]] = {}
+        for index, frequency in ndenumerate(frequencies):
+            key = self.key(temperature, frequency)
+            found, conductivity = self._cache.lookup(key)
+            if found:
+                conductivities[index] = conductivity
+            else:
+                missing.setdefault(key, []).append(index)
+
+        if missing:
+            missing_frequencies = array(
+                [
+                    quantized(frequencies[indices[0]], self._frequency_resolution)
+                    for indices in missing.values()
+                ]
+            )
+            missing_conductivities = evaluate_missing(missing_frequencies)
+
+            for (key, indices), conductivity in zip(
+                missing.items(), missing_conductivities
+            ):
+                conductivity = complex(conductivity)
+                self._cache.store(key, conductivity)
+                for index in indices:
+                    conductivities[index] = conductivity
+
+        return conductivities
+
+
+__all__ = ["CachedSuperconductorConductivity"]
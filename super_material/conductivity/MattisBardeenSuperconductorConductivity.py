@@ -1,13 +1,22 @@
 from math import sqrt, exp, pi, inf, sin
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+from numpy import asarray, empty, ndarray
 
 from .SuperconductorConductivityInterface import SuperconductorConductivityInterface
 
 from ..gap_energy.GapEnergyInterface import GapEnergyInterface
 from ..integrate import (
+    GaussJacobiIntegrator,
     IntegrandBoundary,
+    IntegrandFamily,
     IntegrandInterface,
     IntegrandInterval,
+    IntegrationResult,
     QuadpackIntegrator,
+    ScaledTolerance,
+    ToleranceInterface,
     TransformedIntegrand,
     ChebyshevLowerSingularityTransform,
     ChebyshevUpperSingularityTransform,
@@ -15,6 +24,12 @@ from ..integrate import (
 )
 
 from ..constants import h_bar, k_B
+from ..instrument.Recorder import active_recorder, instrumented_call
+
+# Relative distance of the photon energy from twice the gap energy within
+# which the singularity of the imaginary integrand outside of its interval is
+# too close to its end for the Gauss-Jacobi rule
+GAP_EDGE_WINDOW = 1e-2
 
 
 def fermi_dirac_function(E, T):
@@ -27,6 +42,18 @@ def fermi_dirac_function(E, T):
     return 1 / denumerator
 
 
+def fermi_dirac_function_batch(E: ndarray, T: float) -> ndarray:
+    from scipy.special import expit
+
+    return expit(-E / (k_B * T))
+
+
+def near_gap_edge(gap_energy: float, omega: float) -> bool:
+    """ Whether the photon energy is within the gap edge window of twice the
+    gap energy """
+    return abs(h_bar * omega / (2 * gap_energy) - 1) < GAP_EDGE_WINDOW
+
+
 def remove_chebyshev_singularity(integrand: IntegrandInterface):
     lower_singularity = integrand.interval().start().value()
     upper_singularity = integrand.interval().end().value()
@@ -62,6 +89,18 @@ class MattisBardeenRealFirstIntegrand(IntegrandInterface):
 
         return E ** 2 * a * b / d
 
+    def evaluate_batch(self, xs: ndarray) -> ndarray:
+        xs = asarray(xs, dtype=float)
+        E = self._gap_energy / np.sqrt(1 - (self._gap_energy ** 4) * (xs ** 2))
+
+        a = fermi_dirac_function_batch(
+            E, self._temperature
+        ) - fermi_dirac_function_batch(E + h_bar * self._omega, self._temperature)
+        b = E ** 2 + self._gap_energy ** 2 + h_bar * self._omega * E
+        d = np.sqrt((E + h_bar * self._omega) ** 2 - self._gap_energy ** 2)
+
+        return E ** 2 * a * b / d
+
 
 class MattisBardeenRealSecondIntegrand(IntegrandInterface):
     _gap_energy: float
@@ -95,6 +134,23 @@ class MattisBardeenRealSecondIntegrand(IntegrandInterface):
 
         return a * b / (c * d)
 
+    def evaluate_batch(self, xs: ndarray) -> ndarray:
+        xs = asarray(xs, dtype=float)
+        assert ((0 <= xs) & (xs <= pi)).all()
+
+        lower = self._gap_energy - h_bar * self._omega
+        upper = -self._gap_energy
+        E = lower + (upper - lower) * (np.sin(xs / 2) ** 2)
+
+        a = 1 - 2 * fermi_dirac_function_batch(
+            E + h_bar * self._omega, self._temperature
+        )
+        b = E ** 2 + self._gap_energy ** 2 + h_bar * self._omega * E
+        c = np.sqrt(-E + self._gap_energy)
+        d = np.sqrt((E + h_bar * self._omega) + self._gap_energy)
+
+        return a * b / (c * d)
+
 
 class MattisBardeenImaginaryIntegrand(IntegrandInterface):
     _gap_energy: float
@@ -118,6 +174,9 @@ class MattisBardeenImaginaryIntegrand(IntegrandInterface):
 
         return IntegrandInterval(start, end)
 
+    def endpoint_exponents(self) -> Tuple[float, float]:
+        return -0.5, -0.5
+
     def evaluate(self, E: float) -> float:
         a = 1 - 2 * fermi_dirac_function(E + h_bar * self._omega, self._temperature)
         b = E ** 2 + self._gap_energy ** 2 + h_bar * self._omega * E
@@ -126,59 +185,328 @@ class MattisBardeenImaginaryIntegrand(IntegrandInterface):
 
         return a * b / (c * d)
 
+    def evaluate_batch(self, E: ndarray) -> ndarray:
+        E = asarray(E, dtype=float)
+
+        a = 1 - 2 * fermi_dirac_function_batch(
+            E + h_bar * self._omega, self._temperature
+        )
+        b = E ** 2 + self._gap_energy ** 2 + h_bar * self._omega * E
+        c = np.sqrt(self._gap_energy ** 2 - E ** 2)
+        d = np.sqrt((E + h_bar * self._omega) ** 2 - self._gap_energy ** 2)
+
+        return a * b / (c * d)
+
 
 class MattisBardeenSuperconductorConductivity(SuperconductorConductivityInterface):
     """ Superconductor conductivity as calculated by Mattis and Bardeen
 
     Numerically evaluates the integral expression of Mattis and Bardeen
     :cite:`MattisBardeenSuperconductorConductivity`
+
+    Without a tolerance the integrals are resolved to an absolute and relative
+    tolerance of :math:`10^{-12}`. A tolerance is in the units of the
+    conductivity and is applied to the contribution of each integral to the
+    conductivity, so that for example a relative tolerance of
+    :math:`10^{-6}` or an absolute tolerance of :math:`10^{-3}` S/m stops
+    the integration as soon as either holds.
     """
 
     _gap_energy: GapEnergyInterface
     _conductivity_0: float
+    _tolerance: Optional[ToleranceInterface]
     _integrator: QuadpackIntegrator
-
-    def __init__(self, gap_energy: GapEnergyInterface, conductivity_0: float):
+    _singular_integrator: GaussJacobiIntegrator
+
+    def __init__(
+        self,
+        gap_energy: GapEnergyInterface,
+        conductivity_0: float,
+        tolerance: Optional[ToleranceInterface] = None,
+    ):
         self._gap_energy = gap_energy
         self._conductivity_0 = conductivity_0
+        self._tolerance = tolerance
         self._integrator = QuadpackIntegrator(
             absolute_tolerance=1e-12, relative_tolerance=1e-12, limit=10
         )
+        self._singular_integrator = GaussJacobiIntegrator(
+            absolute_tolerance=1e-12, relative_tolerance=1e-12
+        )
+
+    def cache_key(self) -> Hashable:
+        tolerance_key = None
+        if self._tolerance is not None:
+            tolerance_key = self._tolerance.cache_key()
+
+        return (
+            "MattisBardeenSuperconductorConductivity",
+            self._gap_energy.cache_key(),
+            self._conductivity_0,
+            tolerance_key,
+            self._integrator.cache_key(),
+            self._singular_integrator.cache_key(),
+        )
+
+    def gap_energy(self) -> Optional[GapEnergyInterface]:
+        return self._gap_energy
+
+    def tolerance(self) -> Optional[ToleranceInterface]:
+        return self._tolerance
+
+    def integral_tolerance(self, omega: float, factor: float) -> ToleranceInterface:
+        """ Tolerance on an integral that contributes the factor times
+        :math:`\\frac{\\sigma_{0}}{\\hbar \\omega}` times the integral to the
+        conductivity """
+        scale = factor * self._conductivity_0 / (h_bar * omega)
+        return ScaledTolerance(self._tolerance, scale)
+
+    def integrator(self, omega: float, factor: float) -> QuadpackIntegrator:
+        if self._tolerance is None:
+            return self._integrator
+
+        tolerance = self.integral_tolerance(omega, factor)
+        return QuadpackIntegrator(limit=10, tolerance=tolerance)
+
+    def singular_integrator(self, omega: float) -> GaussJacobiIntegrator:
+        if self._tolerance is None:
+            return self._singular_integrator
+
+        tolerance = self.integral_tolerance(omega, 1)
+        return GaussJacobiIntegrator(tolerance=tolerance)
 
     def evaluate_first_real_integral(
         self, gap_energy: float, temperature: float, omega: float
     ) -> float:
-        # return 0
+        return self.evaluate_first_real_integral_with_info(
+            gap_energy, temperature, omega
+        ).value()
+
+    def evaluate_first_real_integral_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> IntegrationResult:
         integrand = MattisBardeenRealFirstIntegrand(gap_energy, temperature, omega)
-        first_real_integral = self._integrator.integrate(integrand)
-        return first_real_integral
+        return self.integrator(omega, 2).integrate_with_info(integrand)
 
     def evaluate_second_real_integral(
         self, gap_energy: float, temperature: float, omega: float
     ) -> float:
+        return self.evaluate_second_real_integral_with_info(
+            gap_energy, temperature, omega
+        ).value()
+
+    def evaluate_second_real_integral_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> IntegrationResult:
         if h_bar * omega <= 2 * gap_energy:
-            return 0
+            return IntegrationResult.exact(0)
 
         integrand = MattisBardeenRealSecondIntegrand(gap_energy, temperature, omega)
-        second_real_integral = self._integrator.integrate(integrand)
-        return second_real_integral
+        return self.integrator(omega, 1).integrate_with_info(integrand)
 
     def evaluate_imaginary_integral(
         self, gap_energy: float, temperature: float, omega: float
     ) -> float:
+        return self.evaluate_imaginary_integral_with_info(
+            gap_energy, temperature, omega
+        ).value()
 
+    def evaluate_imaginary_integral_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> IntegrationResult:
+        """ Integrates the inverse square roots at the ends as the Gauss-Jacobi
+        weight, or with the Chebyshev transform near the gap edge or when the
+        Gauss-Jacobi rule does not converge """
         integrand = MattisBardeenImaginaryIntegrand(gap_energy, temperature, omega)
-        integrand = remove_chebyshev_singularity(integrand)
-        imaginary_integral = self._integrator.integrate(integrand)
-        return imaginary_integral
+
+        if near_gap_edge(gap_energy, omega):
+            return self.evaluate_transformed_imaginary_integral_with_info(
+                integrand, omega
+            )
+
+        result = self.singular_integrator(omega).integrate_orders(integrand)
+        return self.fall_back_imaginary_integral(integrand, omega, result)
+
+    def evaluate_imaginary_integrals_with_info(
+        self, gap_energy: float, temperature: float, omegas: ndarray
+    ) -> List[IntegrationResult]:
+        """ Integrates the imaginary integrals of the angular frequencies as
+        :meth:`evaluate_imaginary_integral_with_info`, with the Gauss-Jacobi
+        rules of all the frequencies away from the gap edge evaluated together """
+        results: List[Optional[IntegrationResult]] = [None] * len(omegas)
+        integrands = [
+            MattisBardeenImaginaryIntegrand(gap_energy, temperature, omega)
+            for omega in omegas
+        ]
+
+        family_indices = []
+        for index, (integrand, omega) in enumerate(zip(integrands, omegas)):
+            if near_gap_edge(gap_energy, omega):
+                results[index] = self.evaluate_transformed_imaginary_integral_with_info(
+                    integrand, omega
+                )
+            else:
+                family_indices.append(index)
+
+        if family_indices:
+            family_omegas = asarray(omegas)[family_indices]
+
+            def batch_integrand(members: ndarray) -> MattisBardeenImaginaryIntegrand:
+                omega = family_omegas[members][:, None]
+                return MattisBardeenImaginaryIntegrand(gap_energy, temperature, omega)
+
+            family = IntegrandFamily(
+                [integrands[index] for index in family_indices], batch_integrand
+            )
+            tolerances = [
+                self.singular_integrator(omega).tolerance() for omega in family_omegas
+            ]
+            family_results = self._singular_integrator.integrate_family_orders(
+                family, tolerances
+            )
+
+            for index, result in zip(family_indices, family_results):
+                results[index] = self.fall_back_imaginary_integral(
+                    integrands[index], omegas[index], result
+                )
+
+        return results
+
+    def evaluate_transformed_imaginary_integral_with_info(
+        self, integrand: MattisBardeenImaginaryIntegrand, omega: float
+    ) -> IntegrationResult:
+        """ Integrates the imaginary integrand with the Chebyshev transform of
+        its ends """
+        transformed_integrand = remove_chebyshev_singularity(integrand)
+        return self.integrator(omega, 1).integrate_with_info(transformed_integrand)
+
+    def fall_back_imaginary_integral(
+        self,
+        integrand: MattisBardeenImaginaryIntegrand,
+        omega: float,
+        result: IntegrationResult,
+    ) -> IntegrationResult:
+        """ The Gauss-Jacobi result if it converged, otherwise the integral with
+        the Chebyshev transform """
+        if result.converged():
+            return result
+
+        fallback = self.evaluate_transformed_imaginary_integral_with_info(
+            integrand, omega
+        )
+        return IntegrationResult(
+            fallback.value(),
+            fallback.error(),
+            result.evaluations() + fallback.evaluations(),
+            fallback.subdivisions(),
+            result.wall_time() + fallback.wall_time(),
+            fallback.converged(),
+        )
 
     def evaluate(self, temperature: float, frequency: float) -> complex:
+        gap_energy = instrumented_call(
+            "mattis_bardeen.gap_energy", self._gap_energy.evaluate, temperature
+        )
+        return self.evaluate_with_gap_energy(gap_energy, temperature, frequency)
+
+    def evaluate_sweep(self, temperature: float, frequencies: ndarray) -> ndarray:
+        """ Calculates the complex conductivity at each of the frequencies
+
+        The gap energy only depends on the temperature and is evaluated once
+        for the whole sweep, and the imaginary integrals of all the frequencies
+        are evaluated together. The real integrals are integrated by QUADPACK,
+        which integrates one integrand at a time.
+        """
+        gap_energy = instrumented_call(
+            "mattis_bardeen.gap_energy", self._gap_energy.evaluate, temperature
+        )
+        return self.evaluate_sweep_with_gap_energy(gap_energy, temperature, frequencies)
+
+    def evaluate_sweep_with_gap_energy(
+        self, gap_energy: float, temperature: float, frequencies: ndarray
+    ) -> ndarray:
+        """ Calculates the complex conductivity at each of the frequencies with
+        a known gap energy """
+        frequencies = asarray(frequencies, dtype=float)
+        omegas = 2 * pi * frequencies.ravel()
+        imaginary_results = self.evaluate_imaginary_integrals_with_info(
+            gap_energy, temperature, omegas
+        )
+
+        conductivities = empty(frequencies.size, dtype=complex)
+        for index, (omega, imaginary_result) in enumerate(
+            zip(omegas, imaginary_results)
+        ):
+            results = {
+                "first_real": self.evaluate_first_real_integral_with_info(
+                    gap_energy, temperature, omega
+                ),
+                "second_real": self.evaluate_second_real_integral_with_info(
+                    gap_energy, temperature, omega
+                ),
+                "imaginary": imaginary_result,
+            }
+            conductivities[index] = self.conductivity(omega, results)
+
+        return conductivities.reshape(frequencies.shape)
+
+    def evaluate_with_info(
+        self, temperature: float, frequency: float
+    ) -> Tuple[complex, Dict[str, IntegrationResult]]:
+        """ Calculates the complex conductivity and the results of its integrals
+
+        The results are keyed by "first_real", "second_real" and "imaginary".
+        """
+        gap_energy = instrumented_call(
+            "mattis_bardeen.gap_energy", self._gap_energy.evaluate, temperature
+        )
+        return self.evaluate_with_gap_energy_and_info(
+            gap_energy, temperature, frequency
+        )
+
+    def evaluate_with_gap_energy(
+        self, gap_energy: float, temperature: float, frequency: float
+    ) -> complex:
+        """ Calculates the complex conductivity with a known gap energy """
+        conductivity, _ = self.evaluate_with_gap_energy_and_info(
+            gap_energy, temperature, frequency
+        )
+        return conductivity
+
+    def evaluate_with_gap_energy_and_info(
+        self, gap_energy: float, temperature: float, frequency: float
+    ) -> Tuple[complex, Dict[str, IntegrationResult]]:
+        """ Calculates the complex conductivity with a known gap energy and the
+        results of its integrals """
         omega = 2 * pi * frequency
-        gap_energy = self._gap_energy.evaluate(temperature)
 
-        sigma_r1 = self.evaluate_first_real_integral(gap_energy, temperature, omega)
-        sigma_r2 = self.evaluate_second_real_integral(gap_energy, temperature, omega)
-        sigma_i = self.evaluate_imaginary_integral(gap_energy, temperature, omega)
+        results = {
+            "first_real": self.evaluate_first_real_integral_with_info(
+                gap_energy, temperature, omega
+            ),
+            "second_real": self.evaluate_second_real_integral_with_info(
+                gap_energy, temperature, omega
+            ),
+            "imaginary": self.evaluate_imaginary_integral_with_info(
+                gap_energy, temperature, omega
+            ),
+        }
+
+        return self.conductivity(omega, results), results
+
+    def conductivity(
+        self, omega: float, results: Dict[str, IntegrationResult]
+    ) -> complex:
+        """ Records the results of the integrals and combines them into the
+        conductivity """
+        recorder = active_recorder()
+        if recorder is not None:
+            for name, result in results.items():
+                recorder.record_integration(f"mattis_bardeen.{name}", result)
+
+        sigma_r1 = results["first_real"].value()
+        sigma_r2 = results["second_real"].value()
+        sigma_i = results["imaginary"].value()
 
         scale = self._conductivity_0 / (h_bar * omega)
         unscaled = 2 * sigma_r1 - sigma_r2 + sigma_i * 1j
@@ -186,4 +514,4 @@ class MattisBardeenSuperconductorConductivity(SuperconductorConductivityInterfac
         return scale * unscaled
 
 
-__all__ = ["MattisBardeenComplexConductivity"]
+__all__ = ["MattisBardeenSuperconductorConductivity"]
@@ -0,0 +1,204 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import ceil
+from multiprocessing.context import BaseContext
+from typing import List, Optional, Tuple
+
+from numpy import asarray, empty, ndarray
+
+from .SuperconductorConductivityInterface import SuperconductorConductivityInterface
+
+# Chunks per worker of a grid, for the idle workers to take the chunks of the
+# slow ones
+CHUNKS_PER_WORKER = 4
+
+# Conductivity of the worker process, sent once by the initializer of the pool
+_worker_conductivity: Optional[SuperconductorConductivityInterface] = None
+
+
+def initialize_worker(conductivity: SuperconductorConductivityInterface):
+    global _worker_conductivity
+    _worker_conductivity = conductivity
+
+
+def evaluate_conductivity_chunk(
+    conductivity: SuperconductorConductivityInterface,
+    gap_energy: Optional[float],
+    temperature: float,
+    frequencies: ndarray,
+) -> ndarray:
+    if gap_energy is None:
+        return conductivity.evaluate_sweep(temperature, frequencies)
+
+    return conductivity.evaluate_sweep_with_gap_energy(
+        gap_energy, temperature, frequencies
+    )
+
+
+def evaluate_chunk(
+    gap_energy: Optional[float], temperature: float, frequencies: ndarray
+) -> ndarray:
+    return evaluate_conductivity_chunk(
+        _worker_conductivity, gap_energy, temperature, frequencies
+    )
+
+
+class ParallelSweep:
+    """ Evaluates a conductivity on a grid of temperatures and frequencies in
+    worker processes
+
+    The grid is split into chunks of the frequencies of a temperature, each
+    evaluated with
+    :meth:`~super_material.SuperconductorConductivityInterface.evaluate_sweep_with_gap_energy`.
+    By default the rows are split into enough chunks for four chunks per
+    worker, since the cost of the conductivities is much higher near
+    :math:`hf = 2\\Delta`, along the frequencies. The chunks are queued on a
+    process pool and taken by the workers as they become idle, which balances
+    the cost. A single worker evaluates whole rows in this process.
+
+    The gap energy of each temperature is evaluated once, in this process, and
+    sent with the chunks of its row. The conductivity is pickled once per
+    worker. The pool is started on the first evaluation and kept for the next
+    ones, close the sweep or use it as a context manager to stop its workers.
+    """
+
+    _conductivity: SuperconductorConductivityInterface
+    _max_workers: int
+    _chunk_size: Optional[int]
+    _mp_context: Optional[BaseContext]
+    _executor: Optional[ProcessPoolExecutor]
+
+    def __init__(
+        self,
+        conductivity: SuperconductorConductivityInterface,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        assert max_workers > 0
+        assert chunk_size is None or chunk_size > 0
+
+        self._conductivity = conductivity
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._mp_context = mp_context
+        self._executor = None
+
+    def __enter__(self) -> "ParallelSweep":
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def conductivity(self) -> SuperconductorConductivityInterface:
+        return self._conductivity
+
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def chunk_size(self, temperature_count: int, frequency_count: int) -> int:
+        """ Number of frequencies in a chunk of the grid """
+        if self._chunk_size is not None:
+            return self._chunk_size
+
+        if self._max_workers == 1:
+            return max(frequency_count, 1)
+
+        chunk_count = CHUNKS_PER_WORKER * self._max_workers
+        row_chunk_count = ceil(chunk_count / max(temperature_count, 1))
+        return max(ceil(frequency_count / row_chunk_count), 1)
+
+    def chunks(
+        self, temperature_count: int, frequency_count: int
+    ) -> List[Tuple[int, slice]]:
+        """ Chunks of the grid as the index of their temperature and the slice of
+        their frequencies """
+        chunk_size = self.chunk_size(temperature_count, frequency_count)
+        return [
+            (row, slice(start, min(start + chunk_size, frequency_count)))
+            for row in range(temperature_count)
+            for start in range(0, frequency_count, chunk_size)
+        ]
+
+    def gap_energies(self, temperatures: ndarray) -> List[Optional[float]]:
+        """ Gap energies of the conductivity at the temperatures, or None for
+        conductivities without a gap energy """
+        gap_energy = self._conductivity.gap_energy()
+        if gap_energy is None:
+            return [None for _ in temperatures]
+
+        # Evaluated one at a time as the sweeps of the conductivities do, so
+        # that the grid equals the sweeps
+        return [gap_energy.evaluate(temperature) for temperature in temperatures]
+
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self._max_workers,
+                mp_context=self._mp_context,
+                initializer=initialize_worker,
+                initargs=(self._conductivity,),
+            )
+
+        return self._executor
+
+    def evaluate(self, temperatures: ndarray, frequencies: ndarray) -> ndarray:
+        """ Calculates the complex conductivity at each of the temperatures and
+        frequencies, as an array of the temperatures by the frequencies """
+        temperatures = asarray(temperatures, dtype=float)
+        frequencies = asarray(frequencies, dtype=float)
+        assert temperatures.ndim == 1
+        assert frequencies.ndim == 1
+
+        conductivities = empty((len(temperatures), len(frequencies)), dtype=complex)
+        chunks = self.chunks(len(temperatures), len(frequencies))
+        if not chunks:
+            return conductivities
+
+        gap_energies = self.gap_energies(temperatures)
+
+        # A single worker evaluates the grid in this process
+        if self._max_workers == 1:
+            for row, columns in chunks:
+                conductivities[row, columns] = evaluate_conductivity_chunk(
+                    self._conductivity,
+                    gap_energies[row],
+                    temperatures[row],
+                    frequencies[columns],
+                )
+
+            return conductivities
+
+        executor = self.executor()
+        futures = {}
+        for row, columns in chunks:
+            future = executor.submit(
+                evaluate_chunk,
+                gap_energies[row],
+                temperatures[row],
+                frequencies[columns],
+            )
+            futures[future] = row, columns
+
+        try:
+            for future in as_completed(futures):
+                row, columns = futures[future]
+                conductivities[row, columns] = future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        return conductivities
+
+    def close(self):
+        """ Stop the workers """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+__all__ = ["ParallelSweep"]
@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Hashable, Optional
+
+from numpy import asarray, ndarray, vectorize
+
+from ..gap_energy.GapEnergyInterface import GapEnergyInterface
 
 
 class SuperconductorConductivityInterface(ABC):
@@ -8,5 +13,37 @@ class SuperconductorConductivityInterface(ABC):
     def evaluate(self, temperature: float, frequency: float) -> complex:
         """ Calculates the superconductor complex conductivity """
 
+    def evaluate_sweep(self, temperature: float, frequencies: ndarray) -> ndarray:
+        """ Calculates the complex conductivity at each of the frequencies """
+        frequencies = asarray(frequencies, dtype=float)
+
+        def evaluate(frequency: float) -> complex:
+            return self.evaluate(temperature, frequency)
+
+        return vectorize(evaluate, otypes=[complex])(frequencies)
+
+    def gap_energy(self) -> Optional[GapEnergyInterface]:
+        """ Gap energy of the conductivity, if it has one """
+        return None
+
+    def evaluate_sweep_with_gap_energy(
+        self, gap_energy: float, temperature: float, frequencies: ndarray
+    ) -> ndarray:
+        """ Calculates the complex conductivity at each of the frequencies with
+        the gap energy of the conductivity at the temperature
+
+        Conductivities that evaluate their gap energy use the given one
+        instead. By default the gap energy is evaluated again by the sweep.
+        """
+        return self.evaluate_sweep(temperature, frequencies)
+
+    def cache_key(self) -> Hashable:
+        """ Key of the parameters of the conductivity
+
+        Conductivities with equal keys evaluate to the same conductivities. The
+        default key is the conductivity itself, which is only equal to itself.
+        """
+        return self
+
 
 __all__ = ["SuperconductorConductivityInterface"]
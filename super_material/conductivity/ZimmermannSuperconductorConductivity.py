@@ -1,13 +1,21 @@
-from math import sqrt, pi, tanh, cos
+from math import sqrt, pi, cos
+from typing import Dict, Hashable, List, Optional, Tuple, Type
+
+import numpy as np
+from numpy import arange, asarray, empty, flatnonzero, ndarray
 
 from .SuperconductorConductivityInterface import SuperconductorConductivityInterface
 
 from ..gap_energy.GapEnergyInterface import GapEnergyInterface
 from ..integrate import (
     IntegrandBoundary,
+    IntegrandFamily,
     IntegrandInterface,
     IntegrandInterval,
-    ScipyQuadratureIntegrator,
+    IntegrationResult,
+    GaussKronrodIntegrator,
+    ScaledTolerance,
+    ToleranceInterface,
     TransformedIntegrand,
     IntegrandIntervalTransformInterface,
     ChebyshevLowerSingularityTransform,
@@ -15,6 +23,7 @@ from ..integrate import (
 )
 
 from ..constants import h_bar, k_B
+from ..instrument.Recorder import active_recorder, instrumented_call
 
 
 def remove_lower_singularity(integrand: IntegrandInterface):
@@ -49,25 +58,25 @@ class ZimmermannSuperconductorEquations:
         self._temperature = temperature
         self._omega = omega
 
-    def p1(self, E: float) -> float:
-        return sqrt((E + self._omega * h_bar) ** 2 - self._gap_energy ** 2)
+    def p1(self, E: ndarray) -> ndarray:
+        return np.sqrt((E + self._omega * h_bar) ** 2 - self._gap_energy ** 2)
 
-    def p2(self, E: float) -> float:
-        return sqrt(E ** 2 - self._gap_energy ** 2)
+    def p2(self, E: ndarray) -> ndarray:
+        return np.sqrt(E ** 2 - self._gap_energy ** 2)
 
-    def p3(self, E: float) -> float:
-        return sqrt((E - self._omega * h_bar) ** 2 - self._gap_energy ** 2)
+    def p3(self, E: ndarray) -> ndarray:
+        return np.sqrt((E - self._omega * h_bar) ** 2 - self._gap_energy ** 2)
 
-    def p4(self, E: float) -> complex:
-        return 1j * sqrt(self._gap_energy ** 2 - (E - self._omega * h_bar) ** 2)
+    def p4(self, E: ndarray) -> ndarray:
+        return 1j * np.sqrt(self._gap_energy ** 2 - (E - self._omega * h_bar) ** 2)
 
-    def th1(self, E: float) -> float:
-        return tanh(E / (2 * k_B * self._temperature))
+    def th1(self, E: ndarray) -> ndarray:
+        return np.tanh(E / (2 * k_B * self._temperature))
 
-    def th2(self, E: float) -> float:
-        return tanh((E + self._omega * h_bar) / (2 * k_B * self._temperature))
+    def th2(self, E: ndarray) -> ndarray:
+        return np.tanh((E + self._omega * h_bar) / (2 * k_B * self._temperature))
 
-    def I1(self, E: float) -> complex:
+    def I1(self, E: ndarray) -> ndarray:
         p2 = self.p2(E)
         p4 = self.p4(E)
         th1 = self.th1(E)
@@ -81,7 +90,7 @@ class ZimmermannSuperconductorEquations:
 
         return out
 
-    def I2(self, E: float) -> complex:
+    def I2(self, E: ndarray) -> ndarray:
         p1 = self.p1(E)
         p2 = self.p2(E)
         th1 = self.th1(E)
@@ -101,7 +110,7 @@ class ZimmermannSuperconductorEquations:
 
         return part1 + part2
 
-    def I3(self, E: float) -> complex:
+    def I3(self, E: ndarray) -> ndarray:
         p2 = self.p2(E)
         p3 = self.p3(E)
         th1 = self.th1(E)
@@ -148,6 +157,12 @@ class ZimmermannFirstIntegralSuperconductorPart(IntegrandInterface):
         )
         return equations.I1(E)
 
+    def evaluate_batch(self, E: ndarray) -> ndarray:
+        equations = ZimmermannSuperconductorEquations(
+            self._gap_energy, self._scattering_time, self._temperature, self._omega,
+        )
+        return equations.I1(asarray(E, dtype=float))
+
 
 class ZimmermannFirstIntegralNormalPart(IntegrandInterface):
     _gap_energy: float
@@ -181,6 +196,12 @@ class ZimmermannFirstIntegralNormalPart(IntegrandInterface):
         )
         return equations.I1(E)
 
+    def evaluate_batch(self, E: ndarray) -> ndarray:
+        equations = ZimmermannSuperconductorEquations(
+            self._gap_energy, self._scattering_time, self._temperature, self._omega,
+        )
+        return equations.I1(asarray(E, dtype=float))
+
 
 class ZimmermannSecondIntegralTransformed(IntegrandInterface):
     _gap_energy: float
@@ -217,6 +238,16 @@ class ZimmermannSecondIntegralTransformed(IntegrandInterface):
         I2 = equations.I2(E)
         return I2 * scale
 
+    def evaluate_batch(self, xs: ndarray) -> ndarray:
+        xs = asarray(xs, dtype=float)
+        E = self._gap_energy / np.cos(self._gap_energy * xs)
+        scale = E * np.sqrt(E ** 2 - self._gap_energy ** 2)
+        equations = ZimmermannSuperconductorEquations(
+            self._gap_energy, self._scattering_time, self._temperature, self._omega,
+        )
+        I2 = equations.I2(E)
+        return I2 * scale
+
 
 class ZimmermannThirdIntegral(IntegrandInterface):
     _gap_energy: float
@@ -250,102 +281,339 @@ class ZimmermannThirdIntegral(IntegrandInterface):
         )
         return equations.I3(E)
 
+    def evaluate_batch(self, E: ndarray) -> ndarray:
+        equations = ZimmermannSuperconductorEquations(
+            self._gap_energy, self._scattering_time, self._temperature, self._omega,
+        )
+        return equations.I3(asarray(E, dtype=float))
+
 
 class ZimmermannSuperconductorConductivity(SuperconductorConductivityInterface):
     """ Superconductor conductivity as calculated by Zimmermann
 
     Numerically evaluates the integral expression of Zimmermann
     :cite:`ZimmermannSuperconductorConductivity`
+
+    Without a tolerance the integrals are resolved to an absolute and relative
+    tolerance of :math:`10^{-6}`. A tolerance is in the units of the
+    conductivity and is applied to the contribution of each integral to the
+    conductivity.
     """
 
     _gap_energy: GapEnergyInterface
     _conductivity_0: float
     _scattering_time: float
-    _integrator: ScipyQuadratureIntegrator
+    _tolerance: Optional[ToleranceInterface]
+    _integrator: GaussKronrodIntegrator
 
     def __init__(
         self,
         gap_energy: GapEnergyInterface,
         conductivity_0: float,
         scattering_time: float,
+        tolerance: Optional[ToleranceInterface] = None,
     ):
         self._gap_energy = gap_energy
         self._conductivity_0 = conductivity_0
         self._scattering_time = scattering_time
-        self._integrator = ScipyQuadratureIntegrator(
-            absolute_tolerance=1e-6,
-            relative_tolerance=1e-6,
-            maximum_order=200,
-            minimum_order=1,
+        self._tolerance = tolerance
+        self._integrator = GaussKronrodIntegrator(
+            absolute_tolerance=1e-6, relative_tolerance=1e-6, limit=200
         )
 
+    def cache_key(self) -> Hashable:
+        tolerance_key = None
+        if self._tolerance is not None:
+            tolerance_key = self._tolerance.cache_key()
+
+        return (
+            "ZimmermannSuperconductorConductivity",
+            self._gap_energy.cache_key(),
+            self._conductivity_0,
+            self._scattering_time,
+            tolerance_key,
+            self._integrator.cache_key(),
+        )
+
+    def gap_energy(self) -> Optional[GapEnergyInterface]:
+        return self._gap_energy
+
+    def tolerance(self) -> Optional[ToleranceInterface]:
+        return self._tolerance
+
+    def integrator(self, omega: float) -> GaussKronrodIntegrator:
+        """ Integrator of the integrals, which contribute
+        :math:`\\frac{\\sigma_{0}}{2 \\omega}` times the integral to the
+        conductivity """
+        if self._tolerance is None:
+            return self._integrator
+
+        scale = self._conductivity_0 / (2 * omega)
+        tolerance = ScaledTolerance(self._tolerance, scale)
+        return GaussKronrodIntegrator(limit=200, tolerance=tolerance)
+
     def evaluate_first_integral_superconductor_part(
         self, gap_energy: float, temperature: float, omega: float
     ):
+        return self.evaluate_first_integral_superconductor_part_with_info(
+            gap_energy, temperature, omega
+        ).value()
+
+    def evaluate_first_integral_superconductor_part_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> IntegrationResult:
         integrand = ZimmermannFirstIntegralSuperconductorPart(
             gap_energy, self._scattering_time, temperature, omega
         )
         integrand = remove_lower_singularity(integrand)
         integrand = remove_upper_singularity(integrand)
-        first_integral = self._integrator.integrate(integrand)
-        return first_integral
+        return self.integrator(omega).integrate_with_info(integrand)
 
     def evaluate_first_integral_normal_part(
         self, gap_energy: float, temperature: float, omega: float
     ):
+        return self.evaluate_first_integral_normal_part_with_info(
+            gap_energy, temperature, omega
+        ).value()
+
+    def evaluate_first_integral_normal_part_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> IntegrationResult:
         integrand = ZimmermannFirstIntegralNormalPart(
             gap_energy, self._scattering_time, temperature, omega
         )
         integrand = remove_lower_singularity(integrand)
         integrand = remove_upper_singularity(integrand)
-        first_integral = self._integrator.integrate(integrand)
-        return first_integral
+        return self.integrator(omega).integrate_with_info(integrand)
 
     def evaluate_second_integral(
         self, gap_energy: float, temperature: float, omega: float
     ):
+        return self.evaluate_second_integral_with_info(
+            gap_energy, temperature, omega
+        ).value()
+
+    def evaluate_second_integral_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> IntegrationResult:
         integrand = ZimmermannSecondIntegralTransformed(
             gap_energy, self._scattering_time, temperature, omega
         )
-        second_integral = self._integrator.integrate(integrand)
-        return second_integral
+        return self.integrator(omega).integrate_with_info(integrand)
 
     def evaluate_third_integral(
         self, gap_energy: float, temperature: float, omega: float
     ):
+        return self.evaluate_third_integral_with_info(
+            gap_energy, temperature, omega
+        ).value()
+
+    def evaluate_third_integral_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> IntegrationResult:
         integrand = ZimmermannThirdIntegral(
             gap_energy, self._scattering_time, temperature, omega
         )
         integrand = remove_lower_singularity(integrand)
         integrand = remove_upper_singularity(integrand)
-        third_integral = self._integrator.integrate(integrand)
-        return third_integral
+        return self.integrator(omega).integrate_with_info(integrand)
 
     def evaluate_j(self, gap_energy: float, temperature: float, omega: float):
+        J, _ = self.evaluate_j_with_info(gap_energy, temperature, omega)
+        return J
+
+    def evaluate_j_with_info(
+        self, gap_energy: float, temperature: float, omega: float
+    ) -> Tuple[complex, Dict[str, IntegrationResult]]:
+        """ Evaluate J and the results of the integrals it is the sum of """
         if h_bar * omega <= 2 * gap_energy:
-            first_integral = self.evaluate_first_integral_superconductor_part(
+            first_integral = self.evaluate_first_integral_superconductor_part_with_info(
                 gap_energy, temperature, omega
             )
-            return first_integral
+            return first_integral.value(), {"first": first_integral}
 
-        third_integral = self.evaluate_third_integral(gap_energy, temperature, omega)
-        first_integral = self.evaluate_first_integral_normal_part(
+        third_integral = self.evaluate_third_integral_with_info(
+            gap_energy, temperature, omega
+        )
+        first_integral = self.evaluate_first_integral_normal_part_with_info(
             gap_energy, temperature, omega
         )
 
-        J = third_integral + first_integral
+        J = third_integral.value() + first_integral.value()
 
-        return J
+        return J, {"first": first_integral, "third": third_integral}
 
     def evaluate(self, temperature: float, frequency: float) -> complex:
+        gap_energy = instrumented_call(
+            "zimmermann.gap_energy", self._gap_energy.evaluate, temperature
+        )
+        return self.evaluate_with_gap_energy(gap_energy, temperature, frequency)
+
+    def evaluate_sweep(self, temperature: float, frequencies: ndarray) -> ndarray:
+        """ Calculates the complex conductivity at each of the frequencies
+
+        The gap energy only depends on the temperature and is evaluated once
+        for the whole sweep, and each of the integrals is evaluated together
+        for all the frequencies it applies to.
+        """
+        gap_energy = instrumented_call(
+            "zimmermann.gap_energy", self._gap_energy.evaluate, temperature
+        )
+        return self.evaluate_sweep_with_gap_energy(gap_energy, temperature, frequencies)
+
+    def evaluate_sweep_with_gap_energy(
+        self, gap_energy: float, temperature: float, frequencies: ndarray
+    ) -> ndarray:
+        """ Calculates the complex conductivity at each of the frequencies with
+        a known gap energy """
+        frequencies = asarray(frequencies, dtype=float)
+        omegas = 2 * pi * frequencies.ravel()
+        above_gap = h_bar * omegas > 2 * gap_energy
+        below = flatnonzero(~above_gap)
+        above = flatnonzero(above_gap)
+
+        results: List[Dict[str, IntegrationResult]] = [{} for _ in omegas]
+        for name, integrand_type, indices, singularities in [
+            ("first", ZimmermannFirstIntegralSuperconductorPart, below, True),
+            ("third", ZimmermannThirdIntegral, above, True),
+            ("first", ZimmermannFirstIntegralNormalPart, above, True),
+            ("second", ZimmermannSecondIntegralTransformed, arange(len(omegas)), False),
+        ]:
+            integral_results = self.evaluate_integrals_with_info(
+                integrand_type, gap_energy, temperature, omegas[indices], singularities
+            )
+            for index, result in zip(indices, integral_results):
+                results[index][name] = result
+
+        conductivities = empty(len(omegas), dtype=complex)
+        for index, omega in enumerate(omegas):
+            conductivities[index] = self.conductivity(omega, results[index])
+
+        return conductivities.reshape(frequencies.shape)
+
+    def evaluate_integrals_with_info(
+        self,
+        integrand_type: Type[IntegrandInterface],
+        gap_energy: float,
+        temperature: float,
+        omegas: ndarray,
+        singularities: bool = True,
+    ) -> List[IntegrationResult]:
+        """ Evaluate an integral at each of the angular frequencies, with the
+        panels of all the frequencies evaluated together
+
+        With the singularities the integrands are transformed to remove the
+        singularities at the ends of their intervals, as the integrals of a
+        single frequency are.
+        """
+        if len(omegas) == 0:
+            return []
+
+        def integrand(omega):
+            integrand = integrand_type(
+                gap_energy, self._scattering_time, temperature, omega
+            )
+            if singularities:
+                integrand = remove_lower_singularity(integrand)
+                integrand = remove_upper_singularity(integrand)
+
+            return integrand
+
+        members = [integrand(omega) for omega in omegas]
+
+        # The singularities of the transforms of each of the frequencies, the
+        # upper one in the variable of the lower transform
+        lower_singularities = empty(len(omegas))
+        upper_singularities = empty(len(omegas))
+        for index, omega in enumerate(omegas):
+            interval = integrand_type(
+                gap_energy, self._scattering_time, temperature, omega
+            ).interval()
+            lower_singularities[index] = interval.start().value()
+            upper_singularities[index] = sqrt(
+                interval.end().value() - interval.start().value()
+            )
+
+        def batch_integrand(indices: ndarray) -> IntegrandInterface:
+            integrand = integrand_type(
+                gap_energy, self._scattering_time, temperature, omegas[indices, None]
+            )
+            if singularities:
+                lower_transform = ChebyshevLowerSingularityTransform(
+                    lower_singularities[indices, None]
+                )
+                upper_transform = ChebyshevUpperSingularityTransform(
+                    upper_singularities[indices, None]
+                )
+                integrand = TransformedIntegrand(integrand, lower_transform)
+                integrand = TransformedIntegrand(integrand, upper_transform)
+
+            return integrand
+
+        family = IntegrandFamily(members, batch_integrand)
+        tolerances = [self.integrator(omega).tolerance() for omega in omegas]
+        return self._integrator.integrate_family_with_info(family, tolerances)
+
+    def evaluate_with_info(
+        self, temperature: float, frequency: float
+    ) -> Tuple[complex, Dict[str, IntegrationResult]]:
+        """ Calculates the complex conductivity and the results of its integrals
+
+        The results are keyed by "first", "second" and, above the gap
+        frequency, "third".
+        """
+        gap_energy = instrumented_call(
+            "zimmermann.gap_energy", self._gap_energy.evaluate, temperature
+        )
+        return self.evaluate_with_gap_energy_and_info(
+            gap_energy, temperature, frequency
+        )
+
+    def evaluate_with_gap_energy(
+        self, gap_energy: float, temperature: float, frequency: float
+    ) -> complex:
+        """ Calculates the complex conductivity with a known gap energy """
+        conductivity, _ = self.evaluate_with_gap_energy_and_info(
+            gap_energy, temperature, frequency
+        )
+        return conductivity
+
+    def evaluate_with_gap_energy_and_info(
+        self, gap_energy: float, temperature: float, frequency: float
+    ) -> Tuple[complex, Dict[str, IntegrationResult]]:
+        """ Calculates the complex conductivity with a known gap energy and the
+        results of its integrals """
         omega = 2 * pi * frequency
-        gap_energy = self._gap_energy.evaluate(temperature)
 
-        scale = self._conductivity_0 * 1j / (2 * omega)
+        _, results = self.evaluate_j_with_info(gap_energy, temperature, omega)
+        results["second"] = self.evaluate_second_integral_with_info(
+            gap_energy, temperature, omega
+        )
 
-        J = self.evaluate_j(gap_energy, temperature, omega)
-        second_integral = self.evaluate_second_integral(gap_energy, temperature, omega)
+        return self.conductivity(omega, results), results
+
+    def conductivity(
+        self, omega: float, results: Dict[str, IntegrationResult]
+    ) -> complex:
+        """ Records the results of the integrals and combines them into the
+        conductivity """
+        recorder = active_recorder()
+        if recorder is not None:
+            for name, result in results.items():
+                recorder.record_integration(f"zimmermann.{name}", result)
+
+            j_results = [
+                results[name] for name in ("first", "third") if name in results
+            ]
+            recorder.record(
+                "zimmermann.j",
+                sum(result.wall_time() for result in j_results),
+                sum(result.evaluations() for result in j_results),
+            )
 
-        out = scale * (J + second_integral)
+        J = results["first"].value()
+        if "third" in results:
+            J = results["third"].value() + J
 
-        return out
+        scale = self._conductivity_0 * 1j / (2 * omega)
+        return scale * (J + results["second"].value())
@@ -1,5 +1,7 @@
+from .CachedSuperconductorConductivity import CachedSuperconductorConductivity
 from .MattisBardeenSuperconductorConductivity import (
     MattisBardeenSuperconductorConductivity,
 )
+from .ParallelSweep import ParallelSweep
 from .SuperconductorConductivityInterface import SuperconductorConductivityInterface
 from .ZimmermannSuperconductorConductivity import ZimmermannSuperconductorConductivity
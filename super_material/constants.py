@@ -1,13 +1,21 @@
-""" Scientific constants """
+""" Scientific constants
 
-import scipy.constants as const
+The values are written out so that importing the constants does not import
+SciPy. They are the CODATA 2018 values of ``scipy.constants`` 1.4 to 1.14, so
+that results do not change with the installed SciPy, except for the reduced
+Planck constant, which is the CODATA 2014 value SciPy keeps under its former
+name "Planck constant over 2 pi in eV s". ``tests/test_constants.py`` checks
+them against SciPy to within the revisions of later CODATA editions.
+"""
 
-# Scientific constants
-c0 = const.speed_of_light
-mu_0 = const.mu_0
-h_bar = const.physical_constants["Planck constant over 2 pi in eV s"][0]
-k_B = const.physical_constants["Boltzmann constant in eV/K"][0]
-eps_0 = const.epsilon_0
+import math
+
+# Scientific constants, CODATA 2018
+c0 = 299792458.0
+mu_0 = 1.25663706212e-06
+h_bar = 6.582119514e-16  # Planck constant over 2 pi in eV s, CODATA 2014
+k_B = 8.617333262e-05  # Boltzmann constant in eV/K
+eps_0 = 8.8541878128e-12
 
 # Math constants
-pi = const.pi
+pi = math.pi
@@ -1,8 +1,8 @@
-from math import tanh, sinh, sqrt
+from math import tanh, sinh
 from functools import lru_cache
+from typing import Hashable, Iterable, Iterator, Optional, Tuple
 
-import scipy.integrate as integrate
-import scipy.optimize as optimize
+from numpy import array, asarray, ndarray, zeros_like
 
 from ..constants import k_B
 from ..integrate.IntegrandBoundary import IntegrandBoundary
@@ -10,7 +10,9 @@ from ..integrate.IntegrandInterface import IntegrandInterface
 from ..integrate.IntegrandInterval import IntegrandInterval
 from ..integrate.QuadpackIntegrator import QuadpackIntegrator
 
+from .BCSGapEquation import BCSGapEquation
 from .GapEnergyInterface import GapEnergyInterface
+from .UniversalBCSGapTable import UniversalBCSGapTable
 
 
 class BCSEtaIntegrand(IntegrandInterface):
@@ -32,6 +34,14 @@ class BCSEtaIntegrand(IntegrandInterface):
         return interval
 
 
+@lru_cache(maxsize=256)
+def bcs_eta(kappa: float) -> float:
+    """ Eta of a kappa, shared by the gap energies with the kappa """
+    integrand = BCSEtaIntegrand(kappa)
+    integrator = QuadpackIntegrator()
+    return integrator.integrate(integrand)
+
+
 class BCSGapEnergy(GapEnergyInterface):
     """ Gap energy as calcuated from BCS theory
 
@@ -58,20 +68,49 @@ class BCSGapEnergy(GapEnergyInterface):
     The original BCS assumes the weak coupling limit which corresponds to
     :math:`\\kappa \\gg 1`. We do not make the assumption when calculating the
     gap energy.
+
+    The gap equation is solved in gap energy with Newton's method, safeguarded
+    by the bracket :math:`(0, \\Delta_{0}]`, and started from the weak coupling
+    interpolation formula
+    :math:`\\Delta_{0} \\tanh{\\left(1.74 \\sqrt{T_{c} / T - 1}\\right)}`.
+
+    With the universal table enabled the gap energy is instead interpolated
+    from the :class:`UniversalBCSGapTable` of :math:`\\kappa`, which is solved
+    once and shared by every gap energy with the same :math:`\\kappa`.
     """
 
     _gap_energy_0: float  # In Electron Volt
     _kappa: float
-
-    # No dynamic variables
-    __slots__ = ()
-
-    def __init__(self, gap_energy_0: float, kappa: float):
+    _universal_table: bool
+
+    # Derived from the parameters on first use and kept by the gap energy, so
+    # that they are freed with it
+    _eta: Optional[float]
+    _critical_temperature: Optional[float]
+    _equation: Optional[BCSGapEquation]
+
+    __slots__ = (
+        "_gap_energy_0",
+        "_kappa",
+        "_universal_table",
+        "_eta",
+        "_critical_temperature",
+        "_equation",
+    )
+
+    def __init__(
+        self, gap_energy_0: float, kappa: float, universal_table: bool = False
+    ):
         assert gap_energy_0 > 0
         assert kappa > 0
 
         self._gap_energy_0 = gap_energy_0
         self._kappa = kappa
+        self._universal_table = universal_table
+
+        self._eta = None
+        self._critical_temperature = None
+        self._equation = None
 
     def gap_energy_0(self):
         return self._gap_energy_0
@@ -79,43 +118,172 @@ class BCSGapEnergy(GapEnergyInterface):
     def kappa(self):
         return self._kappa
 
-    @lru_cache
+    def cache_key(self) -> Hashable:
+        return (
+            "BCSGapEnergy",
+            self._gap_energy_0,
+            self._kappa,
+            self._universal_table,
+        )
+
     def eta(self):
         """ Calculate and return eta """
+        if self._eta is None:
+            self._eta = bcs_eta(self.kappa())
 
-        integrand = BCSEtaIntegrand(self.kappa())
-        integrator = QuadpackIntegrator()
-        eta = integrator.integrate(integrand)
-        return eta
+        return self._eta
 
     def evaluate(self, temperature: float) -> float:
         assert temperature >= 0
+        return float(self.evaluate_many(temperature))
+
+    def evaluate_many(self, temperatures: ndarray) -> ndarray:
+        if not self._universal_table:
+            return self.solve_many(temperatures)
+
+        temperatures = asarray(temperatures, dtype=float)
+        assert (temperatures >= 0).all()
+
+        table = UniversalBCSGapTable.for_gap_energy(self)
+        reduced_temperatures = temperatures / self.critical_temperature()
+        return table.evaluate(reduced_temperatures) * self.gap_energy_0()
+
+    def solve_many(self, temperatures: ndarray) -> ndarray:
+        """ Solve the gap equation at each of the temperatures """
+        temperatures = asarray(temperatures, dtype=float)
+        assert (temperatures >= 0).all()
         tol = 1e-12
 
-        if temperature < tol:
-            return self.gap_energy_0()
+        T_c = self.critical_temperature()
+        gap_energies = zeros_like(temperatures)
+        gap_energies[temperatures < tol] = self.gap_energy_0()
+
+        solve = (temperatures >= tol) & (temperatures <= T_c - tol)
+        gap_energies[solve] = self.equation().solve(temperatures[solve])
+
+        return gap_energies
 
+    def evaluate_with_derivative(self, temperature: float) -> Tuple[float, float]:
+        """ Evaluate the gap energy and its temperature derivative
+
+        The derivative follows from implicitly differentiating the gap equation,
+        :math:`\\frac{d\\Delta}{dT} = -\\frac{\\partial I / \\partial T}
+        {\\partial I / \\partial \\Delta}` with :math:`I` the right hand side of
+        the gap equation, and reuses the integrals of the last Newton
+        iteration. With the universal table enabled it is the derivative of the
+        interpolant.
+        """
+        assert temperature >= 0
+        tol = 1e-12
         T_c = self.critical_temperature()
+
+        if self._universal_table:
+            table = UniversalBCSGapTable.for_gap_energy(self)
+            reduced_temperature = temperature / T_c
+            gap_energy = table.evaluate(reduced_temperature) * self.gap_energy_0()
+            derivative = table.derivative(reduced_temperature)
+            derivative = derivative * self.gap_energy_0() / T_c
+            return float(gap_energy), float(derivative)
+
+        if temperature < tol:
+            return self.gap_energy_0(), 0.0
+
         if temperature > T_c - tol:
-            return 0
+            return 0.0, 0.0
+
+        gap_energy, slope = self.equation().solve_with_slope(array([temperature]))
+        return float(gap_energy[0]), float(slope[0])
+
+    def gap_energy_0_derivative(self, temperature: float) -> float:
+        """ Derivative of the gap energy with respect to the gap energy at 0 K
+
+        At fixed :math:`\\kappa` the gap energy is :math:`\\Delta_{0}` times a
+        function of :math:`T / T_{c}`, and :math:`T_{c}` is proportional to
+        :math:`\\Delta_{0}`, so the derivative follows from the temperature
+        derivative as :math:`\\frac{\\Delta - T \\frac{d\\Delta}{dT}}{\\Delta_{0}}`.
+        """
+        gap_energy, derivative = self.evaluate_with_derivative(temperature)
+        return (gap_energy - temperature * derivative) / self.gap_energy_0()
+
+    def temperature_for_gap(self, gap_energies: ndarray) -> ndarray:
+        """ Find the temperatures at which the gap energy reaches each value
+
+        For a fixed gap energy the gap equation is solved directly for the
+        temperature, without solving for the gap energy at any temperature.
+        With the universal table enabled the table is bisected instead.
+        """
+        if self._universal_table:
+            return super().temperature_for_gap(gap_energies)
+
+        gap_energies = asarray(gap_energies, dtype=float)
+        assert (gap_energies >= 0).all()
+
+        temperatures = zeros_like(gap_energies)
+        temperatures[gap_energies == 0] = self.critical_temperature()
+
+        solve = (gap_energies > 0) & (gap_energies < self.gap_energy_0())
+        temperatures[solve] = self.equation().solve_temperature(gap_energies[solve])
 
-        to = self.gap_energy_0() * sinh(self.eta())
-        temperature_scale = 1 / (2 * k_B * temperature)
+        return temperatures
 
-        def gap_energy_integrand(z, dirac):
-            expr = sqrt(dirac * dirac + z * z)
-            return tanh(expr * temperature_scale) / expr
+    def sweep(self, temperatures: Iterable[float]) -> Iterator[float]:
+        """ Evaluate the gap energy along an ordered sequence of temperatures
 
-        def equation(dirac):
-            result = integrate.quad(gap_energy_integrand, 0, to, args=(dirac))
-            return self.eta() - result[0]
+        Each solve is warm started by extrapolating the previous gap energy
+        along its temperature derivative, which is available from the same
+        integrals as the solve. The gap equation and its quadrature rule are
+        set up once for the whole sweep. A step that leaves the gap energy
+        bracket falls back to bisection on the full bracket.
+        """
+        tol = 1e-12
+        T_c = self.critical_temperature()
+        equation = self.equation()
+
+        previous = None
+
+        for temperature in temperatures:
+            assert temperature >= 0
+
+            if temperature < tol:
+                previous = None
+                yield self.gap_energy_0()
+                continue
 
-        result = optimize.bisect(equation, tol, self.critical_temperature() - tol)
+            if temperature > T_c - tol:
+                previous = None
+                yield 0.0
+                continue
 
-        return abs(result)
+            if previous is None:
+                guess = equation.initial_guess(temperature)
+            else:
+                previous_temperature, previous_gap_energy, slope = previous
+                step = temperature - previous_temperature
+                guess = previous_gap_energy + slope * step
+
+            gap_energy, slope = equation.solve_with_slope(
+                array([temperature]), array([guess])
+            )
+            previous = (temperature, gap_energy[0], slope[0])
+
+            yield float(gap_energy[0])
+
+    def equation(self) -> BCSGapEquation:
+        """ The vectorised gap equation of this gap energy """
+        if self._equation is None:
+            self._equation = BCSGapEquation(
+                self.gap_energy_0(), self.kappa(), self.eta()
+            )
+
+        return self._equation
 
     def critical_temperature(self) -> float:
-        return self.gap_energy_0() * sinh(self.eta()) / (2 * self.kappa() * k_B)
+        if self._critical_temperature is None:
+            self._critical_temperature = (
+                self.gap_energy_0() * sinh(self.eta()) / (2 * self.kappa() * k_B)
+            )
+
+        return self._critical_temperature
 
 
 __all__ = ["BCSGapEnergy"]
@@ -0,0 +1,369 @@
+from functools import lru_cache
+from time import perf_counter
+from typing import Optional, Tuple
+
+from numpy import (
+    arccosh,
+    arctanh,
+    arcsinh,
+    asarray,
+    clip,
+    cosh,
+    errstate,
+    exp,
+    finfo,
+    flatnonzero,
+    full_like,
+    maximum,
+    minimum,
+    ndarray,
+    ones_like,
+    sinh,
+    sqrt,
+    tanh,
+    where,
+    zeros,
+    zeros_like,
+)
+from numpy.polynomial.legendre import leggauss, legval
+
+from ..constants import k_B
+from ..instrument.Recorder import active_recorder
+
+
+# tanh(x) rounds to one in double precision for x above the saturation point
+SATURATION = 19.0
+
+
+@lru_cache(maxsize=None)
+def unit_legendre_rule(order: int) -> Tuple[ndarray, ndarray]:
+    """ Gauss-Legendre nodes and weights on [0, 1] """
+    nodes, weights = leggauss(order)
+    return (nodes + 1) / 2, weights / 2
+
+
+@lru_cache(maxsize=None)
+def unit_legendre_tail(order: int) -> ndarray:
+    """ Maps samples at the unit Gauss-Legendre nodes to their two highest
+    Legendre coefficients """
+    nodes, weights = unit_legendre_rule(order)
+    tail = zeros((order, 2))
+
+    for column, degree in enumerate([order - 1, order - 2]):
+        unit = zeros(degree + 1)
+        unit[degree] = 1
+        tail[:, column] = (2 * degree + 1) * weights * legval(2 * nodes - 1, unit)
+
+    return tail
+
+
+class BCSGapEquation:
+    """ Vectorised residual of the BCS gap equation
+
+    Substituting :math:`z = \\Delta \\sinh{u}` in the gap equation removes the
+    :math:`\\frac{1}{\\sqrt{\\Delta^{2} + z^{2}}}` factor and leaves the smooth,
+    bounded integrand :math:`\\tanh{\\left(\\frac{\\Delta \\cosh{u}}{2 T k_{B}}\\right)}`
+    on :math:`[0, \\sinh^{-1}(\\hbar \\omega_{D} / \\Delta)]`.
+
+    Past the point where the argument of the hyperbolic tangent reaches 19 the
+    integrand is one to double precision. That tail is integrated in closed
+    form, :math:`\\sinh^{-1}(\\hbar \\omega_{D} / \\Delta) - \\sinh^{-1}(z_{c} / \\Delta)`,
+    which leaves only the thermally active region for a fixed Gauss-Legendre
+    rule. The nodes of the rule are shared between all the gap energies and
+    temperatures being solved for, so that every evaluation is one NumPy call.
+    """
+
+    _gap_energy_0: float
+    _kappa: float
+    _eta: float
+    _debye_energy: float
+    _order: int
+    _nodes: ndarray
+    _weights: ndarray
+
+    def __init__(self, gap_energy_0: float, kappa: float, eta: float, order: int = 64):
+        self._gap_energy_0 = gap_energy_0
+        self._kappa = kappa
+        self._eta = eta
+        self._debye_energy = float(gap_energy_0 * sinh(eta))
+
+        self._order = order
+        self._nodes, self._weights = unit_legendre_rule(order)
+
+    def critical_temperature(self) -> float:
+        return self._debye_energy / (2 * self._kappa * k_B)
+
+    def integral(self, gap_energy: ndarray, temperature: ndarray) -> ndarray:
+        """ Evaluate the right hand side of the gap equation element-wise """
+        integral, _, _ = self.integral_and_derivatives(gap_energy, temperature)
+        return integral
+
+    def active_region(
+        self, gap_energy: ndarray, temperature: ndarray
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """ Split the integration interval into its active region and tail
+
+        Returns the upper limit of the integral, the scale of the argument of
+        the hyperbolic tangent and the length of the thermally active region.
+        """
+        gap_energy = asarray(gap_energy, dtype=float)
+        temperature = asarray(temperature, dtype=float)
+
+        upper = arcsinh(self._debye_energy / gap_energy)
+        scale = gap_energy / (2 * k_B * temperature)
+        active = arccosh(maximum(SATURATION / scale, 1))
+
+        return upper, scale, minimum(active, upper)
+
+    def integral_and_derivatives(
+        self, gap_energy: ndarray, temperature: ndarray
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """ Evaluate the gap equation integral and its partial derivatives
+
+        Returns the integral and its derivatives with respect to the gap energy
+        and the temperature. The derivatives are those of the quadrature rule
+        itself, which keeps Newton's method quadratically convergent on the
+        discretised equation. The end of the active region only moves the
+        point where the integrand is one, so its movement does not contribute.
+        """
+        gap_energy = asarray(gap_energy, dtype=float)
+        temperature = asarray(temperature, dtype=float)
+        upper, scale, active = self.active_region(gap_energy, temperature)
+
+        upper_derivative = -self._debye_energy / (
+            gap_energy * sqrt(gap_energy ** 2 + self._debye_energy ** 2)
+        )
+        active_derivative = where(active < upper, 0, upper_derivative)
+        scale_derivative = scale / gap_energy
+
+        u = active[..., None] * self._nodes
+        cosh_u = cosh(u)
+        values = tanh(scale[..., None] * cosh_u)
+        sech_squared = 1 - values ** 2
+        values_derivative = sech_squared * (
+            scale_derivative[..., None] * cosh_u
+            + (scale * active_derivative)[..., None] * sinh(u) * self._nodes
+        )
+
+        integral = active * (values @ self._weights) + (upper - active)
+        gap_energy_derivative = (
+            active_derivative * (values @ self._weights)
+            + active * (values_derivative @ self._weights)
+            + (upper_derivative - active_derivative)
+        )
+        temperature_derivative = (
+            -active * scale / temperature * ((sech_squared * cosh_u) @ self._weights)
+        )
+
+        return integral, gap_energy_derivative, temperature_derivative
+
+    def integral_error_estimate(
+        self, gap_energy: ndarray, temperature: ndarray
+    ) -> ndarray:
+        """ Estimate the absolute error of the gap equation integral
+
+        The quadrature error is estimated from the two highest Legendre
+        coefficients of the integrand on the active region, which are computed
+        from the same samples. For a geometrically converging Legendre series
+        the Gauss-Legendre error decays as the square of these coefficients
+        relative to the mean of the integrand. The tail adds the bound on
+        :math:`1 - \\tanh`.
+        """
+        upper, scale, active = self.active_region(gap_energy, temperature)
+
+        u = active[..., None] * self._nodes
+        values = tanh(scale[..., None] * cosh(u))
+        mean = values @ self._weights
+        tail_coefficients = abs(values @ unit_legendre_tail(self._order)).sum(axis=-1)
+
+        quadrature_error = active * tail_coefficients ** 2 / mean
+        tail_error = (upper - active) * 2 * exp(-2 * SATURATION)
+
+        return quadrature_error + tail_error
+
+    def slope(self, gap_energy: ndarray, temperature: ndarray) -> ndarray:
+        """ Temperature derivative of the self consistent gap energy
+
+        Follows from implicitly differentiating the gap equation at a solution.
+        """
+        (
+            _,
+            gap_energy_derivative,
+            temperature_derivative,
+        ) = self.integral_and_derivatives(gap_energy, temperature)
+        return -temperature_derivative / gap_energy_derivative
+
+    def residual(self, gap_energy: ndarray, temperature: ndarray) -> ndarray:
+        """ Evaluate the gap equation residual element-wise
+
+        The residual increases monotonically with the gap energy and is zero at
+        the self consistent gap energy.
+        """
+        return self._eta - self.integral(gap_energy, temperature)
+
+    def initial_guess(self, temperatures: ndarray) -> ndarray:
+        """ Weak coupling interpolation formula for the gap energy """
+        temperatures = asarray(temperatures, dtype=float)
+        ratio = self.critical_temperature() / temperatures
+        return self._gap_energy_0 * tanh(1.74 * sqrt(maximum(ratio - 1, 0)))
+
+    def solve(
+        self,
+        temperatures: ndarray,
+        initial_guesses: Optional[ndarray] = None,
+        maximum_iterations: int = 100,
+    ) -> ndarray:
+        """ Solve for the gap energies at temperatures strictly below T_c
+
+        Newton's method is started from the initial guesses, or the weak
+        coupling interpolation formula if none are given, and safeguarded with
+        bisection on the gap energy bracket :math:`(0, \\Delta_{0}]`, which
+        always contains the solution.
+        """
+        gap_energy, _ = self.solve_with_slope(
+            temperatures, initial_guesses, maximum_iterations
+        )
+        return gap_energy
+
+    def solve_with_slope(
+        self,
+        temperatures: ndarray,
+        initial_guesses: Optional[ndarray] = None,
+        maximum_iterations: int = 100,
+    ) -> Tuple[ndarray, ndarray]:
+        """ Solve for the gap energies and their temperature derivatives
+
+        The temperature derivatives are taken from the integrals of the last
+        Newton iteration, so they come at no extra cost.
+        """
+        start = perf_counter()
+        temperatures = asarray(temperatures, dtype=float)
+
+        if initial_guesses is None:
+            initial_guesses = self.initial_guess(temperatures)
+
+        lower = zeros_like(temperatures)
+        upper = full_like(temperatures, self._gap_energy_0)
+        xtol = 2e-15 * self._gap_energy_0
+        gap_energy = clip(initial_guesses, xtol, upper)
+
+        ftol = 8 * finfo(float).eps * self._eta
+        active = ones_like(temperatures, dtype=bool)
+        slope = zeros_like(temperatures)
+        evaluations = 0
+
+        for _ in range(maximum_iterations):
+            if not active.any():
+                break
+
+            T = temperatures[active]
+            x = gap_energy[active]
+            (
+                integral,
+                derivative,
+                temperature_derivative,
+            ) = self.integral_and_derivatives(x, T)
+            evaluations += x.size * self._order
+            residual = self._eta - integral
+            slope[active] = -temperature_derivative / derivative
+
+            # Residual increases with the gap energy
+            a = where(residual > 0, lower[active], x)
+            b = where(residual > 0, x, upper[active])
+            lower[active] = a
+            upper[active] = b
+
+            step = residual / derivative
+            x_new = x + step
+            outside = ~((x_new > a) & (x_new < b))
+            x_new = where(outside, (a + b) / 2, x_new)
+
+            done = (abs(residual) <= ftol) | (abs(x_new - x) <= xtol) | (b - a <= xtol)
+            gap_energy[active] = where(abs(residual) <= ftol, x, x_new)
+
+            indices = flatnonzero(active)
+            active[indices[done]] = False
+
+        recorder = active_recorder()
+        if recorder is not None:
+            wall_time = perf_counter() - start
+            recorder.record("bcs_gap_equation.solve", wall_time, evaluations)
+
+        return gap_energy, slope
+
+    def initial_temperature_guess(self, gap_energies: ndarray) -> ndarray:
+        """ Inverse of the weak coupling interpolation formula """
+        gap_energies = asarray(gap_energies, dtype=float)
+        reduced_gap_energies = clip(gap_energies / self._gap_energy_0, 0, 1)
+        ratio = (arctanh(reduced_gap_energies) / 1.74) ** 2
+        return self.critical_temperature() / (1 + ratio)
+
+    def solve_temperature(
+        self,
+        gap_energies: ndarray,
+        initial_guesses: Optional[ndarray] = None,
+        maximum_iterations: int = 100,
+    ) -> ndarray:
+        """ Solve for the temperatures at gap energies strictly inside (0, Delta_0)
+
+        For a fixed gap energy the gap equation is a single equation in the
+        temperature. It is solved with Newton's method, started from the
+        inverse of the weak coupling interpolation formula and safeguarded with
+        bisection on the temperature bracket :math:`(0, T_{c})`. The residual
+        increases monotonically with the temperature.
+        """
+        start = perf_counter()
+        gap_energies = asarray(gap_energies, dtype=float)
+        T_c = self.critical_temperature()
+
+        if initial_guesses is None:
+            initial_guesses = self.initial_temperature_guess(gap_energies)
+
+        lower = zeros_like(gap_energies)
+        upper = full_like(gap_energies, T_c)
+        xtol = 2e-15 * T_c
+        temperature = clip(initial_guesses, xtol, T_c - xtol)
+
+        ftol = 8 * finfo(float).eps * self._eta
+        active = ones_like(gap_energies, dtype=bool)
+        evaluations = 0
+
+        for _ in range(maximum_iterations):
+            if not active.any():
+                break
+
+            x = temperature[active]
+            integral, _, derivative = self.integral_and_derivatives(
+                gap_energies[active], x
+            )
+            evaluations += x.size * self._order
+            residual = self._eta - integral
+
+            a = where(residual > 0, lower[active], x)
+            b = where(residual > 0, x, upper[active])
+            lower[active] = a
+            upper[active] = b
+
+            # The integral is flat in the temperature far below T_c
+            with errstate(divide="ignore", invalid="ignore"):
+                x_new = x + residual / derivative
+            outside = ~((x_new > a) & (x_new < b))
+            x_new = where(outside, (a + b) / 2, x_new)
+
+            done = (abs(residual) <= ftol) | (abs(x_new - x) <= xtol) | (b - a <= xtol)
+            temperature[active] = where(abs(residual) <= ftol, x, x_new)
+
+            indices = flatnonzero(active)
+            active[indices[done]] = False
+
+        recorder = active_recorder()
+        if recorder is not None:
+            wall_time = perf_counter() - start
+            recorder.record(
+                "bcs_gap_equation.solve_temperature", wall_time, evaluations
+            )
+
+        return temperature
+
+
+__all__ = ["BCSGapEquation"]
@@ -0,0 +1,209 @@
+from typing import Hashable, Tuple
+
+from numpy import asarray, euler_gamma, exp, maximum, ndarray, pi, sqrt, where
+
+from ..constants import k_B
+
+from .GapEnergyInterface import GapEnergyInterface
+from .ReducedGapEnergyInterpolant import ReducedGapEnergyInterpolant
+
+# Weak coupling ratio of the zero temperature gap energy and k_B T_c
+GAP_RATIO = pi / exp(euler_gamma)
+
+# Apery's constant zeta(3)
+ZETA_3 = 1.2020569031595942
+
+# Near T_c the reduced gap energy is A s (1 + B s^2) with s = sqrt(1 - T / T_c).
+# A follows from Ginzburg-Landau theory and B is fitted to the reduced gap table.
+NEAR_CRITICAL_LEADING = exp(euler_gamma) * sqrt(8 / (7 * ZETA_3))
+NEAR_CRITICAL_CORRECTION = -0.409493
+NEAR_CRITICAL_EDGE = 1e-6
+
+# Below this reduced temperature the low temperature asymptote is exact to
+# double precision
+LOW_TEMPERATURE_EDGE = 0.05
+
+# Below this reduced temperature the low temperature asymptote is one to double
+# precision
+LOWEST_TEMPERATURE = 1e-3
+
+# Chebyshev coefficients of the weak coupling reduced gap energy on
+# [LOW_TEMPERATURE_EDGE, 1], as used by ReducedGapEnergyInterpolant. The table
+# was sampled at the 65 Chebyshev-Lobatto nodes from the weak coupling gap
+# equation solved to double precision and interpolates it to within 1e-13.
+REDUCED_GAP_ENERGY_COEFFICIENTS = (
+    0.6259434464928187,
+    0.5153508604381065,
+    -0.13161425908630353,
+    -0.018502297332669483,
+    0.004636414028366463,
+    0.0030933315192442647,
+    0.0012376201386051903,
+    0.00023850751580174962,
+    -0.00010850318825896525,
+    -0.0001524780007679807,
+    -0.00010043285565627918,
+    -4.3277757779433304e-05,
+    -7.463979649714844e-06,
+    7.718591855205236e-06,
+    1.0335164624525155e-05,
+    7.63953818719472e-06,
+    3.989033108108391e-06,
+    1.2399095723902685e-06,
+    -2.4873833870411974e-07,
+    -7.657334983811681e-07,
+    -7.372717529125926e-07,
+    -5.011291040713791e-07,
+    -2.5381198850922316e-07,
+    -7.620800765665402e-08,
+    2.0485591381664577e-08,
+    5.575970022488438e-08,
+    5.543659880448653e-08,
+    4.0288026591547036e-08,
+    2.305051097936779e-08,
+    9.57920427545363e-09,
+    1.2820165598586446e-09,
+    -2.6445668786956154e-09,
+    -3.6953852200483084e-09,
+    -3.2494824502623393e-09,
+    -2.2728791620064276e-09,
+    -1.307866260522603e-09,
+    -5.808434024013286e-10,
+    -1.2907841080169423e-10,
+    9.835225110054651e-11,
+    1.7662472812680766e-10,
+    1.7271455037271282e-10,
+    1.3410621912409533e-10,
+    8.888807116234714e-11,
+    5.051183905554254e-11,
+    2.3197352350644296e-11,
+    6.375403785625899e-12,
+    -2.439818312660602e-12,
+    -5.961344265448254e-12,
+    -6.458110828676624e-12,
+    -5.499887591997577e-12,
+    -4.0727837167590084e-12,
+    -2.6879680994784812e-12,
+    -1.5746025131623096e-12,
+    -7.788744252150686e-13,
+    -2.711213686282937e-13,
+    1.741181255166674e-14,
+    1.5192048872158734e-13,
+    1.917443526004703e-13,
+    1.793810325972922e-13,
+    1.4240475118554308e-13,
+    1.0259848526317228e-13,
+    6.319250678288313e-14,
+    3.8191672047105385e-14,
+    1.7763568394002505e-14,
+    7.771561172376096e-15,
+)
+
+
+INTERPOLANT = ReducedGapEnergyInterpolant(
+    REDUCED_GAP_ENERGY_COEFFICIENTS, LOW_TEMPERATURE_EDGE
+)
+
+
+def reduced_gap_energy(reduced_temperature: ndarray) -> ndarray:
+    """ Weak coupling reduced gap energy at the reduced temperatures """
+    t = asarray(reduced_temperature, dtype=float)
+
+    # Low temperature asymptote
+    low = maximum(t, LOWEST_TEMPERATURE)
+    low = 1 - sqrt(2 * pi * low / GAP_RATIO) * exp(-GAP_RATIO / low)
+
+    # Square root onset near the critical temperature
+    s_squared = where(t < 1, 1 - t, 0)
+    near_critical = (
+        NEAR_CRITICAL_LEADING
+        * sqrt(s_squared)
+        * (1 + NEAR_CRITICAL_CORRECTION * s_squared)
+    )
+
+    values = INTERPOLANT.evaluate(t)
+    values = where(t < LOW_TEMPERATURE_EDGE, low, values)
+    values = where(s_squared < NEAR_CRITICAL_EDGE, near_critical, values)
+    values = where(t <= 0, 1.0, values)
+    values = where(t >= 1, 0.0, values)
+    return values
+
+
+def reduced_gap_energy_derivative(reduced_temperature: ndarray) -> ndarray:
+    """ Reduced temperature derivative of the weak coupling reduced gap energy """
+    t = asarray(reduced_temperature, dtype=float)
+
+    # Low temperature asymptote
+    low = maximum(t, LOWEST_TEMPERATURE)
+    low = (
+        -sqrt(2 * pi / GAP_RATIO)
+        * exp(-GAP_RATIO / low)
+        * (1 / (2 * sqrt(low)) + GAP_RATIO / low ** 1.5)
+    )
+
+    # Square root onset near the critical temperature
+    s_squared = where(t < 1, 1 - t, 1)
+    near_critical = (
+        NEAR_CRITICAL_LEADING
+        * (1 + 3 * NEAR_CRITICAL_CORRECTION * s_squared)
+        / (-2 * sqrt(s_squared))
+    )
+
+    values = INTERPOLANT.derivative(t)
+    values = where(t < LOW_TEMPERATURE_EDGE, low, values)
+    values = where(s_squared < NEAR_CRITICAL_EDGE, near_critical, values)
+    values = where((t <= 0) | (t >= 1), 0.0, values)
+    return values
+
+
+class BCSWeakGapEnergy(GapEnergyInterface):
+    """ Gap energy in the weak coupling limit of BCS theory
+
+    In the weak coupling limit :math:`\\kappa \\gg 1` of :class:`BCSGapEnergy`
+    the reduced gap energy :math:`\\Delta(T) / \\Delta_{0}` is a universal
+    function of the reduced temperature :math:`T / T_{c}` and the critical
+    temperature is :math:`k_{B} T_{c} = \\frac{e^{\\gamma}}{\\pi} \\Delta_{0}`.
+
+    The universal function is evaluated from a precomputed Chebyshev table,
+    with the asymptote
+    :math:`1 - \\sqrt{2 \\pi k_{B} T / \\Delta_{0}} e^{-\\Delta_{0} / k_{B} T}`
+    at low temperatures and the Ginzburg-Landau square root onset close to
+    :math:`T_{c}`. No root finding or quadrature is done when evaluating.
+    """
+
+    _gap_energy_0: float  # In Electron Volt
+
+    def __init__(self, gap_energy_0: float):
+        assert gap_energy_0 > 0
+
+        self._gap_energy_0 = gap_energy_0
+
+    def cache_key(self) -> Hashable:
+        return ("BCSWeakGapEnergy", self._gap_energy_0)
+
+    def gap_energy_0(self) -> float:
+        return self._gap_energy_0
+
+    def critical_temperature(self) -> float:
+        return self.gap_energy_0() / (GAP_RATIO * k_B)
+
+    def evaluate(self, temperature: float) -> float:
+        assert temperature >= 0
+        return float(self.evaluate_many(temperature))
+
+    def evaluate_many(self, temperatures: ndarray) -> ndarray:
+        temperatures = asarray(temperatures, dtype=float)
+        assert (temperatures >= 0).all()
+
+        reduced_temperatures = temperatures / self.critical_temperature()
+        reduced_gap_energies = reduced_gap_energy(reduced_temperatures)
+        return reduced_gap_energies * self.gap_energy_0()
+
+    def evaluate_with_derivative(self, temperature: float) -> Tuple[float, float]:
+        assert temperature >= 0
+        T_c = self.critical_temperature()
+        derivative = reduced_gap_energy_derivative(temperature / T_c)
+        return self.evaluate(temperature), float(derivative) * self.gap_energy_0() / T_c
+
+
+__all__ = ["BCSWeakGapEnergy"]
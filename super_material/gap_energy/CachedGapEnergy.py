@@ -0,0 +1,127 @@
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from numpy import array, asarray, empty, ndarray, ndenumerate
+
+from ..cache.CacheInterface import CacheInterface
+from ..cache.LRUCache import quantize, quantized, shared_cache
+
+from .GapEnergyInterface import GapEnergyInterface
+
+
+class CachedGapEnergy(GapEnergyInterface):
+    """ Gap energy with its evaluations cached
+
+    The gap energies are cached by the cache key of the wrapped gap energy, the
+    temperature resolution and the temperature quantized to the resolution, so
+    that a temperature within the resolution of a cached temperature returns
+    the cached gap energy. The gap energies are evaluated at the quantized
+    temperatures, so that they do not depend on the order of the evaluations. Cached gap energies wrapping equal gap energies share
+    their entries in the same cache, such as the gap energies of the
+    Mattis-Bardeen and Zimmermann conductivities of a material. Without a
+    cache the shared in memory cache is used, a
+    :class:`~super_material.cache.SQLiteCache` keeps the gap energies between
+    processes.
+
+    Derivatives and temperatures for gap energies are not cached.
+    """
+
+    _base: GapEnergyInterface
+    _base_key: Hashable
+    _cache: CacheInterface
+    _temperature_resolution: float
+
+    def __init__(
+        self,
+        base: GapEnergyInterface,
+        cache: Optional[CacheInterface] = None,
+        temperature_resolution: float = 1e-9,
+    ):
+        assert temperature_resolution > 0
+
+        self._base = base
+        self._base_key = base.cache_key()
+        self._cache = shared_cache() if cache is None else cache
+        self._temperature_resolution = temperature_resolution
+
+    def base(self) -> GapEnergyInterface:
+        return self._base
+
+    def cache(self) -> CacheInterface:
+        return self._cache
+
+    def temperature_resolution(self) -> float:
+        """ Resolution of the temperatures in Kelvin """
+        return self._temperature_resolution
+
+    def cache_key(self) -> Hashable:
+        return self._base_key
+
+    def key(self, temperature: float) -> Hashable:
+        """ Cache key of the gap energy at the temperature """
+        return (
+            "gap_energy",
+            self._base_key,
+            self._temperature_resolution,
+            quantize(temperature, self._temperature_resolution),
+        )
+
+    def gap_energy_0(self) -> float:
+        return self._base.gap_energy_0()
+
+    def critical_temperature(self) -> float:
+        return self._base.critical_temperature()
+
+    def evaluate(self, temperature: float) -> float:
+        assert temperature >= 0
+        return self._cache.get_or_compute(
+            self.key(temperature),
+            lambda: self._base.evaluate(
+                quantized(temperature, self._temperature_resolution)
+            ),
+        )
+
+    def evaluate_many(self, temperatures: ndarray) -> ndarray:
+        """ Evaluate the gap energy at each of the temperatures
+
+        The gap energies missing from the cache are evaluated by the wrapped
+        gap energy in one call, once for each of their keys.
+        """
+        temperatures = asarray(temperatures, dtype=float)
+        gap_energies = empty(temperatures.shape)
+
+        missing: Dict[Hashable, List[tuple]] = {}
+        for index, temperature in ndenumerate(temperatures):
+            key = self.key(temperature)
+            found, gap_energy = self._cache.lookup(key)
+            if found:
+                gap_energies[index] = gap_energy
+            else:
+                missing.setdefault(key, []).append(index)
+
+        if missing:
+            missing_temperatures = array(
+                [
+                    quantized(temperatures[indices[0]], self._temperature_resolution)
+                    for indices in missing.values()
+                ]
+            )
+            missing_gap_energies = self._base.evaluate_many(missing_temperatures)
+
+            for (key, indices), gap_energy in zip(
+                missing.items(), missing_gap_energies
+            ):
+                gap_energy = float(gap_energy)
+                self._cache.store(key, gap_energy)
+                for index in indices:
+                    gap_energies[index] = gap_energy
+
+        return gap_energies
+
+    def evaluate_with_derivative(self, temperature: float) -> Tuple[float, float]:
+        return self._base.evaluate_with_derivative(temperature)
+
+    def temperature_for_gap(self, gap_energies: ndarray) -> ndarray:
+        return self._base.temperature_for_gap(gap_energies)
+
+
+__all__ = ["CachedGapEnergy"]
@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Hashable, Tuple
+
+from numpy import asarray, full_like, ndarray, vectorize, where, zeros_like
+
 from ..constants import h_bar, pi
 
 
@@ -9,6 +13,11 @@ class GapEnergyInterface(ABC):
     def evaluate(self, temperature: float) -> float:
         """ Evaluate the gap energy at the specific temperature """
 
+    def evaluate_many(self, temperatures: ndarray) -> ndarray:
+        """ Evaluate the gap energy at each of the temperatures """
+        temperatures = asarray(temperatures, dtype=float)
+        return vectorize(self.evaluate, otypes=[float])(temperatures)
+
     @abstractmethod
     def critical_temperature(self) -> float:
         """ Get the critical temperature or transition temperature """
@@ -17,6 +26,69 @@ class GapEnergyInterface(ABC):
     def gap_energy_0(self) -> float:
         """ Get the gap energy at T = 0 K """
 
+    def cache_key(self) -> Hashable:
+        """ Key of the parameters of the gap energy
+
+        Gap energies with equal keys evaluate to the same gap energies. The
+        default key is the gap energy itself, which is only equal to itself.
+        """
+        return self
+
+    def derivative(self, temperature: float) -> float:
+        """ Evaluate the temperature derivative of the gap energy """
+        _, derivative = self.evaluate_with_derivative(temperature)
+        return derivative
+
+    def evaluate_with_derivative(self, temperature: float) -> Tuple[float, float]:
+        """ Evaluate the gap energy and its temperature derivative
+
+        The gap energy vanishes at and above T_c, and so does its derivative.
+        Implementations without an analytical derivative fall back on central
+        differences, which are one sided close to T = 0 K and T_c.
+        """
+        assert temperature >= 0
+        T_c = self.critical_temperature()
+        value = self.evaluate(temperature)
+
+        if temperature >= T_c:
+            return value, 0.0
+
+        step = 1e-6 * T_c
+        lower = max(temperature - step, 0)
+        upper = min(temperature + step, T_c)
+
+        difference = self.evaluate(upper) - self.evaluate(lower)
+        return value, difference / (upper - lower)
+
+    def temperature_for_gap(self, gap_energies: ndarray) -> ndarray:
+        """ Find the temperatures at which the gap energy reaches each value
+
+        The gap energy decreases monotonically from :math:`\\Delta_{0}` at
+        T = 0 K to zero at T_c, so implementations without a direct solution
+        bisect on :math:`[0, T_{c}]` with all the gap energies at once. Gap
+        energies of at least :math:`\\Delta_{0}` are reached at T = 0 K.
+        """
+        gap_energies = asarray(gap_energies, dtype=float)
+        assert (gap_energies >= 0).all()
+
+        lower = zeros_like(gap_energies)
+        upper = full_like(gap_energies, self.critical_temperature())
+
+        while True:
+            middle = (lower + upper) / 2
+            if not ((lower < middle) & (middle < upper)).any():
+                break
+
+            above = self.evaluate_many(middle) > gap_energies
+            lower = where(above, middle, lower)
+            upper = where(above, upper, middle)
+
+        temperatures = (lower + upper) / 2
+        temperatures = where(
+            gap_energies == 0, self.critical_temperature(), temperatures
+        )
+        return where(gap_energies >= self.gap_energy_0(), 0.0, temperatures)
+
     def critical_frequency(self, temperature: float) -> float:
         """ Get the critical frequency or gap frequency """
         return self.evaluate(temperature) / (h_bar * pi)
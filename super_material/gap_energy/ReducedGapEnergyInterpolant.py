@@ -0,0 +1,153 @@
+from typing import Callable
+
+from numpy import (
+    arange,
+    asarray,
+    clip,
+    concatenate,
+    cos,
+    empty,
+    ndarray,
+    pi,
+    sqrt,
+    where,
+)
+from numpy.fft import fft
+from numpy.polynomial.chebyshev import chebder, chebval
+
+from ..integrate.ToleranceInterface import ToleranceInterface
+
+
+class ReducedGapEnergyInterpolant:
+    """ Chebyshev interpolant of the reduced gap energy
+
+    Interpolates the reduced gap energy :math:`\\Delta(T) / \\Delta_{0}` as a
+    function of the reduced temperature :math:`t = T / T_{c}`. The gap energy
+    has a square root onset at :math:`T_{c}`, so the interpolation variable is
+    :math:`s = \\sqrt{1 - t}` in which the gap energy is smooth and the
+    Chebyshev series converges quickly.
+
+    The interpolant can be restricted to reduced temperatures above a minimum
+    reduced temperature. Reduced temperatures below the minimum are clamped to
+    it.
+    """
+
+    _coefficients: ndarray
+    _minimum_reduced_temperature: float
+
+    def __init__(self, coefficients: ndarray, minimum_reduced_temperature: float = 0):
+        assert 0 <= minimum_reduced_temperature < 1
+
+        self._coefficients = asarray(coefficients, dtype=float)
+        self._minimum_reduced_temperature = minimum_reduced_temperature
+
+    @staticmethod
+    def nodes(order: int, minimum_reduced_temperature: float = 0) -> ndarray:
+        """ Reduced temperatures of the Chebyshev-Lobatto nodes of an order
+
+        The nodes of an order are contained in the nodes of double the order.
+        """
+        x = cos(pi * arange(order + 1) / order)
+        s = (x + 1) / 2 * sqrt(1 - minimum_reduced_temperature)
+        return 1 - s ** 2
+
+    @classmethod
+    def from_values(
+        cls, values: ndarray, minimum_reduced_temperature: float = 0
+    ) -> "ReducedGapEnergyInterpolant":
+        """ Interpolate the reduced gap energy sampled at the nodes """
+        values = asarray(values, dtype=float)
+        order = len(values) - 1
+
+        extended = concatenate((values, values[-2:0:-1]))
+        coefficients = fft(extended).real[: order + 1] / order
+        coefficients[0] /= 2
+        coefficients[order] /= 2
+
+        return cls(coefficients, minimum_reduced_temperature)
+
+    @classmethod
+    def tabulate(
+        cls,
+        sample: Callable[[ndarray], ndarray],
+        tolerance: ToleranceInterface,
+        scale: float = 1,
+        minimum_order: int = 16,
+        maximum_order: int = 1024,
+    ) -> "ReducedGapEnergyInterpolant":
+        """ Interpolate a sampled reduced gap energy to within a tolerance
+
+        The reduced gap energy is sampled at the nodes of the minimum order,
+        and the order is doubled until the interpolant agrees with the samples
+        at all the new nodes within the tolerance. The tolerance is applied to
+        the reduced gap energies multiplied by the scale. The maximum order
+        must be at least double the minimum order, so that the interpolant of
+        the minimum order is tested.
+        """
+        assert minimum_order > 0
+        assert maximum_order >= 2 * minimum_order
+
+        order = minimum_order
+        values = sample(cls.nodes(order))
+
+        while 2 * order <= maximum_order:
+            interpolant = cls.from_values(values)
+            new_nodes = cls.nodes(2 * order)[1::2]
+            new_values = sample(new_nodes)
+            interpolated = interpolant.evaluate(new_nodes)
+
+            refined_values = empty(2 * order + 1)
+            refined_values[0::2] = values
+            refined_values[1::2] = new_values
+            values = refined_values
+            order *= 2
+
+            if tolerance.within_tolerance_batch(
+                scale * interpolated, scale * new_values
+            ).all():
+                return cls.from_values(values)
+
+        raise RuntimeError(
+            "Reduced gap energy interpolant did not reach the tolerance "
+            f"with {maximum_order} nodes"
+        )
+
+    def coefficients(self) -> ndarray:
+        return self._coefficients
+
+    def minimum_reduced_temperature(self) -> float:
+        return self._minimum_reduced_temperature
+
+    def order(self) -> int:
+        return len(self._coefficients) - 1
+
+    def evaluate(self, reduced_temperature: ndarray) -> ndarray:
+        """ Evaluate the reduced gap energy at the reduced temperatures """
+        reduced_temperature = asarray(reduced_temperature, dtype=float)
+        minimum = self._minimum_reduced_temperature
+        s = sqrt(1 - clip(reduced_temperature, minimum, 1))
+        values = chebval(2 * s / sqrt(1 - minimum) - 1, self._coefficients)
+
+        values = where(reduced_temperature <= 0, 1.0, values)
+        values = where(reduced_temperature >= 1, 0.0, values)
+        return values
+
+    def derivative(self, reduced_temperature: ndarray) -> ndarray:
+        """ Evaluate the reduced temperature derivative of the interpolant
+
+        The derivative diverges as the reduced temperature approaches one from
+        below and is zero outside the interpolated reduced temperatures.
+        """
+        reduced_temperature = asarray(reduced_temperature, dtype=float)
+        minimum = self._minimum_reduced_temperature
+        inside = (reduced_temperature > minimum) & (reduced_temperature < 1)
+
+        s = sqrt(1 - where(inside, reduced_temperature, minimum))
+        scale = 2 / sqrt(1 - minimum)
+        derivative = chebval(scale * s - 1, chebder(self._coefficients))
+        derivative = derivative * scale / (-2 * s)
+
+        return where(inside, derivative, 0.0)
+
+
+__all__ = ["ReducedGapEnergyInterpolant"]
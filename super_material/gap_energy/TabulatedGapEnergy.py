@@ -0,0 +1,93 @@
+from typing import Hashable, Optional, Tuple
+
+from numpy import asarray, ndarray
+
+from ..integrate.AbsoluteTolerance import AbsoluteTolerance
+from ..integrate.ToleranceInterface import ToleranceInterface
+
+from .GapEnergyInterface import GapEnergyInterface
+from .ReducedGapEnergyInterpolant import ReducedGapEnergyInterpolant
+
+
+class TabulatedGapEnergy(GapEnergyInterface):
+    """ Gap energy interpolated from a table of another gap energy
+
+    The wrapped gap energy is sampled once on :math:`[0, T_{c}]` at
+    Chebyshev-Lobatto nodes in the reduced temperature variable
+    :math:`\\sqrt{1 - T / T_{c}}`. The number of nodes is doubled until the
+    interpolant agrees with the wrapped gap energy at all the new nodes within
+    the tolerance. The default tolerance is an absolute tolerance of
+    :math:`10^{-9} \\Delta_{0}`.
+
+    Every evaluation afterwards is a Chebyshev series evaluation.
+    """
+
+    _base: GapEnergyInterface
+    _gap_energy_0: float
+    _critical_temperature: float
+    _interpolant: ReducedGapEnergyInterpolant
+    _tabulation_key: Hashable
+
+    def __init__(
+        self,
+        base: GapEnergyInterface,
+        tolerance: Optional[ToleranceInterface] = None,
+        minimum_order: int = 16,
+        maximum_order: int = 1024,
+    ):
+        self._base = base
+        self._gap_energy_0 = base.gap_energy_0()
+        self._critical_temperature = base.critical_temperature()
+
+        if tolerance is None:
+            tolerance = AbsoluteTolerance(1e-9 * self._gap_energy_0)
+
+        self._interpolant = ReducedGapEnergyInterpolant.tabulate(
+            self._sample, tolerance, self._gap_energy_0, minimum_order, maximum_order
+        )
+        self._tabulation_key = (tolerance.cache_key(), minimum_order, maximum_order)
+
+    def _sample(self, reduced_temperatures: ndarray) -> ndarray:
+        """ Sample the reduced gap energy of the wrapped gap energy """
+        temperatures = reduced_temperatures * self._critical_temperature
+        return self._base.evaluate_many(temperatures) / self._gap_energy_0
+
+    def cache_key(self) -> Hashable:
+        return ("TabulatedGapEnergy", self._base.cache_key(), self._tabulation_key)
+
+    def base(self) -> GapEnergyInterface:
+        return self._base
+
+    def interpolant(self) -> ReducedGapEnergyInterpolant:
+        return self._interpolant
+
+    def order(self) -> int:
+        """ The order of the Chebyshev interpolant """
+        return self._interpolant.order()
+
+    def gap_energy_0(self) -> float:
+        return self._gap_energy_0
+
+    def critical_temperature(self) -> float:
+        return self._critical_temperature
+
+    def evaluate(self, temperature: float) -> float:
+        assert temperature >= 0
+        return float(self.evaluate_many(temperature))
+
+    def evaluate_many(self, temperatures: ndarray) -> ndarray:
+        temperatures = asarray(temperatures, dtype=float)
+        reduced_temperatures = temperatures / self._critical_temperature
+        reduced_gap_energies = self._interpolant.evaluate(reduced_temperatures)
+        return reduced_gap_energies * self._gap_energy_0
+
+    def evaluate_with_derivative(self, temperature: float) -> Tuple[float, float]:
+        """ Evaluate the gap energy and the derivative of the interpolant """
+        assert temperature >= 0
+        reduced_temperature = temperature / self._critical_temperature
+        derivative = self._interpolant.derivative(reduced_temperature)
+        scale = self._gap_energy_0 / self._critical_temperature
+        return self.evaluate(temperature), float(derivative * scale)
+
+
+__all__ = ["TabulatedGapEnergy"]
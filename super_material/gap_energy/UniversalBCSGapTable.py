@@ -0,0 +1,157 @@
+from os import fdopen, makedirs, remove, replace
+from os.path import join, isfile
+from tempfile import mkstemp
+from threading import Lock
+from typing import Dict, Optional
+
+from numpy import asarray, load, ndarray, savez
+
+from ..integrate.AbsoluteTolerance import AbsoluteTolerance
+
+from .ReducedGapEnergyInterpolant import ReducedGapEnergyInterpolant
+
+# Absolute tolerance on the reduced gap energy, just above the accuracy to which
+# the gap equation determines the gap energy close to T_c
+TOLERANCE = 1e-10
+
+# Version of the saved tables, to increase when the gap equation solver or the
+# interpolant change, so that tables saved before are built again
+TABLE_VERSION = 1
+
+
+class UniversalBCSGapTable:
+    """ Reduced BCS gap energy shared by all gap energies with the same kappa
+
+    For the BCS gap energy the reduced gap energy :math:`\\Delta(T) / \\Delta_{0}`
+    as a function of the reduced temperature :math:`T / T_{c}` only depends on
+    :math:`\\kappa`. One table is built per :math:`\\kappa` for the whole
+    process, the first time it is asked for, and every gap energy with the same
+    :math:`\\kappa` is interpolated from it to within :math:`10^{-10}
+    \\Delta_{0}`.
+
+    If a directory is set, tables are loaded from it before being built and
+    saved to it after being built, so that they are shared between processes.
+    The saved tables hold their tolerance and version, and tables of another
+    tolerance or version are built again.
+    """
+
+    _kappa: float
+    _interpolant: ReducedGapEnergyInterpolant
+
+    # Process wide tables
+    _tables: Dict[float, "UniversalBCSGapTable"] = {}
+    _tables_lock: Lock = Lock()
+    _directory: Optional[str] = None
+
+    def __init__(self, kappa: float, interpolant: ReducedGapEnergyInterpolant):
+        assert kappa > 0
+
+        self._kappa = kappa
+        self._interpolant = interpolant
+
+    def kappa(self) -> float:
+        return self._kappa
+
+    def interpolant(self) -> ReducedGapEnergyInterpolant:
+        return self._interpolant
+
+    def evaluate(self, reduced_temperatures: ndarray) -> ndarray:
+        """ Evaluate the reduced gap energy at the reduced temperatures """
+        return self._interpolant.evaluate(reduced_temperatures)
+
+    def derivative(self, reduced_temperatures: ndarray) -> ndarray:
+        """ Evaluate the reduced temperature derivative of the reduced gap energy """
+        return self._interpolant.derivative(reduced_temperatures)
+
+    @classmethod
+    def build(cls, gap_energy) -> "UniversalBCSGapTable":
+        """ Build the table of the kappa of a BCSGapEnergy by solving it """
+        T_c = gap_energy.critical_temperature()
+        gap_energy_0 = gap_energy.gap_energy_0()
+
+        def sample(reduced_temperatures: ndarray) -> ndarray:
+            return gap_energy.solve_many(reduced_temperatures * T_c) / gap_energy_0
+
+        tolerance = AbsoluteTolerance(TOLERANCE)
+        interpolant = ReducedGapEnergyInterpolant.tabulate(sample, tolerance)
+        return cls(gap_energy.kappa(), interpolant)
+
+    @classmethod
+    def for_gap_energy(cls, gap_energy) -> "UniversalBCSGapTable":
+        """ Get the process wide table of the kappa of a BCSGapEnergy """
+        kappa = gap_energy.kappa()
+
+        with cls._tables_lock:
+            table = cls._tables.get(kappa)
+
+            if table is None:
+                table = cls._load(kappa)
+
+            if table is None:
+                table = cls.build(gap_energy)
+                cls._save(table)
+
+            cls._tables[kappa] = table
+
+        return table
+
+    @classmethod
+    def set_directory(cls, directory: Optional[str]):
+        """ Set the directory tables are persisted in, or None to not persist """
+        cls._directory = directory
+
+    @classmethod
+    def clear(cls):
+        """ Forget all the process wide tables """
+        with cls._tables_lock:
+            cls._tables.clear()
+
+    @classmethod
+    def _path(cls, kappa: float) -> str:
+        return join(cls._directory, f"bcs_gap_table_kappa_{kappa!r}.npz")
+
+    @classmethod
+    def _load(cls, kappa: float) -> Optional["UniversalBCSGapTable"]:
+        if cls._directory is None:
+            return None
+
+        path = cls._path(kappa)
+        if not isfile(path):
+            return None
+
+        with load(path) as data:
+            if data["version"] != TABLE_VERSION or data["tolerance"] != TOLERANCE:
+                return None
+
+            coefficients = asarray(data["coefficients"], dtype=float)
+
+        return cls(kappa, ReducedGapEnergyInterpolant(coefficients))
+
+    @classmethod
+    def _save(cls, table: "UniversalBCSGapTable"):
+        if cls._directory is None:
+            return
+
+        makedirs(cls._directory, exist_ok=True)
+        path = cls._path(table.kappa())
+
+        # Write to a unique file then rename, so that concurrent readers never
+        # see partial files and concurrent writers do not write the same file
+        descriptor, temporary_path = mkstemp(
+            suffix=".tmp", prefix="bcs_gap_table_", dir=cls._directory
+        )
+        try:
+            with fdopen(descriptor, "wb") as file:
+                savez(
+                    file,
+                    coefficients=table.interpolant().coefficients(),
+                    tolerance=TOLERANCE,
+                    version=TABLE_VERSION,
+                )
+            replace(temporary_path, path)
+        except BaseException:
+            remove(temporary_path)
+            raise
+
+
+__all__ = ["UniversalBCSGapTable"]
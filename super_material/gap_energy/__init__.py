@@ -1,2 +1,6 @@
 from .BCSGapEnergy import BCSGapEnergy
+from .CachedGapEnergy import CachedGapEnergy
 from .GapEnergyInterface import GapEnergyInterface
+from .TabulatedGapEnergy import TabulatedGapEnergy
+from .BCSWeakGapEnergy import BCSWeakGapEnergy
+from .UniversalBCSGapTable import UniversalBCSGapTable
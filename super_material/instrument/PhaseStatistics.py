@@ -0,0 +1,39 @@
+class PhaseStatistics:
+    """ Aggregate of the calls recorded for a phase of a calculation
+
+    Keeps the number of calls, their total wall time and the total number of
+    integrand evaluations made during the calls.
+    """
+
+    _calls: int
+    _wall_time: float
+    _evaluations: int
+
+    def __init__(self):
+        self._calls = 0
+        self._wall_time = 0.0
+        self._evaluations = 0
+
+    def add(self, wall_time: float, evaluations: int = 0):
+        self._calls += 1
+        self._wall_time += wall_time
+        self._evaluations += evaluations
+
+    def calls(self) -> int:
+        return self._calls
+
+    def wall_time(self) -> float:
+        """ Total wall time of the calls in seconds """
+        return self._wall_time
+
+    def mean_wall_time(self) -> float:
+        if self._calls == 0:
+            return 0.0
+
+        return self._wall_time / self._calls
+
+    def evaluations(self) -> int:
+        return self._evaluations
+
+
+__all__ = ["PhaseStatistics"]
@@ -0,0 +1,130 @@
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+from ..integrate.IntegrationResult import IntegrationResult
+
+from .PhaseStatistics import PhaseStatistics
+
+T = TypeVar("T")
+
+
+class Recorder:
+    """ Records the calls of the named phases of a calculation
+
+    Phases are named after the physics stage they time, such as
+    ``"mattis_bardeen.first_real"`` for the first real integral of Mattis and
+    Bardeen. Phases can be nested, the gap energy of a conductivity model
+    includes the solves of the gap equation and the J integral of Zimmermann
+    includes its first and third integrals. Recording is thread safe.
+    """
+
+    _phases: Dict[str, PhaseStatistics]
+    _lock: Lock
+
+    def __init__(self):
+        self._phases = {}
+        self._lock = Lock()
+
+    def record(self, phase: str, wall_time: float, evaluations: int = 0):
+        """ Add a call of the phase with its wall time and evaluations """
+        with self._lock:
+            if phase not in self._phases:
+                self._phases[phase] = PhaseStatistics()
+
+            self._phases[phase].add(wall_time, evaluations)
+
+    def record_integration(self, phase: str, result: IntegrationResult):
+        """ Add an integration as a call of the phase """
+        self.record(phase, result.wall_time(), result.evaluations())
+
+    @contextmanager
+    def timed(self, phase: str) -> Iterator[None]:
+        """ Record the body of the context as a call of the phase """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, perf_counter() - start)
+
+    def phases(self) -> Dict[str, PhaseStatistics]:
+        with self._lock:
+            return dict(self._phases)
+
+    def statistics(self, phase: str) -> PhaseStatistics:
+        return self._phases.get(phase, PhaseStatistics())
+
+    def reset(self):
+        with self._lock:
+            self._phases = {}
+
+    def report(self) -> str:
+        """ Table of the phases ordered by their total wall time """
+        phases = sorted(
+            self.phases().items(), key=lambda item: item[1].wall_time(), reverse=True
+        )
+        width = max([len("phase")] + [len(phase) for phase, _ in phases])
+
+        lines = [
+            f"{'phase':<{width}} {'calls':>8} {'total s':>10} {'mean ms':>10} "
+            f"{'evaluations':>12}"
+        ]
+        for phase, statistics in phases:
+            lines.append(
+                f"{phase:<{width}} {statistics.calls():>8} "
+                f"{statistics.wall_time():>10.4f} "
+                f"{1e3 * statistics.mean_wall_time():>10.4f} "
+                f"{statistics.evaluations():>12}"
+            )
+
+        return "\n".join(lines)
+
+
+# The recorder of the innermost recording context, checked on the hot paths
+_active_recorder: Optional[Recorder] = None
+
+
+def active_recorder() -> Optional[Recorder]:
+    """ The recorder calls are recorded with, or None if not recording """
+    return _active_recorder
+
+
+@contextmanager
+def recording(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """ Record the phases of all the calculations in the context
+
+    Recording is process wide. Without a recording context the instrumented
+    code only checks for the active recorder.
+    """
+    global _active_recorder
+
+    if recorder is None:
+        recorder = Recorder()
+
+    previous = _active_recorder
+    _active_recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _active_recorder = previous
+
+
+def instrumented_call(phase: str, function: Callable[..., T], *args) -> T:
+    """ Call the function, as a call of the phase if recording """
+    recorder = _active_recorder
+    if recorder is None:
+        return function(*args)
+
+    start = perf_counter()
+    value = function(*args)
+    recorder.record(phase, perf_counter() - start)
+    return value
+
+
+__all__ = [
+    "Recorder",
+    "active_recorder",
+    "instrumented_call",
+    "recording",
+]
@@ -0,0 +1,9 @@
+""" Lightweight instrumentation of the phases of the calculations
+
+Within a :func:`recording` context the gap energy solves, the named
+sub-integrals of the conductivity models and their integrand evaluations are
+counted and timed per phase.
+"""
+
+from .PhaseStatistics import *
+from .Recorder import *
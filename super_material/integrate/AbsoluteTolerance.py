@@ -1,3 +1,7 @@
+from typing import Hashable, Optional, Tuple
+
+from numpy import asarray, ndarray
+
 from .ToleranceInterface import ToleranceInterface
 
 
@@ -10,9 +14,19 @@ class AbsoluteTolerance(ToleranceInterface):
     def absolute_tolerance(self) -> float:
         return self._absolute_tolerance
 
+    def absolute_and_relative(self) -> Optional[Tuple[float, float]]:
+        return self._absolute_tolerance, 0.0
+
+    def cache_key(self) -> Hashable:
+        return ("AbsoluteTolerance", self._absolute_tolerance)
+
     def within_tolerance(self, value: float, reference: float) -> bool:
         absolute_difference = abs(reference - value)
         return absolute_difference < self._absolute_tolerance
 
+    def within_tolerance_batch(self, values: ndarray, references: ndarray) -> ndarray:
+        absolute_differences = abs(asarray(references) - asarray(values))
+        return absolute_differences < self._absolute_tolerance
+
 
 __all__ = ["AbsoluteTolerance"]
@@ -1,5 +1,7 @@
 from typing import Callable
 
+from numpy import asarray, ndarray
+
 from .IntegrandInterface import IntegrandInterface
 from .IntegrandInterval import IntegrandInterval
 
@@ -7,15 +9,27 @@ from .IntegrandInterval import IntegrandInterval
 class BaseIntegrand(IntegrandInterface):
     _function: Callable[[float], float]
     _interval: IntegrandInterval
+    _vectorized: bool
 
-    def __init__(self, function, interval):
+    def __init__(self, function, interval, vectorized: bool = False):
         self._function = function
         self._interval = interval
+        self._vectorized = vectorized
 
     def evaluate(self, x: float) -> float:
         """ Evaluate the integrand """
         return self._function(x)
 
+    def evaluate_batch(self, xs: ndarray) -> ndarray:
+        """ Evaluate the integrand at each of the points
+
+        Vectorized functions are called once with all the points.
+        """
+        if not self._vectorized:
+            return super().evaluate_batch(xs)
+
+        return self._function(asarray(xs, dtype=float))
+
     def interval(self) -> IntegrandInterval:
         """ The integrand interval """
         return self._interval
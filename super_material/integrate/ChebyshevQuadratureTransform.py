@@ -1,5 +1,8 @@
 from math import asin, sin, sqrt
 
+import numpy as np
+from numpy import asarray, ndarray
+
 from .IntegrandIntervalTransformInterface import IntegrandIntervalTransformInterface
 
 
@@ -18,6 +21,14 @@ class ChebyshevLowerSingularityTransform(IntegrandIntervalTransformInterface):
     def transform_derivative(self, x: float) -> float:
         return 0.5 / sqrt(x - self._a)
 
+    def inverse_transform_batch(self, us: ndarray) -> ndarray:
+        us = asarray(us, dtype=float)
+        return self._a + us ** 2
+
+    def transform_derivative_batch(self, xs: ndarray) -> ndarray:
+        xs = asarray(xs, dtype=float)
+        return 0.5 / np.sqrt(xs - self._a)
+
 
 class ChebyshevUpperSingularityTransform(IntegrandIntervalTransformInterface):
     _b: float
@@ -34,6 +45,14 @@ class ChebyshevUpperSingularityTransform(IntegrandIntervalTransformInterface):
     def transform_derivative(self, x: float) -> float:
         return -0.5 / sqrt(self._b - x)
 
+    def inverse_transform_batch(self, us: ndarray) -> ndarray:
+        us = asarray(us, dtype=float)
+        return self._b - us ** 2
+
+    def transform_derivative_batch(self, xs: ndarray) -> ndarray:
+        xs = asarray(xs, dtype=float)
+        return -0.5 / np.sqrt(self._b - xs)
+
 
 class ChebyshevSingularityTransform(IntegrandIntervalTransformInterface):
     _a: float
@@ -52,6 +71,14 @@ class ChebyshevSingularityTransform(IntegrandIntervalTransformInterface):
     def transform_derivative(self, x: float) -> float:
         return 1 / sqrt((x - self._b) * (self._a - x))
 
+    def inverse_transform_batch(self, us: ndarray) -> ndarray:
+        us = asarray(us, dtype=float)
+        return self._a + (self._b - self._a) * (np.sin(us / 2) ** 2)
+
+    def transform_derivative_batch(self, xs: ndarray) -> ndarray:
+        xs = asarray(xs, dtype=float)
+        return 1 / np.sqrt((xs - self._b) * (self._a - xs))
+
 
 __all__ = [
     "ChebyshevUpperSingularityTransform",
@@ -0,0 +1,173 @@
+from math import inf
+from time import perf_counter
+from typing import Hashable, Optional, Tuple
+from warnings import warn
+
+from numpy import arange, concatenate, cos, empty, ndarray, pi
+from numpy.fft import fft
+
+from .ClenshawCurtisQuadrature import ClenshawCurtisQuadrature
+from .DisjunctionTolerance import DisjunctionTolerance
+from .IntegratorInterface import IntegratorInterface
+from .IntegrandInterface import IntegrandInterface
+from .IntegrationResult import IntegrationResult
+from .ToleranceInterface import ToleranceInterface
+
+
+class ClenshawCurtisIntegrator(IntegratorInterface):
+    """ Clenshaw-Curtis integrator with nested refinement
+
+    Samples the integrand at the Chebyshev-Lobatto points of the minimum order
+    and doubles the order until the estimates of two successive orders are
+    within the tolerance. The points of an order are contained in those of
+    double the order, so every refinement only evaluates the new points, with
+    a single call to the batch evaluation of the integrand.
+
+    If the integrand is not defined on one of the endpoints of its interval,
+    the endpoints are left out and Fejer's second rule is used on the interior
+    points. With both endpoints the samples also give the Chebyshev
+    interpolant of the integrand.
+    """
+
+    _tolerance: ToleranceInterface
+    _minimum_order: int
+    _maximum_order: int
+
+    def __init__(
+        self,
+        absolute_tolerance: float = 1.49e-8,
+        relative_tolerance: float = 1.49e-8,
+        minimum_order: int = 8,
+        maximum_order: int = 1024,
+        tolerance: Optional[ToleranceInterface] = None,
+    ):
+        assert 1 < minimum_order <= maximum_order
+
+        if tolerance is None:
+            tolerance = DisjunctionTolerance.absolute_or_relative(
+                absolute_tolerance, relative_tolerance
+            )
+
+        self._tolerance = tolerance
+        self._minimum_order = minimum_order
+        self._maximum_order = maximum_order
+
+    def tolerance(self) -> ToleranceInterface:
+        return self._tolerance
+
+    def cache_key(self) -> Hashable:
+        return (
+            "ClenshawCurtisIntegrator",
+            self._tolerance.cache_key(),
+            self._minimum_order,
+            self._maximum_order,
+        )
+
+    def sample(
+        self, integrand: IntegrandInterface
+    ) -> Tuple[IntegrationResult, ndarray]:
+        """ Integrate and return the result and the samples of the integrand
+
+        The samples are at the Chebyshev-Lobatto points of the final order,
+        from the end to the start of the interval, with zeros on the endpoints
+        if the integrand is not defined on both.
+        """
+        interval = integrand.interval()
+        start = interval.start()
+        end = interval.end()
+        include_endpoints = start.defined_on_boundary() and end.defined_on_boundary()
+
+        middle = (start.value() + end.value()) / 2
+        half_width = (end.value() - start.value()) / 2
+
+        wall_time_start = perf_counter()
+        order = self._minimum_order
+        points = middle + half_width * cos(pi * arange(order + 1) / order)
+
+        if include_endpoints:
+            values = integrand.evaluate_batch(points)
+        else:
+            values = concatenate([[0], integrand.evaluate_batch(points[1:-1]), [0]])
+
+        integral = half_width * (values @ self.weights(order, include_endpoints))
+        error = inf
+        converged = False
+
+        while 2 * order <= self._maximum_order:
+            new_abscissae = cos(pi * arange(1, 2 * order, 2) / (2 * order))
+            new_values = integrand.evaluate_batch(middle + half_width * new_abscissae)
+
+            refined_values = empty(2 * order + 1, dtype=new_values.dtype)
+            refined_values[0::2] = values
+            refined_values[1::2] = new_values
+            values = refined_values
+            order *= 2
+
+            previous = integral
+            integral = half_width * (values @ self.weights(order, include_endpoints))
+
+            error = abs(integral - previous)
+
+            converged = self._tolerance.within_tolerance(integral, previous)
+            if converged:
+                break
+
+        if not converged:
+            warn(
+                f"Maximum order ({self._maximum_order}) reached without the "
+                "estimates of successive orders being within the tolerance",
+                RuntimeWarning,
+            )
+
+        # All the points are evaluated once, the endpoints only if defined
+        evaluations = order + 1 if include_endpoints else order - 1
+        wall_time = perf_counter() - wall_time_start
+        result = IntegrationResult(
+            integral, error, evaluations, 1, wall_time, converged
+        )
+        return result, values
+
+    @staticmethod
+    def weights(order: int, include_endpoints: bool) -> ndarray:
+        """ Weights of all the Chebyshev-Lobatto points of an order """
+        quadrature = ClenshawCurtisQuadrature(order, include_endpoints)
+
+        if include_endpoints:
+            return quadrature.weights()
+
+        return concatenate([[0], quadrature.weights(), [0]])
+
+    def integrate(self, integrand: IntegrandInterface):
+        return self.integrate_with_info(integrand).value()
+
+    def integrate_with_info(self, integrand: IntegrandInterface) -> IntegrationResult:
+        result, _ = self.sample(integrand)
+        return result
+
+    def interpolate(self, integrand: IntegrandInterface) -> Tuple[float, ndarray]:
+        """ Integrate and return the integral and the Chebyshev interpolant
+
+        The Chebyshev coefficients of the interpolant are in the variable that
+        maps the interval of the integrand to [-1, 1], and are computed from
+        the samples of the integral with a DCT. The integrand needs to be
+        defined on both endpoints.
+        """
+        interval = integrand.interval()
+        assert interval.start().defined_on_boundary()
+        assert interval.end().defined_on_boundary()
+
+        result, values = self.sample(integrand)
+        order = len(values) - 1
+
+        extended = concatenate((values, values[-2:0:-1]))
+        coefficients = fft(extended)[: order + 1] / order
+        coefficients[0] /= 2
+        coefficients[order] /= 2
+
+        if values.dtype.kind != "c":
+            coefficients = coefficients.real
+
+        return result.value(), coefficients
+
+
+__all__ = ["ClenshawCurtisIntegrator"]
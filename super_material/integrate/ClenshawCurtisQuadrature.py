@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import Tuple
+
+from numpy import arange, concatenate, cos, ndarray, ones, pi, zeros
+from numpy.fft import ifft
+
+from .FixedQuadratureInterface import FixedQuadratureInterface
+
+
+@lru_cache(maxsize=None)
+def clenshaw_curtis_rule(order: int) -> Tuple[ndarray, ndarray, ndarray]:
+    """ Clenshaw-Curtis and Fejer abscissae and weights on [-1, 1]
+
+    Returns the :math:`n + 1` abscissae :math:`\\cos{(\\pi k / n)}`, the
+    Clenshaw-Curtis weights and the weights of Fejer's second rule, which are
+    zero on the endpoints. The weights are computed with an inverse FFT
+    following Waldvogel :cite:`WaldvogelClenshawCurtis`.
+    """
+    n = order
+    N = arange(1, n, 2)
+    l = len(N)
+    m = n - l
+
+    v0 = concatenate([2 / N / (N - 2), [1 / N[-1]], zeros(m)])
+    v2 = -v0[:-1] - v0[:0:-1]
+
+    fejer_weights = ifft(v2).real
+    fejer_weights = concatenate([fejer_weights, [0.0]])
+    fejer_weights[0] = 0.0  # Zero up to rounding
+
+    g0 = -ones(n)
+    g0[l] += n
+    g0[m] += n
+    g = g0 / (n ** 2 - 1 + n % 2)
+    weights = ifft(v2 + g).real
+    weights = concatenate([weights, weights[:1]])
+
+    abscissae = cos(pi * arange(n + 1) / n)
+
+    for array in (abscissae, weights, fejer_weights):
+        array.flags.writeable = False
+
+    return abscissae, weights, fejer_weights
+
+
+class ClenshawCurtisQuadrature(FixedQuadratureInterface):
+    """ Clenshaw-Curtis quadrature of an order
+
+    Integrates the Chebyshev interpolant through the :math:`n + 1`
+    Chebyshev-Lobatto points :math:`\\cos{(\\pi k / n)}`, ordered from one to
+    minus one. The points of an order are contained in the points of double
+    the order. Without the endpoints the quadrature is Fejer's second rule on
+    the :math:`n - 1` interior points. The abscissae and weights are computed
+    once per order.
+    """
+
+    _order: int
+    _include_endpoints: bool
+    _abscissae: ndarray
+    _weights: ndarray
+
+    def __init__(self, order: int, include_endpoints: bool = True):
+        assert order > 1
+
+        self._order = order
+        self._include_endpoints = include_endpoints
+        abscissae, weights, fejer_weights = clenshaw_curtis_rule(order)
+
+        if include_endpoints:
+            self._abscissae = abscissae
+            self._weights = weights
+        else:
+            self._abscissae = abscissae[1:-1]
+            self._weights = fejer_weights[1:-1]
+
+    def order(self) -> int:
+        return self._order
+
+    def include_endpoints(self) -> bool:
+        return self._include_endpoints
+
+    def weights(self) -> ndarray:
+        return self._weights
+
+    def abscissae(self) -> ndarray:
+        return self._abscissae
+
+    def num_quadrature_points(self) -> int:
+        return len(self._abscissae)
+
+
+__all__ = ["ClenshawCurtisQuadrature"]
@@ -1,4 +1,6 @@
-from typing import List
+from typing import Hashable, List
+
+from numpy import broadcast, full, ndarray
 
 from .ToleranceInterface import ToleranceInterface
 
@@ -12,6 +14,12 @@ class ConjunctionTolerance(ToleranceInterface):
     def children(self) -> List[ToleranceInterface]:
         return self._children
 
+    def cache_key(self) -> Hashable:
+        return (
+            "ConjunctionTolerance",
+            tuple(child.cache_key() for child in self._children),
+        )
+
     def within_tolerance(self, value: float, reference: float) -> bool:
         for child in self._children:
             if not child.within_tolerance(value, reference):
@@ -19,5 +27,13 @@ class ConjunctionTolerance(ToleranceInterface):
 
         return True
 
+    def within_tolerance_batch(self, values: ndarray, references: ndarray) -> ndarray:
+        result = full(broadcast(values, references).shape, True)
+
+        for child in self._children:
+            result = result & child.within_tolerance_batch(values, references)
+
+        return result
+
 
 __all__ = ["ConjunctionTolerance"]
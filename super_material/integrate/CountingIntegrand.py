@@ -0,0 +1,40 @@
+from typing import Tuple
+
+from numpy import ndarray, size
+
+from .IntegrandInterface import IntegrandInterface
+from .IntegrandInterval import IntegrandInterval
+
+
+class CountingIntegrand(IntegrandInterface):
+    """ Integrand that counts the points its base integrand is evaluated on """
+
+    _base: IntegrandInterface
+    _evaluations: int
+
+    def __init__(self, base: IntegrandInterface):
+        self._base = base
+        self._evaluations = 0
+
+    def base(self) -> IntegrandInterface:
+        return self._base
+
+    def evaluations(self) -> int:
+        return self._evaluations
+
+    def evaluate(self, x: float) -> float:
+        self._evaluations += 1
+        return self._base.evaluate(x)
+
+    def evaluate_batch(self, xs: ndarray) -> ndarray:
+        self._evaluations += size(xs)
+        return self._base.evaluate_batch(xs)
+
+    def endpoint_exponents(self) -> Tuple[float, float]:
+        return self._base.endpoint_exponents()
+
+    def interval(self) -> IntegrandInterval:
+        return self._base.interval()
+
+
+__all__ = ["CountingIntegrand"]
@@ -1,5 +1,9 @@
-from typing import List
+from typing import Hashable, List, Optional, Tuple
 
+from numpy import broadcast, full, ndarray
+
+from .AbsoluteTolerance import AbsoluteTolerance
+from .RelativeTolerance import RelativeTolerance
 from .ToleranceInterface import ToleranceInterface
 
 
@@ -9,9 +13,46 @@ class DisjunctionTolerance(ToleranceInterface):
     def __init__(self, children: List[ToleranceInterface]):
         self._children = children
 
+    @classmethod
+    def absolute_or_relative(
+        cls, absolute_tolerance: float, relative_tolerance: float
+    ) -> "DisjunctionTolerance":
+        """ Within the absolute tolerance or the relative tolerance
+
+        This is the tolerance of the integrators given the two as numbers.
+        """
+        return cls(
+            [
+                AbsoluteTolerance(absolute_tolerance),
+                RelativeTolerance(relative_tolerance),
+            ]
+        )
+
     def children(self) -> List[ToleranceInterface]:
         return self._children
 
+    def absolute_and_relative(self) -> Optional[Tuple[float, float]]:
+        """ The largest absolute and relative tolerance of the children, if
+        they all have them """
+        absolute_tolerance = 0.0
+        relative_tolerance = 0.0
+
+        for child in self._children:
+            tolerances = child.absolute_and_relative()
+            if tolerances is None:
+                return None
+
+            absolute_tolerance = max(absolute_tolerance, tolerances[0])
+            relative_tolerance = max(relative_tolerance, tolerances[1])
+
+        return absolute_tolerance, relative_tolerance
+
+    def cache_key(self) -> Hashable:
+        return (
+            "DisjunctionTolerance",
+            tuple(child.cache_key() for child in self._children),
+        )
+
     def within_tolerance(self, value: float, reference: float) -> bool:
         for child in self._children:
             if child.within_tolerance(value, reference):
@@ -19,5 +60,13 @@ class DisjunctionTolerance(ToleranceInterface):
 
         return False
 
+    def within_tolerance_batch(self, values: ndarray, references: ndarray) -> ndarray:
+        result = full(broadcast(values, references).shape, False)
+
+        for child in self._children:
+            result = result | child.within_tolerance_batch(values, references)
+
+        return result
+
 
 __all__ = ["DisjunctionTolerance"]
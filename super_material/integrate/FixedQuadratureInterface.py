@@ -1,17 +1,22 @@
 from abc import ABC, abstractmethod
 
-from typing import List
+from numpy import ndarray
 
 
 class FixedQuadratureInterface(ABC):
+    """ Quadrature rule with fixed points on the interval [-1, 1] """
+
     @abstractmethod
-    def weights(self) -> List[float]:
+    def weights(self) -> ndarray:
         """ Returns the weights of the quadratures points """
 
     @abstractmethod
-    def abscissae(self) -> List[float]:
-        """ Returns the weights of the quadrature points """
+    def abscissae(self) -> ndarray:
+        """ Returns the abscissae of the quadrature points """
 
     @abstractmethod
     def num_quadrature_points(self) -> int:
         """ The number of quadrature points in the fixed quadrature """
+
+
+__all__ = ["FixedQuadratureInterface"]
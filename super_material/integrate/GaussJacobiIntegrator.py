@@ -0,0 +1,204 @@
+from math import inf
+from time import perf_counter
+from typing import Hashable, List, Optional, Sequence
+from warnings import warn
+
+from numpy import arange, array, full, ndarray, zeros
+
+from .DisjunctionTolerance import DisjunctionTolerance
+from .GaussJacobiQuadrature import GaussJacobiQuadrature
+from .IntegrandFamily import IntegrandFamily
+from .IntegratorInterface import IntegratorInterface
+from .IntegrandInterface import IntegrandInterface
+from .IntegrationResult import IntegrationResult
+from .ToleranceInterface import ToleranceInterface
+
+
+class GaussJacobiIntegrator(IntegratorInterface):
+    """ Gauss-Jacobi integrator for integrands with endpoint singularities
+
+    Reads the endpoint exponents :math:`(\\alpha, \\beta)` of the integrand
+    and integrates the remainder
+    :math:`f(x) (x - a)^{-\\alpha} (b - x)^{-\\beta}` with the Gauss-Jacobi
+    rule of the same exponents, so that algebraic endpoint singularities such
+    as the inverse square roots at the gap edges are integrated by the weight
+    function without a change of variables. The abscissae stay away from the
+    endpoints, where the integrand is never evaluated.
+
+    The order is doubled from the minimum order until two successive
+    estimates are within the tolerance, which defaults to the absolute
+    tolerance or the relative tolerance, whichever is met first. For a smooth
+    remainder a low order is enough.
+    """
+
+    _tolerance: ToleranceInterface
+    _minimum_order: int
+    _maximum_order: int
+
+    def __init__(
+        self,
+        absolute_tolerance: float = 1.49e-8,
+        relative_tolerance: float = 1.49e-8,
+        minimum_order: int = 8,
+        maximum_order: int = 256,
+        tolerance: Optional[ToleranceInterface] = None,
+    ):
+        assert 0 < minimum_order <= maximum_order
+
+        if tolerance is None:
+            tolerance = DisjunctionTolerance.absolute_or_relative(
+                absolute_tolerance, relative_tolerance
+            )
+
+        self._tolerance = tolerance
+        self._minimum_order = minimum_order
+        self._maximum_order = maximum_order
+
+    def tolerance(self) -> ToleranceInterface:
+        return self._tolerance
+
+    def cache_key(self) -> Hashable:
+        return (
+            "GaussJacobiIntegrator",
+            self._tolerance.cache_key(),
+            self._minimum_order,
+            self._maximum_order,
+        )
+
+    def integrate_order(self, integrand: IntegrandInterface, order: int):
+        """ Integrate with the Gauss-Jacobi rule of an order """
+        interval = integrand.interval()
+        start = interval.start().value()
+        end = interval.end().value()
+        lower_exponent, upper_exponent = integrand.endpoint_exponents()
+
+        quadrature = GaussJacobiQuadrature(order, lower_exponent, upper_exponent)
+        half_width = (end - start) / 2
+        abscissae = quadrature.abscissae()
+        points = start + half_width * (1 + abscissae)
+
+        # Remove the weight function from the integrand
+        weight = (1 + abscissae) ** lower_exponent * (1 - abscissae) ** upper_exponent
+        values = integrand.evaluate_batch(points) / weight
+
+        # Summed by rows rather than multiplied by the weights, so that an
+        # integral does not depend on the integrals evaluated with it
+        return half_width * (values * quadrature.weights()).sum(axis=-1)
+
+    def integrate(self, integrand: IntegrandInterface) -> float:
+        return self.integrate_with_info(integrand).value()
+
+    def integrate_with_info(self, integrand: IntegrandInterface) -> IntegrationResult:
+        result = self.integrate_orders(integrand)
+
+        if not result.converged():
+            warn(
+                f"Maximum order ({self._maximum_order}) reached, the difference "
+                f"between the last two estimates is {result.error()}",
+                RuntimeWarning,
+            )
+
+        return result
+
+    def integrate_orders(self, integrand: IntegrandInterface) -> IntegrationResult:
+        """ Integrate with doubling orders without warning when the maximum order
+        is reached, for callers that fall back to another integrator """
+        wall_time_start = perf_counter()
+        order = self._minimum_order
+        integral = self.integrate_order(integrand, order)
+        evaluations = order
+        error = inf
+        converged = False
+
+        while 2 * order <= self._maximum_order:
+            order *= 2
+            previous = integral
+            integral = self.integrate_order(integrand, order)
+            evaluations += order
+
+            error = abs(integral - previous)
+
+            if self._tolerance.within_tolerance(integral, previous):
+                converged = True
+                break
+
+        wall_time = perf_counter() - wall_time_start
+        return IntegrationResult(integral, error, evaluations, 1, wall_time, converged)
+
+    def integrate_family_order(
+        self, family: IntegrandFamily, members: ndarray, order: int
+    ) -> ndarray:
+        """ Integrate the members of a family with the Gauss-Jacobi rule of an
+        order, in one evaluation of the family """
+        intervals = [family.members()[member].interval() for member in members]
+        starts = array([interval.start().value() for interval in intervals])
+        ends = array([interval.end().value() for interval in intervals])
+        lower_exponent, upper_exponent = family.members()[0].endpoint_exponents()
+
+        quadrature = GaussJacobiQuadrature(order, lower_exponent, upper_exponent)
+        half_widths = (ends - starts) / 2
+        abscissae = quadrature.abscissae()
+        points = starts[:, None] + half_widths[:, None] * (1 + abscissae)
+
+        # Remove the weight function from the integrands
+        weight = (1 + abscissae) ** lower_exponent * (1 - abscissae) ** upper_exponent
+        values = family.evaluate_members(members, points) / weight
+
+        return half_widths * (values * quadrature.weights()).sum(axis=-1)
+
+    def integrate_family_orders(
+        self,
+        family: IntegrandFamily,
+        tolerances: Optional[Sequence[ToleranceInterface]] = None,
+    ) -> List[IntegrationResult]:
+        """ Integrate each of the members of a family with doubling orders
+        without warning, as by :meth:`integrate_orders`
+
+        The members that have not converged are evaluated with a single call
+        to the family at each order. The members share the endpoint exponents
+        of the first member. The tolerances default to the tolerance of the
+        integrator, and the wall time is shared equally by the members.
+        """
+        wall_time_start = perf_counter()
+        size = family.size()
+        if tolerances is None:
+            tolerances = [self._tolerance] * size
+
+        order = self._minimum_order
+        active = arange(size)
+        integrals = self.integrate_family_order(family, active, order)
+        errors = full(size, inf)
+        evaluations = full(size, order)
+        converged = zeros(size, dtype=bool)
+
+        while len(active) and 2 * order <= self._maximum_order:
+            order *= 2
+            previous = integrals[active]
+            integrals[active] = self.integrate_family_order(family, active, order)
+            evaluations[active] += order
+            errors[active] = abs(integrals[active] - previous)
+
+            for member, integral, previous_integral in zip(
+                active, integrals[active], previous
+            ):
+                converged[member] = tolerances[member].within_tolerance(
+                    integral, previous_integral
+                )
+
+            active = active[~converged[active]]
+
+        wall_time = (perf_counter() - wall_time_start) / max(size, 1)
+        return [
+            IntegrationResult(
+                integrals[member],
+                errors[member],
+                int(evaluations[member]),
+                1,
+                wall_time,
+                bool(converged[member]),
+            )
+            for member in range(size)
+        ]
+
+
+__all__ = ["GaussJacobiIntegrator"]
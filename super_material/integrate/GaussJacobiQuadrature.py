@@ -0,0 +1,70 @@
+from functools import lru_cache
+from typing import Tuple
+
+from numpy import ndarray
+
+from .FixedQuadratureInterface import FixedQuadratureInterface
+
+
+@lru_cache(maxsize=None)
+def gauss_jacobi_rule(
+    order: int, lower_exponent: float, upper_exponent: float
+) -> Tuple[ndarray, ndarray]:
+    """ Gauss-Jacobi abscissae and weights on [-1, 1] """
+    from scipy.special import roots_jacobi
+
+    abscissae, weights = roots_jacobi(order, upper_exponent, lower_exponent)
+    abscissae.flags.writeable = False
+    weights.flags.writeable = False
+    return abscissae, weights
+
+
+class GaussJacobiQuadrature(FixedQuadratureInterface):
+    """ Gauss-Jacobi quadrature of an order
+
+    Integrates :math:`(1 + x)^{\\alpha} (1 - x)^{\\beta} p(x)` on
+    :math:`[-1, 1]` exactly for polynomials :math:`p` up to degree
+    :math:`2 n - 1`, with :math:`\\alpha` the exponent at the lower and
+    :math:`\\beta` the exponent at the upper end of the interval. The weights
+    include the weight function. The abscissae and weights are computed once
+    per order and exponents.
+    """
+
+    _order: int
+    _lower_exponent: float
+    _upper_exponent: float
+    _abscissae: ndarray
+    _weights: ndarray
+
+    def __init__(self, order: int, lower_exponent: float, upper_exponent: float):
+        assert order > 0
+        assert lower_exponent > -1
+        assert upper_exponent > -1
+
+        self._order = order
+        self._lower_exponent = lower_exponent
+        self._upper_exponent = upper_exponent
+        self._abscissae, self._weights = gauss_jacobi_rule(
+            order, lower_exponent, upper_exponent
+        )
+
+    def order(self) -> int:
+        return self._order
+
+    def lower_exponent(self) -> float:
+        return self._lower_exponent
+
+    def upper_exponent(self) -> float:
+        return self._upper_exponent
+
+    def weights(self) -> ndarray:
+        return self._weights
+
+    def abscissae(self) -> ndarray:
+        return self._abscissae
+
+    def num_quadrature_points(self) -> int:
+        return self._order
+
+
+__all__ = ["GaussJacobiQuadrature"]
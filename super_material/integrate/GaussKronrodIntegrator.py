@@ -0,0 +1,405 @@
+from time import perf_counter
+from typing import Hashable, List, Optional, Sequence, Tuple
+from warnings import warn
+
+from numpy import (
+    arange,
+    argsort,
+    concatenate,
+    cumsum,
+    isfinite,
+    isin,
+    ndarray,
+    ones,
+    repeat,
+    stack,
+)
+
+from .DisjunctionTolerance import DisjunctionTolerance
+from .GaussKronrodQuadrature import GaussKronrodQuadrature
+from .IntegrandFamily import IntegrandFamily
+from .IntegratorInterface import IntegratorInterface
+from .IntegrandInterface import IntegrandInterface
+from .IntegrationResult import IntegrationResult
+from .ToleranceInterface import ToleranceInterface
+
+
+class GaussKronrodIntegrator(IntegratorInterface):
+    """ Globally adaptive Gauss-Kronrod integrator
+
+    The interval is split into panels, each integrated with the Gauss-Kronrod
+    rule. The difference between the Kronrod and the embedded Gauss estimate
+    is the error estimate of a panel. The panels with the largest errors are
+    bisected until the integral is within the tolerance of the integral plus
+    the total error. The tolerance defaults to the absolute tolerance or the
+    relative tolerance, whichever is met first.
+
+    All the panels of a refinement are evaluated with a single call to the
+    batch evaluation of the integrand, so complex valued and vectorised
+    integrands are integrated with only a few Python level calls.
+
+    A panel too narrow to be bisected in floating point is not refined
+    further, and the points of such a panel may round onto its ends. A panel
+    whose halves do not have finite estimates keeps its own estimate and is
+    not refined further either, and the result is then not converged.
+    """
+
+    _tolerance: ToleranceInterface
+    _limit: int
+    _quadrature: GaussKronrodQuadrature
+
+    def __init__(
+        self,
+        absolute_tolerance: float = 1.49e-8,
+        relative_tolerance: float = 1.49e-8,
+        limit: int = 50,
+        order: int = 7,
+        tolerance: Optional[ToleranceInterface] = None,
+    ):
+        assert limit > 0
+
+        if tolerance is None:
+            tolerance = DisjunctionTolerance.absolute_or_relative(
+                absolute_tolerance, relative_tolerance
+            )
+
+        self._tolerance = tolerance
+        self._limit = limit
+        self._quadrature = GaussKronrodQuadrature(order)
+
+    def tolerance(self) -> ToleranceInterface:
+        return self._tolerance
+
+    def cache_key(self) -> Hashable:
+        return (
+            "GaussKronrodIntegrator",
+            self._tolerance.cache_key(),
+            self._limit,
+            self._quadrature.order(),
+        )
+
+    def quadrature(self) -> GaussKronrodQuadrature:
+        return self._quadrature
+
+    def integrate_panels(self, integrand: IntegrandInterface, panels: ndarray):
+        """ Integrate each of the panels with the Kronrod and the Gauss rule
+
+        The panels are given by their start and end points. Returns the
+        Kronrod estimates and the error estimates of the panels.
+        """
+        centres = (panels[:, 0] + panels[:, 1]) / 2
+        half_widths = (panels[:, 1] - panels[:, 0]) / 2
+
+        abscissae = self._quadrature.abscissae()
+        points = centres[:, None] + half_widths[:, None] * abscissae
+        values = integrand.evaluate_batch(points.ravel()).reshape(points.shape)
+
+        # Summed by rows rather than multiplied by the weights, so that an
+        # integral does not depend on the integrals evaluated with it
+        kronrod = half_widths * (values * self._quadrature.weights()).sum(axis=-1)
+        gauss = half_widths * (values * self._quadrature.gauss_weights()).sum(axis=-1)
+
+        return kronrod, abs(kronrod - gauss)
+
+    def bisect_panels(
+        self,
+        tolerance: ToleranceInterface,
+        panels: ndarray,
+        errors: ndarray,
+        refinable: ndarray,
+        integral: float,
+        error: float,
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """ Bisect the fewest refinable panels with the largest errors such
+        that the remaining panels are within half the tolerance
+
+        Panels whose midpoint rounds onto one of their ends are marked as not
+        refinable. Returns the indices of the panels that are kept, the
+        indices of the bisected panels and the new panels, the first halves
+        of the bisected panels followed by their second halves.
+        """
+        starts = panels[:, 0]
+        ends = panels[:, 1]
+        middles = (starts + ends) / 2
+        refinable &= (middles != starts) & (middles != ends)
+
+        order = argsort(errors)[::-1]
+        indices = order[refinable[order]]
+        remaining = error - cumsum(errors[indices])
+        within = tolerance.within_tolerance_batch(integral, integral + 2 * remaining)
+        count = min(int((~within).sum()) + 1, len(indices))
+        count = min(count, self._limit - len(panels))
+
+        bisect = indices[:count]
+        keep = order[~isin(order, bisect)]
+        new_panels = concatenate(
+            [
+                stack([starts[bisect], middles[bisect]], axis=1),
+                stack([middles[bisect], ends[bisect]], axis=1),
+            ]
+        )
+
+        return keep, bisect, new_panels
+
+    @staticmethod
+    def merge_panels(
+        panels: ndarray,
+        integrals: ndarray,
+        errors: ndarray,
+        refinable: ndarray,
+        keep: ndarray,
+        bisect: ndarray,
+        new_panels: ndarray,
+        new_integrals: ndarray,
+        new_errors: ndarray,
+    ) -> Tuple[ndarray, ndarray, ndarray, ndarray, bool]:
+        """ Replace the bisected panels with their halves
+
+        A bisected panel whose halves do not have finite estimates is kept
+        with its own estimate and marked as not refinable. Returns the
+        panels, their estimates, errors and refinability, and whether the
+        halves of any panel were not finite.
+        """
+        count = len(bisect)
+        finite = isfinite(new_integrals) & isfinite(new_errors)
+        finite = finite[:count] & finite[count:]
+
+        failed = bisect[~finite]
+        keep = concatenate([keep, failed])
+        refinable[failed] = False
+        halves = concatenate([finite, finite])
+
+        return (
+            concatenate([panels[keep], new_panels[halves]]),
+            concatenate([integrals[keep], new_integrals[halves]]),
+            concatenate([errors[keep], new_errors[halves]]),
+            concatenate([refinable[keep], ones(halves.sum(), dtype=bool)]),
+            not finite.all(),
+        )
+
+    def integrate(self, integrand: IntegrandInterface) -> float:
+        return self.integrate_with_info(integrand).value()
+
+    def integrate_with_info(self, integrand: IntegrandInterface) -> IntegrationResult:
+        interval = integrand.interval()
+        start = interval.start().value()
+        end = interval.end().value()
+
+        wall_time_start = perf_counter()
+        panels = stack([[start], [end]], axis=1)
+        integrals, errors = self.integrate_panels(integrand, panels)
+        refinable = ones(1, dtype=bool)
+        evaluated_panels = 1
+        failed = False
+
+        while True:
+            integral = integrals.sum()
+            error = errors.sum()
+
+            converged = self._tolerance.within_tolerance(integral, integral + error)
+            if converged:
+                break
+
+            if len(panels) >= self._limit:
+                warn(
+                    f"Maximum number of panels ({self._limit}) reached, the "
+                    f"error estimate {error} is not within the tolerance",
+                    RuntimeWarning,
+                )
+                break
+
+            keep, bisect, new_panels = self.bisect_panels(
+                self._tolerance, panels, errors, refinable, integral, error
+            )
+            if not len(bisect):
+                warn(
+                    "No panel can be refined further, the error estimate "
+                    f"{error} is not within the tolerance",
+                    RuntimeWarning,
+                )
+                break
+
+            new_integrals, new_errors = self.integrate_panels(integrand, new_panels)
+            evaluated_panels += len(new_panels)
+
+            panels, integrals, errors, refinable, split_failed = self.merge_panels(
+                panels,
+                integrals,
+                errors,
+                refinable,
+                keep,
+                bisect,
+                new_panels,
+                new_integrals,
+                new_errors,
+            )
+            failed = failed or split_failed
+
+        if failed:
+            warn(
+                "The integrand is not finite on the halves of some of the "
+                "panels, their estimates are kept unrefined",
+                RuntimeWarning,
+            )
+            converged = False
+
+        return IntegrationResult(
+            integral,
+            error,
+            evaluated_panels * self._quadrature.num_quadrature_points(),
+            len(panels),
+            perf_counter() - wall_time_start,
+            converged,
+        )
+
+    def integrate_family_panels(
+        self, family: IntegrandFamily, members: ndarray, panels: ndarray
+    ):
+        """ Integrate each of the panels of the members of a family with the
+        Kronrod and the Gauss rule, in one evaluation of the family """
+        centres = (panels[:, 0] + panels[:, 1]) / 2
+        half_widths = (panels[:, 1] - panels[:, 0]) / 2
+
+        abscissae = self._quadrature.abscissae()
+        points = centres[:, None] + half_widths[:, None] * abscissae
+        values = family.evaluate_members(members, points)
+
+        kronrod = half_widths * (values * self._quadrature.weights()).sum(axis=-1)
+        gauss = half_widths * (values * self._quadrature.gauss_weights()).sum(axis=-1)
+
+        return kronrod, abs(kronrod - gauss)
+
+    def integrate_family_with_info(
+        self,
+        family: IntegrandFamily,
+        tolerances: Optional[Sequence[ToleranceInterface]] = None,
+    ) -> List[IntegrationResult]:
+        """ Integrate each of the members of a family to its tolerance
+
+        The members are refined as by :meth:`integrate_with_info`, but the
+        panels of all the members of a refinement are evaluated with a single
+        call to the family. The tolerances default to the tolerance of the
+        integrator, and the wall time is shared equally by the members.
+        """
+        wall_time_start = perf_counter()
+        size = family.size()
+        if tolerances is None:
+            tolerances = [self._tolerance] * size
+
+        panels = []
+        for member in family.members():
+            interval = member.interval()
+            start = interval.start().value()
+            end = interval.end().value()
+            panels.append(stack([[start], [end]], axis=1))
+
+        members = arange(size)
+        all_integrals, all_errors = self.integrate_family_panels(
+            family, members, concatenate(panels)
+        )
+        integrals = list(all_integrals[:, None])
+        errors = list(all_errors[:, None])
+        refinable = [ones(1, dtype=bool) for _ in range(size)]
+        evaluated_panels = [1] * size
+        failed = [False] * size
+
+        outcomes: List[Optional[Tuple[float, float, bool]]] = [None] * size
+        active = list(range(size))
+
+        while active:
+            refined = []
+            bisections = []
+
+            for member in active:
+                integral = integrals[member].sum()
+                error = errors[member].sum()
+                tolerance = tolerances[member]
+
+                converged = tolerance.within_tolerance(integral, integral + error)
+                if converged or len(panels[member]) >= self._limit:
+                    outcomes[member] = integral, error, converged
+                    continue
+
+                keep, bisect, member_panels = self.bisect_panels(
+                    tolerance,
+                    panels[member],
+                    errors[member],
+                    refinable[member],
+                    integral,
+                    error,
+                )
+                if not len(bisect):
+                    outcomes[member] = integral, error, False
+                    continue
+
+                refined.append(member)
+                bisections.append((keep, bisect, member_panels))
+
+            if not refined:
+                break
+
+            counts = [len(member_panels) for _, _, member_panels in bisections]
+            new_integrals, new_errors = self.integrate_family_panels(
+                family,
+                repeat(refined, counts),
+                concatenate([member_panels for _, _, member_panels in bisections]),
+            )
+            offsets = cumsum([0] + counts)
+
+            for member, (keep, bisect, member_panels), start, end in zip(
+                refined, bisections, offsets[:-1], offsets[1:]
+            ):
+                evaluated_panels[member] += len(member_panels)
+                (
+                    panels[member],
+                    integrals[member],
+                    errors[member],
+                    refinable[member],
+                    split_failed,
+                ) = self.merge_panels(
+                    panels[member],
+                    integrals[member],
+                    errors[member],
+                    refinable[member],
+                    keep,
+                    bisect,
+                    member_panels,
+                    new_integrals[start:end],
+                    new_errors[start:end],
+                )
+                failed[member] = failed[member] or split_failed
+
+            active = refined
+
+        outcomes = [
+            (integral, error, converged and not failed[member])
+            for member, (integral, error, converged) in enumerate(outcomes)
+        ]
+        unconverged = [
+            member for member, outcome in enumerate(outcomes) if not outcome[2]
+        ]
+        if unconverged:
+            warn(
+                f"{len(unconverged)} of the {size} integrands reached the "
+                f"maximum number of panels ({self._limit}), could not be "
+                "refined further or were not finite on the halves of some of "
+                "their panels, their error estimates are not within the "
+                "tolerance",
+                RuntimeWarning,
+            )
+
+        wall_time = (perf_counter() - wall_time_start) / max(size, 1)
+        return [
+            IntegrationResult(
+                integral,
+                error,
+                evaluated_panels[member] * self._quadrature.num_quadrature_points(),
+                len(panels[member]),
+                wall_time,
+                converged,
+            )
+            for member, (integral, error, converged) in enumerate(outcomes)
+        ]
+
+
+__all__ = ["GaussKronrodIntegrator"]
@@ -0,0 +1,156 @@
+from functools import lru_cache
+from typing import Tuple
+
+from numpy import arange, ceil, cumsum, diag, floor, ndarray, sqrt, zeros
+from numpy.linalg import eigh
+
+from .FixedQuadratureInterface import FixedQuadratureInterface
+from .GaussLegendreQuadrature import gauss_legendre_rule
+
+
+def legendre_recurrence(size: int) -> Tuple[ndarray, ndarray]:
+    """ Recurrence coefficients of the monic Legendre polynomials
+
+    Returns the coefficients :math:`a_{k}` and :math:`b_{k}` of
+    :math:`p_{k + 1}(x) = (x - a_{k}) p_{k}(x) - b_{k} p_{k - 1}(x)`, with
+    :math:`b_{0}` the integral of the weight function.
+    """
+    k = arange(size, dtype=float)
+    a = zeros(size)
+    b = zeros(size)
+    b[0] = 2
+    b[1:] = k[1:] ** 2 / (4 * k[1:] ** 2 - 1)
+    return a, b
+
+
+def kronrod_recurrence(order: int) -> Tuple[ndarray, ndarray]:
+    """ Recurrence coefficients of the Kronrod extension of a Gauss rule
+
+    Laurie's algorithm :cite:`LaurieKronrod` computes the Jacobi matrix of the
+    :math:`2 n + 1` point Kronrod rule from the recurrence coefficients of the
+    Legendre polynomials.
+    """
+    n = order
+    a0, b0 = legendre_recurrence(int(ceil(3 * n / 2)) + 1)
+
+    a = zeros(2 * n + 1)
+    b = zeros(2 * n + 1)
+    a[: int(floor(3 * n / 2)) + 1] = a0[: int(floor(3 * n / 2)) + 1]
+    b[: int(ceil(3 * n / 2)) + 1] = b0[: int(ceil(3 * n / 2)) + 1]
+
+    s = zeros(n // 2 + 2)
+    t = zeros(n // 2 + 2)
+    t[1] = b[n + 1]
+
+    for m in range(n - 1):
+        k = arange((m + 1) // 2, -1, -1)
+        l = m - k
+        s[k + 1] = cumsum(
+            (a[k + n + 1] - a[l]) * t[k + 1] + b[k + n + 1] * s[k] - b[l] * s[k + 1]
+        )
+        s, t = t, s
+
+    j = arange(n // 2, -1, -1)
+    s[j + 1] = s[j]
+
+    for m in range(n - 1, 2 * n - 2):
+        k = arange(m + 1 - n, (m - 1) // 2 + 1)
+        l = m - k
+        j = n - 1 - l
+        s[j + 1] = cumsum(
+            -(a[k + n + 1] - a[l]) * t[j + 1]
+            - b[k + n + 1] * s[j + 1]
+            + b[l] * s[j + 2]
+        )
+        j = j[-1]
+        k = (m + 1) // 2
+
+        if m % 2 == 0:
+            a[k + n + 1] = a[k] + (s[j + 1] - b[k + n + 1] * s[j + 2]) / t[j + 2]
+        else:
+            b[k + n + 1] = s[j + 1] / s[j + 2]
+
+        s, t = t, s
+
+    a[2 * n] = a[n - 1] - b[2 * n] * s[1] / t[1]
+
+    return a, b
+
+
+@lru_cache(maxsize=None)
+def gauss_kronrod_rule(order: int) -> Tuple[ndarray, ndarray, ndarray]:
+    """ Gauss-Kronrod abscissae and weights on [-1, 1]
+
+    Returns the :math:`2 n + 1` Kronrod abscissae, the Kronrod weights and the
+    weights of the embedded :math:`n` point Gauss rule on the same abscissae,
+    which are zero on the abscissae only used by the Kronrod rule.
+    """
+    a, b = kronrod_recurrence(order)
+
+    # Golub-Welsch
+    off_diagonal = sqrt(b[1:])
+    jacobi = diag(a) + diag(off_diagonal, 1) + diag(off_diagonal, -1)
+    abscissae, vectors = eigh(jacobi)
+    weights = b[0] * vectors[0] ** 2
+
+    # The abscissae are in ascending order. Symmetrise them to remove the
+    # rounding of the eigenvalue solver.
+    abscissae = (abscissae - abscissae[::-1]) / 2
+    weights = (weights + weights[::-1]) / 2
+
+    # The Gauss abscissae are the odd Kronrod abscissae
+    _, legendre_weights = gauss_legendre_rule(order)
+    gauss_weights = zeros(2 * order + 1)
+    gauss_weights[1::2] = legendre_weights
+
+    rule = (abscissae, weights, gauss_weights)
+
+    for array in rule:
+        array.flags.writeable = False
+
+    return rule
+
+
+class GaussKronrodQuadrature(FixedQuadratureInterface):
+    """ Gauss-Kronrod quadrature of an order
+
+    Extends the :math:`n` point Gauss-Legendre rule with :math:`n + 1`
+    abscissae to a :math:`2 n + 1` point rule, which integrates polynomials up
+    to degree :math:`3 n + 1` exactly. The difference between the two rules is
+    an error estimate that reuses every integrand evaluation. The abscissae
+    and weights are computed once per order and shared by all the quadratures
+    of that order.
+    """
+
+    _order: int
+    _abscissae: ndarray
+    _weights: ndarray
+    _gauss_weights: ndarray
+
+    def __init__(self, order: int = 7):
+        assert order > 0
+
+        self._order = order
+        (self._abscissae, self._weights, self._gauss_weights,) = gauss_kronrod_rule(
+            order
+        )
+
+    def order(self) -> int:
+        """ The number of points of the embedded Gauss rule """
+        return self._order
+
+    def weights(self) -> ndarray:
+        return self._weights
+
+    def gauss_weights(self) -> ndarray:
+        """ Weights of the embedded Gauss rule on the Kronrod abscissae """
+        return self._gauss_weights
+
+    def abscissae(self) -> ndarray:
+        return self._abscissae
+
+    def num_quadrature_points(self) -> int:
+        return 2 * self._order + 1
+
+
+__all__ = ["GaussKronrodQuadrature"]
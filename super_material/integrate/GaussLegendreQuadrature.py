@@ -0,0 +1,50 @@
+from functools import lru_cache
+from typing import Tuple
+
+from numpy import ndarray
+from numpy.polynomial.legendre import leggauss
+
+from .FixedQuadratureInterface import FixedQuadratureInterface
+
+
+@lru_cache(maxsize=None)
+def gauss_legendre_rule(order: int) -> Tuple[ndarray, ndarray]:
+    """ Gauss-Legendre abscissae and weights on [-1, 1] """
+    abscissae, weights = leggauss(order)
+    abscissae.flags.writeable = False
+    weights.flags.writeable = False
+    return abscissae, weights
+
+
+class GaussLegendreQuadrature(FixedQuadratureInterface):
+    """ Gauss-Legendre quadrature of an order
+
+    Integrates polynomials up to degree :math:`2 n - 1` exactly with
+    :math:`n` points. The abscissae and weights are computed once per order
+    and shared by all the quadratures of that order.
+    """
+
+    _order: int
+    _abscissae: ndarray
+    _weights: ndarray
+
+    def __init__(self, order: int):
+        assert order > 0
+
+        self._order = order
+        self._abscissae, self._weights = gauss_legendre_rule(order)
+
+    def order(self) -> int:
+        return self._order
+
+    def weights(self) -> ndarray:
+        return self._weights
+
+    def abscissae(self) -> ndarray:
+        return self._abscissae
+
+    def num_quadrature_points(self) -> int:
+        return self._order
+
+
+__all__ = ["GaussLegendreQuadrature"]
@@ -0,0 +1,42 @@
+from typing import Callable, List, Sequence
+
+from numpy import ndarray
+
+from .IntegrandInterface import IntegrandInterface
+
+
+class IntegrandFamily:
+    """ Integrands differing in a parameter, evaluated together
+
+    The members are the integrands of each of the parameters, which give the
+    intervals and the endpoint exponents of the integrals. The batch integrand
+    of the indices of some members evaluates each row of a two dimensional
+    array of points with the integrand of the member of the row, which is what
+    the integrands of the conductivities do with a column of parameters, so
+    that the points of all the members are evaluated in one call.
+    """
+
+    _members: List[IntegrandInterface]
+    _batch_integrand: Callable[[ndarray], IntegrandInterface]
+
+    def __init__(
+        self,
+        members: Sequence[IntegrandInterface],
+        batch_integrand: Callable[[ndarray], IntegrandInterface],
+    ):
+        self._members = list(members)
+        self._batch_integrand = batch_integrand
+
+    def members(self) -> List[IntegrandInterface]:
+        return self._members
+
+    def size(self) -> int:
+        return len(self._members)
+
+    def evaluate_members(self, indices: ndarray, points: ndarray) -> ndarray:
+        """ Evaluates each row of the points with the member of the index of
+        the row """
+        return self._batch_integrand(indices).evaluate_batch(points)
+
+
+__all__ = ["IntegrandFamily"]
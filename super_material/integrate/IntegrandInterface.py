@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Tuple
+
+from numpy import asarray, ndarray
 
 from .IntegrandInterval import IntegrandInterval
 
@@ -8,6 +11,26 @@ class IntegrandInterface(ABC):
     def evaluate(self, x: float) -> float:
         """ Evaluate the integrand """
 
+    def evaluate_batch(self, xs: ndarray) -> ndarray:
+        """ Evaluate the integrand at each of the points
+
+        Integrands that can be evaluated on arrays should override this, the
+        default evaluates the points one at a time.
+        """
+        xs = asarray(xs, dtype=float)
+        values = [self.evaluate(x) for x in xs.flat]
+        return asarray(values).reshape(xs.shape)
+
+    def endpoint_exponents(self) -> Tuple[float, float]:
+        """ Exponents of the algebraic behaviour at the interval endpoints
+
+        An integrand that behaves as :math:`(x - a)^{\\alpha}` at the start
+        :math:`a` and as :math:`(b - x)^{\\beta}` at the end :math:`b` of its
+        interval, with an otherwise smooth remainder, returns
+        :math:`(\\alpha, \\beta)`. The default is a smooth integrand.
+        """
+        return 0.0, 0.0
+
     @abstractmethod
     def interval(self) -> IntegrandInterval:
         """ Evaluate the integrand """
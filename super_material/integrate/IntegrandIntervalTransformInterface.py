@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from numpy import asarray, ndarray, vectorize
+
 from .IntegrandInterval import IntegrandInterval
 from .IntegrandBoundary import IntegrandBoundary
 
@@ -17,6 +19,16 @@ class IntegrandIntervalTransformInterface(ABC):
     def transform_derivative(self, x: float) -> float:
         """ Evaluates the first derivative of the transform """
 
+    def inverse_transform_batch(self, us: ndarray) -> ndarray:
+        """ Evaluates the inverse transform at each of the points """
+        us = asarray(us, dtype=float)
+        return vectorize(self.inverse_transform, otypes=[float])(us)
+
+    def transform_derivative_batch(self, xs: ndarray) -> ndarray:
+        """ Evaluates the first derivative of the transform at each of the points """
+        xs = asarray(xs, dtype=float)
+        return vectorize(self.transform_derivative, otypes=[float])(xs)
+
     def transform_boundary(self, boundary: IntegrandBoundary) -> IntegrandBoundary:
         transformed_value = self.transform(boundary.value())
         return IntegrandBoundary(transformed_value, boundary.defined_on_boundary())
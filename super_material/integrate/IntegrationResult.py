@@ -0,0 +1,67 @@
+class IntegrationResult:
+    """ Value of a definite integral with the diagnostics of the integration
+
+    The error is the estimate of the absolute error of the integrator, the
+    evaluations are the number of points the integrand was evaluated on and
+    the subdivisions are the number of subintervals the integration interval
+    was split into, which is one for integrators that do not subdivide. The
+    result is converged if the integrator stopped within its tolerance rather
+    than on one of its limits.
+    """
+
+    _value: float
+    _error: float
+    _evaluations: int
+    _subdivisions: int
+    _wall_time: float
+    _converged: bool
+
+    def __init__(
+        self,
+        value: float,
+        error: float,
+        evaluations: int,
+        subdivisions: int,
+        wall_time: float,
+        converged: bool,
+    ):
+        self._value = value
+        self._error = error
+        self._evaluations = evaluations
+        self._subdivisions = subdivisions
+        self._wall_time = wall_time
+        self._converged = converged
+
+    @classmethod
+    def exact(cls, value: float) -> "IntegrationResult":
+        """ Result of an integral known without integrating """
+        return cls(value, 0.0, 0, 0, 0.0, True)
+
+    def value(self) -> float:
+        return self._value
+
+    def error(self) -> float:
+        return self._error
+
+    def evaluations(self) -> int:
+        return self._evaluations
+
+    def subdivisions(self) -> int:
+        return self._subdivisions
+
+    def wall_time(self) -> float:
+        """ Wall time of the integration in seconds """
+        return self._wall_time
+
+    def converged(self) -> bool:
+        return self._converged
+
+    def __repr__(self) -> str:
+        return (
+            f"IntegrationResult(value={self._value!r}, error={self._error!r}, "
+            f"evaluations={self._evaluations}, subdivisions={self._subdivisions}, "
+            f"wall_time={self._wall_time!r}, converged={self._converged})"
+        )
+
+
+__all__ = ["IntegrationResult"]
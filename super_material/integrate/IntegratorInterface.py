@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
+from time import perf_counter
+from typing import Hashable
+from warnings import catch_warnings, simplefilter, warn_explicit
 
+from .CountingIntegrand import CountingIntegrand
 from .IntegrandInterface import IntegrandInterface
+from .IntegrationResult import IntegrationResult
 
 
 class IntegratorInterface(ABC):
@@ -8,5 +13,48 @@ class IntegratorInterface(ABC):
     def integrate(self, integrand: IntegrandInterface) -> float:
         """ Evaluate the definite integral """
 
+    def cache_key(self) -> Hashable:
+        """ Key of the configuration of the integrator
+
+        Integrators with equal keys integrate to the same results. The default
+        key is the integrator itself, which is only equal to itself.
+        """
+        return self
+
+    def integrate_with_info(self, integrand: IntegrandInterface) -> IntegrationResult:
+        """ Evaluate the definite integral with the diagnostics of the integration
+
+        Integrators should override this with their own error estimates, the
+        default counts the evaluations, has no error estimate and is converged
+        unless the integrator warns with a runtime or user warning, such as the
+        integration warnings of SciPy.
+        """
+        counting_integrand = CountingIntegrand(integrand)
+
+        start = perf_counter()
+        with catch_warnings(record=True) as warnings:
+            simplefilter("always")
+            value = self.integrate(counting_integrand)
+        wall_time = perf_counter() - start
+
+        for warning in warnings:
+            warn_explicit(
+                warning.message, warning.category, warning.filename, warning.lineno
+            )
+
+        converged = not any(
+            issubclass(warning.category, (RuntimeWarning, UserWarning))
+            for warning in warnings
+        )
+
+        return IntegrationResult(
+            value,
+            float("nan"),
+            counting_integrand.evaluations(),
+            1,
+            wall_time,
+            converged,
+        )
+
 
 __all__ = ["IntegratorInterface"]
@@ -1,3 +1,5 @@
+from numpy import asarray, full_like, ndarray
+
 from .IntegrandIntervalTransformInterface import IntegrandIntervalTransformInterface
 
 
@@ -24,5 +26,13 @@ class LinearIntegrandIntervalTransform(IntegrandIntervalTransformInterface):
     def transform_derivative(self, x: float) -> float:
         return self.m()
 
+    def inverse_transform_batch(self, us: ndarray) -> ndarray:
+        us = asarray(us, dtype=float)
+        return (us - self.c()) / self.m()
+
+    def transform_derivative_batch(self, xs: ndarray) -> ndarray:
+        xs = asarray(xs, dtype=float)
+        return full_like(xs, self.m())
+
 
 __all__ = ["LinearIntegrandIntervalTransform"]
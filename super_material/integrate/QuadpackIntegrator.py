@@ -1,40 +1,145 @@
-from scipy.integrate import quad
+from time import perf_counter
+from typing import Hashable, Optional
+from warnings import warn
 
 from .IntegratorInterface import IntegratorInterface
 from .IntegrandInterface import IntegrandInterface
+from .IntegrationResult import IntegrationResult
+from .ToleranceInterface import ToleranceInterface
+
+# Relative tolerances QUADPACK is asked for in turn when integrating to a
+# tolerance without an absolute and relative tolerance, down to the finest it
+# accepts in double precision
+PROGRESSIVE_RELATIVE_TOLERANCES = (1e-3, 1e-5, 1e-7, 1e-9, 1e-11, 1e-13)
+FINEST_RELATIVE_TOLERANCE = PROGRESSIVE_RELATIVE_TOLERANCES[-1]
 
 
 class QuadpackIntegrator(IntegratorInterface):
+    """ Adaptive integrator of QUADPACK
+
+    QUADPACK stops at the larger of the absolute tolerance and the relative
+    tolerance times the integral. If a tolerance is given instead, QUADPACK is
+    given its absolute and relative tolerance, with the relative tolerance no
+    finer than QUADPACK accepts without an absolute tolerance. Tolerances
+    without them, such as conjunctions, are integrated to progressively
+    tighter relative tolerances until the integral is within the tolerance of
+    the integral plus its error estimate.
+    """
+
     _absolute_tolerance: float
     _relative_tolerance: float
     _limit: int
+    _tolerance: Optional[ToleranceInterface]
 
     def __init__(
         self,
         absolute_tolerance: float = 1.49e-8,
         relative_tolerance: float = 1.49e-8,
         limit: int = 50,
+        tolerance: Optional[ToleranceInterface] = None,
     ):
         self._absolute_tolerance = absolute_tolerance
         self._relative_tolerance = relative_tolerance
         self._limit = limit
+        self._tolerance = tolerance
+
+    def tolerance(self) -> Optional[ToleranceInterface]:
+        return self._tolerance
+
+    def cache_key(self) -> Hashable:
+        tolerance_key = None
+        if self._tolerance is not None:
+            tolerance_key = self._tolerance.cache_key()
+
+        return (
+            "QuadpackIntegrator",
+            self._absolute_tolerance,
+            self._relative_tolerance,
+            self._limit,
+            tolerance_key,
+        )
 
     def integrate(self, integrand: IntegrandInterface) -> float:
+        return self.integrate_with_info(integrand).value()
+
+    def integrate_with_info(self, integrand: IntegrandInterface) -> IntegrationResult:
+        # SciPy is imported on the first integration rather than with the package
+        from scipy.integrate import IntegrationWarning, quad
+
         interval = integrand.interval()
         start = interval.start().value()
         end = interval.end().value()
         f = integrand.evaluate
 
-        output, _ = quad(
-            f,
-            start,
-            end,
-            epsabs=self._absolute_tolerance,
-            epsrel=self._relative_tolerance,
-            limit=self._limit,
-        )
+        wall_time_start = perf_counter()
 
-        return output
+        tolerances = self._absolute_tolerance, self._relative_tolerance
+        if self._tolerance is not None:
+            tolerances = self._tolerance.absolute_and_relative()
+
+            if tolerances is not None and tolerances[0] <= 0:
+                tolerances = 0, max(tolerances[1], FINEST_RELATIVE_TOLERANCE)
+
+        if tolerances is not None:
+            absolute_tolerance, relative_tolerance = tolerances
+
+            output, error, info, *message = quad(
+                f,
+                start,
+                end,
+                epsabs=absolute_tolerance,
+                epsrel=relative_tolerance,
+                limit=self._limit,
+                full_output=1,
+            )
+
+            # The full output keeps the message QUADPACK would warn with
+            converged = not message
+            if not converged:
+                warn(message[0], IntegrationWarning)
+
+            return IntegrationResult(
+                output,
+                error,
+                info["neval"],
+                info["last"],
+                perf_counter() - wall_time_start,
+                converged,
+            )
+
+        evaluations = 0
+        for relative_tolerance in PROGRESSIVE_RELATIVE_TOLERANCES:
+            # The full output keeps QUADPACK from warning about tolerances it
+            # does not reach, the tolerance decides on the result instead
+            output, error, info, *_ = quad(
+                f,
+                start,
+                end,
+                epsabs=0,
+                epsrel=relative_tolerance,
+                limit=self._limit,
+                full_output=1,
+            )
+            evaluations += info["neval"]
+
+            converged = self._tolerance.within_tolerance(output, output + error)
+            if converged:
+                break
+        else:
+            warn(
+                f"Finest relative tolerance ({relative_tolerance}) reached, the "
+                f"error estimate {error} is not within the tolerance",
+                RuntimeWarning,
+            )
+
+        return IntegrationResult(
+            output,
+            error,
+            evaluations,
+            info["last"],
+            perf_counter() - wall_time_start,
+            converged,
+        )
 
 
 __all__ = ["QuadpackIntegrator"]
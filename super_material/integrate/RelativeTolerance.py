@@ -1,7 +1,17 @@
+from typing import Hashable, Optional, Tuple
+
+from numpy import asarray, ndarray
+
 from .ToleranceInterface import ToleranceInterface
 
 
 class RelativeTolerance(ToleranceInterface):
+    """ Tolerance on the difference relative to the reference
+
+    A value is never within the tolerance of a zero reference, unless an
+    absolute tolerance is combined with it.
+    """
+
     _relative_tolerance: float
 
     def __init__(self, relative_tolerance: float):
@@ -10,10 +20,20 @@ class RelativeTolerance(ToleranceInterface):
     def relative_tolerance(self) -> float:
         return self._relative_tolerance
 
+    def absolute_and_relative(self) -> Optional[Tuple[float, float]]:
+        return 0.0, self._relative_tolerance
+
+    def cache_key(self) -> Hashable:
+        return ("RelativeTolerance", self._relative_tolerance)
+
     def within_tolerance(self, value: float, reference: float) -> bool:
         absolute_difference = abs(reference - value)
-        relative_difference = abs(absolute_difference / reference)
-        return relative_difference < self._relative_tolerance
+        return absolute_difference < self._relative_tolerance * abs(reference)
+
+    def within_tolerance_batch(self, values: ndarray, references: ndarray) -> ndarray:
+        references = asarray(references)
+        absolute_differences = abs(references - asarray(values))
+        return absolute_differences < self._relative_tolerance * abs(references)
 
 
 __all__ = ["RelativeTolerance"]
@@ -0,0 +1,50 @@
+from typing import Hashable, Optional, Tuple
+
+from numpy import asarray, ndarray
+
+from .ToleranceInterface import ToleranceInterface
+
+
+class ScaledTolerance(ToleranceInterface):
+    """ Tolerance applied to the values and references times a scale
+
+    Applies a tolerance given in the units of a result to an integral that
+    contributes to the result with the scale.
+    """
+
+    _child: ToleranceInterface
+    _scale: float
+
+    def __init__(self, child: ToleranceInterface, scale: float):
+        self._child = child
+        self._scale = scale
+
+    def child(self) -> ToleranceInterface:
+        return self._child
+
+    def scale(self) -> float:
+        return self._scale
+
+    def absolute_and_relative(self) -> Optional[Tuple[float, float]]:
+        tolerances = self._child.absolute_and_relative()
+        if tolerances is None:
+            return None
+
+        absolute_tolerance, relative_tolerance = tolerances
+        return absolute_tolerance / abs(self._scale), relative_tolerance
+
+    def cache_key(self) -> Hashable:
+        return ("ScaledTolerance", self._child.cache_key(), self._scale)
+
+    def within_tolerance(self, value: float, reference: float) -> bool:
+        return self._child.within_tolerance(
+            self._scale * value, self._scale * reference
+        )
+
+    def within_tolerance_batch(self, values: ndarray, references: ndarray) -> ndarray:
+        return self._child.within_tolerance_batch(
+            self._scale * asarray(values), self._scale * asarray(references)
+        )
+
+
+__all__ = ["ScaledTolerance"]
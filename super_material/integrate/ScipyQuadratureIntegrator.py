@@ -1,14 +1,30 @@
-from scipy.integrate import quadrature
-from numpy import vectorize
+from math import inf
+from time import perf_counter
+from typing import Hashable, Optional
+from warnings import warn
 
+from .DisjunctionTolerance import DisjunctionTolerance
+from .GaussLegendreQuadrature import GaussLegendreQuadrature
 from .IntegratorInterface import IntegratorInterface
 from .IntegrandInterface import IntegrandInterface
+from .IntegrationResult import IntegrationResult
+from .ToleranceInterface import ToleranceInterface
 
 
 class ScipyQuadratureIntegrator(IntegratorInterface):
-    _absolute_tolerance: float
-    _relative_tolerance: float
+    """ Gauss-Legendre quadrature of increasing order
+
+    Follows the deprecated ``scipy.integrate.quadrature``, which was removed
+    from SciPy. The order of the Gauss-Legendre rule is increased by one from
+    the minimum order until two successive estimates are within the
+    tolerance, or until the maximum order is reached. The tolerance defaults
+    to the absolute tolerance or the relative tolerance, whichever is met
+    first. The rules are shared between all integrals.
+    """
+
+    _tolerance: ToleranceInterface
     _maximum_order: int
+    _minimum_order: int
 
     def __init__(
         self,
@@ -16,29 +32,67 @@ class ScipyQuadratureIntegrator(IntegratorInterface):
         relative_tolerance: float = 1.49e-8,
         maximum_order: int = 50,
         minimum_order: int = 1,
+        tolerance: Optional[ToleranceInterface] = None,
     ):
-        self._absolute_tolerance = absolute_tolerance
-        self._relative_tolerance = relative_tolerance
+        if tolerance is None:
+            tolerance = DisjunctionTolerance.absolute_or_relative(
+                absolute_tolerance, relative_tolerance
+            )
+
+        self._tolerance = tolerance
         self._maximum_order = maximum_order
         self._minimum_order = minimum_order
 
+    def tolerance(self) -> ToleranceInterface:
+        return self._tolerance
+
+    def cache_key(self) -> Hashable:
+        return (
+            "ScipyQuadratureIntegrator",
+            self._tolerance.cache_key(),
+            self._minimum_order,
+            self._maximum_order,
+        )
+
     def integrate(self, integrand: IntegrandInterface) -> float:
+        return self.integrate_with_info(integrand).value()
+
+    def integrate_with_info(self, integrand: IntegrandInterface) -> IntegrationResult:
         interval = integrand.interval()
         start = interval.start().value()
         end = interval.end().value()
-        f = integrand.evaluate
-
-        output, _ = quadrature(
-            vectorize(f),
-            start,
-            end,
-            tol=self._absolute_tolerance,
-            rtol=self._relative_tolerance,
-            maxiter=self._maximum_order,
-            miniter=self._minimum_order,
-        )
+        f = integrand.evaluate_batch
+
+        centre = (start + end) / 2
+        half_width = (end - start) / 2
+
+        maximum_order = max(self._minimum_order + 1, self._maximum_order)
+
+        wall_time_start = perf_counter()
+        evaluations = 0
+        output = inf
+        for order in range(self._minimum_order, maximum_order + 1):
+            quadrature = GaussLegendreQuadrature(order)
+            points = centre + half_width * quadrature.abscissae()
+            new_output = half_width * (f(points) @ quadrature.weights())
+            evaluations += order
 
-        return output
+            error = abs(new_output - output)
+            previous, output = output, new_output
+
+            converged = self._tolerance.within_tolerance(output, previous)
+            if converged:
+                break
+        else:
+            warn(
+                f"Maximum order ({maximum_order}) reached, the difference "
+                f"between the last two estimates is {error}",
+                RuntimeWarning,
+            )
+
+        return IntegrationResult(
+            output, error, evaluations, 1, perf_counter() - wall_time_start, converged
+        )
 
 
 __all__ = ["ScipyQuadratureIntegrator"]
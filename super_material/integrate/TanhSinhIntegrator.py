@@ -0,0 +1,170 @@
+from functools import lru_cache
+from math import asinh, inf, log
+from time import perf_counter
+from typing import Hashable, Optional, Tuple
+from warnings import warn
+
+from numpy import arange, concatenate, cosh, exp, finfo, ndarray, pi, sinh
+
+from .DisjunctionTolerance import DisjunctionTolerance
+from .IntegratorInterface import IntegratorInterface
+from .IntegrandInterface import IntegrandInterface
+from .IntegrationResult import IntegrationResult
+from .ToleranceInterface import ToleranceInterface
+
+# Past this step the nodes are closer to the endpoints than the smallest normal
+# double, relative to the half width of the interval
+MAXIMUM_STEP = asinh(-log(finfo(float).tiny / 2) / pi)
+
+
+@lru_cache(maxsize=None)
+def tanh_sinh_level(level: int) -> Tuple[ndarray, ndarray, ndarray]:
+    """ Nodes of the tanh-sinh rule added at a level of refinement
+
+    Level zero has unit step size and all the nodes :math:`t = k` with
+    :math:`|t| \\le t_{max}`, every later level halves the step size and only
+    has the new nodes. For each node on the positive half line returns the
+    distance :math:`1 - \\tanh{(\\frac{\\pi}{2} \\sinh{t})}` to the end of
+    :math:`[-1, 1]` and the weight without the step size. The node at zero is
+    returned as the first node of level zero.
+    """
+    step = 2.0 ** -level
+
+    if level == 0:
+        t = arange(0, MAXIMUM_STEP, step)
+    else:
+        t = arange(step, MAXIMUM_STEP, 2 * step)
+
+    # The distance is computed from the exponential directly, since the
+    # hyperbolic tangent rounds to one
+    exponential = exp(-pi * sinh(t))
+    distances = 2 * exponential / (1 + exponential)
+    weights = pi / 2 * cosh(t) * distances * (2 - distances)
+
+    for array in (t, distances, weights):
+        array.flags.writeable = False
+
+    return t, distances, weights
+
+
+class TanhSinhIntegrator(IntegratorInterface):
+    """ Tanh-sinh or double exponential integrator
+
+    Substitutes :math:`x = \\tanh{(\\frac{\\pi}{2} \\sinh{t})}` on the
+    interval, which makes the integrand decay double exponentially in
+    :math:`t` and turns the trapezoidal rule in :math:`t` into a rule that
+    converges double exponentially, also for integrands with algebraic or
+    logarithmic singularities at the endpoints.
+
+    Each level halves the step size and only evaluates the new nodes, with a
+    single call to the batch evaluation of the integrand. Levels are added
+    until two successive estimates are within the tolerance, which defaults to
+    the absolute tolerance or the relative tolerance, whichever is met first.
+    The nodes are placed at their exact distances from the
+    endpoints, and nodes that round to an endpoint are only evaluated if the
+    integrand is defined on it.
+
+    The integrand only sees the nodes and not their distances from the
+    endpoints, so close to an endpoint away from zero the distance is only
+    known to the rounding of the endpoint. For an inverse square root
+    singularity this limits the relative accuracy to about the square root of
+    the machine precision, and singular integrands that cannot be evaluated
+    arbitrarily close to the endpoint still need an interval transform.
+    """
+
+    _tolerance: ToleranceInterface
+    _maximum_level: int
+
+    def __init__(
+        self,
+        absolute_tolerance: float = 1.49e-8,
+        relative_tolerance: float = 1.49e-8,
+        maximum_level: int = 10,
+        tolerance: Optional[ToleranceInterface] = None,
+    ):
+        assert maximum_level >= 0
+
+        if tolerance is None:
+            tolerance = DisjunctionTolerance.absolute_or_relative(
+                absolute_tolerance, relative_tolerance
+            )
+
+        self._tolerance = tolerance
+        self._maximum_level = maximum_level
+
+    def tolerance(self) -> ToleranceInterface:
+        return self._tolerance
+
+    def cache_key(self) -> Hashable:
+        return (
+            "TanhSinhIntegrator",
+            self._tolerance.cache_key(),
+            self._maximum_level,
+        )
+
+    def level_sum(self, integrand: IntegrandInterface, level: int) -> Tuple[float, int]:
+        """ Sum of the weighted integrand over the new nodes of a level
+
+        Returns the sum and the number of nodes the integrand was evaluated on.
+        """
+        interval = integrand.interval()
+        start = interval.start()
+        end = interval.end()
+
+        half_width = (end.value() - start.value()) / 2
+        t, distances, weights = tanh_sinh_level(level)
+
+        lower = start.value() + half_width * distances
+        upper = end.value() - half_width * distances
+
+        # The node at zero is only in level zero and only counted once
+        if level == 0:
+            lower = lower[1:]
+            lower_weights = weights[1:]
+        else:
+            lower_weights = weights
+
+        keep_lower = start.defined_on_boundary() | (lower != start.value())
+        keep_upper = end.defined_on_boundary() | (upper != end.value())
+
+        points = concatenate([lower[keep_lower], upper[keep_upper]])
+        point_weights = concatenate([lower_weights[keep_lower], weights[keep_upper]])
+
+        values = integrand.evaluate_batch(points)
+        return half_width * (values @ point_weights), len(points)
+
+    def integrate(self, integrand: IntegrandInterface) -> float:
+        return self.integrate_with_info(integrand).value()
+
+    def integrate_with_info(self, integrand: IntegrandInterface) -> IntegrationResult:
+        wall_time_start = perf_counter()
+        total, evaluations = self.level_sum(integrand, 0)
+        integral = total
+        error = inf
+
+        for level in range(1, self._maximum_level + 1):
+            level_total, level_evaluations = self.level_sum(integrand, level)
+            total = total + level_total
+            evaluations += level_evaluations
+            previous = integral
+            integral = total * 2.0 ** -level
+
+            error = abs(integral - previous)
+
+            if self._tolerance.within_tolerance(integral, previous):
+                wall_time = perf_counter() - wall_time_start
+                return IntegrationResult(
+                    integral, error, evaluations, 1, wall_time, True
+                )
+
+        warn(
+            f"Maximum level ({self._maximum_level}) reached, the difference "
+            f"between the last two estimates is {error}",
+            RuntimeWarning,
+        )
+
+        wall_time = perf_counter() - wall_time_start
+        return IntegrationResult(integral, error, evaluations, 1, wall_time, False)
+
+
+__all__ = ["TanhSinhIntegrator"]
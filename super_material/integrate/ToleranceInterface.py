@@ -1,6 +1,9 @@
 """ Integration error tolerance """
 
 from abc import ABC, abstractmethod
+from typing import Hashable, Optional, Tuple
+
+from numpy import ndarray, vectorize
 
 
 class ToleranceInterface(ABC):
@@ -10,5 +13,28 @@ class ToleranceInterface(ABC):
     def within_tolerance(self, value: float, reference: float) -> bool:
         """ Returns wether the value is within the tolerance from the reference """
 
+    def within_tolerance_batch(self, values: ndarray, references: ndarray) -> ndarray:
+        """ Returns element-wise wether the values are within the tolerance from
+        the references """
+        return vectorize(self.within_tolerance, otypes=[bool])(values, references)
+
+    def absolute_and_relative(self) -> Optional[Tuple[float, float]]:
+        """ Absolute and relative tolerance of the tolerance
+
+        A tolerance that accepts the values within the larger of an absolute
+        tolerance and a relative tolerance times the reference returns the
+        two, which is how QUADPACK is given a tolerance. Other tolerances
+        return None, which is the default.
+        """
+        return None
+
+    def cache_key(self) -> Hashable:
+        """ Key of the parameters of the tolerance
+
+        Tolerances with equal keys accept the same values. The default key is
+        the tolerance itself, which is only equal to itself.
+        """
+        return self
+
 
 __all__ = ["ToleranceInterface"]
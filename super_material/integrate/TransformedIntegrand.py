@@ -1,3 +1,5 @@
+from numpy import ndarray
+
 from .IntegrandInterface import IntegrandInterface
 from .IntegrandIntervalTransformInterface import IntegrandIntervalTransformInterface
 
@@ -18,6 +20,12 @@ class TransformedIntegrand(IntegrandInterface):
 
         return self._base.evaluate(x) / scale
 
+    def evaluate_batch(self, us: ndarray) -> ndarray:
+        xs = self._transform.inverse_transform_batch(us)
+        scales = self._transform.transform_derivative_batch(xs)
+
+        return self._base.evaluate_batch(xs) / scales
+
     def interval(self) -> IntegrandInterface:
         base_interval = self._base.interval()
         return self._transform.transform_interval(base_interval)
@@ -3,18 +3,31 @@ from .AbsoluteTolerance import *
 from .ConjunctionTolerance import *
 from .DisjunctionTolerance import *
 from .RelativeTolerance import *
+from .ScaledTolerance import *
 from .ToleranceInterface import *
 
 # Integrand
+from .CountingIntegrand import *
+from .IntegrandFamily import *
 from .IntegrandBoundary import *
 from .IntegrandInterface import *
 from .IntegrandInterval import *
 from .TransformedIntegrand import *
 
 # Integrator
+from .FixedQuadratureInterface import *
+from .ClenshawCurtisIntegrator import *
+from .ClenshawCurtisQuadrature import *
+from .GaussJacobiIntegrator import *
+from .GaussJacobiQuadrature import *
+from .GaussKronrodIntegrator import *
+from .GaussKronrodQuadrature import *
+from .GaussLegendreQuadrature import *
+from .IntegrationResult import *
 from .IntegratorInterface import *
 from .QuadpackIntegrator import *
 from .ScipyQuadratureIntegrator import *
+from .TanhSinhIntegrator import *
 
 # Transforms
 from .GuassQuadratureIntervalTransform import *
@@ -0,0 +1,58 @@
+from threading import Thread
+
+from super_material.cache import LRUCache, quantize, quantized, shared_cache
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+
+    assert cache.get_or_compute("a", lambda: 1) == 1
+    assert cache.get_or_compute("b", lambda: 2) == 2
+    assert cache.get_or_compute("a", lambda: None) == 1
+
+    # The least recently used entry is evicted
+    cache.store("c", 3)
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, 1)
+    assert cache.lookup("c") == (True, 3)
+    assert len(cache) == 2
+
+    statistics = cache.statistics()
+    assert statistics.hits() == 3
+    assert statistics.misses() == 3
+    assert statistics.lookups() == 6
+    assert statistics.hit_rate() == 0.5
+    assert statistics.evictions() == 1
+    assert statistics.size() == 2
+    assert statistics.maximum_size() == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.statistics().lookups() == 0
+
+
+def test_lru_cache_threads():
+    cache = LRUCache(50)
+
+    def work(offset):
+        for index in range(1000):
+            key = (offset + index) % 100
+            assert cache.get_or_compute(key, lambda: 2 * key) == 2 * key
+
+    threads = [Thread(target=work, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statistics = cache.statistics()
+    assert statistics.lookups() == 8000
+    assert statistics.size() == 50
+    assert statistics.misses() - statistics.evictions() == 50
+
+
+def test_quantize_and_shared_cache():
+    assert quantize(4.2, 1e-9) == quantize(4.2 + 1e-12, 1e-9)
+    assert quantize(4.2, 1e-9) != quantize(4.2 + 1e-8, 1e-9)
+    assert quantize(quantized(4.2 + 3e-10, 1e-9), 1e-9) == quantize(4.2, 1e-9)
+    assert shared_cache() is shared_cache()
@@ -0,0 +1,87 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from super_material.cache import SQLiteCache, key_digest, stable_key
+from super_material.conductivity import (
+    CachedSuperconductorConductivity,
+    MattisBardeenSuperconductorConductivity,
+)
+from super_material.gap_energy import BCSGapEnergy, CachedGapEnergy
+from super_material.integrate import RelativeTolerance
+
+
+def test_sqlite_cache(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cache = SQLiteCache(path)
+
+    assert cache.lookup(("a", 1)) == (False, None)
+    cache.store(("a", 1), 1.5)
+    cache.store(("b", 2.0), 1.5 - 2j)
+    assert cache.lookup(("a", 1)) == (True, 1.5)
+    assert cache.lookup(("b", 2.0)) == (True, 1.5 - 2j)
+
+    statistics = cache.statistics()
+    assert statistics.hits() == 2
+    assert statistics.misses() == 1
+    assert statistics.size() == 2
+    assert statistics.maximum_size() is None
+
+    # Persisted for other caches of the same version only
+    assert SQLiteCache(path).lookup(("a", 1)) == (True, 1.5)
+    assert SQLiteCache(path, "0.0.0").lookup(("a", 1)) == (False, None)
+
+    cache.clear()
+    assert cache.statistics().size() == 0
+
+
+def test_sqlite_cache_keys():
+    # NumPy numbers have the keys of Python numbers
+    assert stable_key(("a", np.float64(1.5), np.int64(2))) == ("a", 1.5, 2)
+    assert key_digest(("a", np.float64(1.5)), "1") == key_digest(("a", 1.5), "1")
+    assert key_digest(("a", 1.5), "1") != key_digest(("a", 1.5), "2")
+
+    # The keys of models hold the configuration of their integrators
+    gap_energy = BCSGapEnergy(1.5e-3, 2.3)
+    keys = {
+        stable_key(
+            MattisBardeenSuperconductorConductivity(
+                gap_energy, 2.4e7, RelativeTolerance(tolerance)
+            ).cache_key()
+        )
+        for tolerance in [1e-6, 1e-6, 1e-9]
+    }
+    assert len(keys) == 2
+
+    # Identity keys differ between processes
+    with pytest.raises(TypeError):
+        stable_key(("a", object()))
+
+
+def evaluate_cached_conductivity(cache, frequencies):
+    gap_energy = CachedGapEnergy(BCSGapEnergy(1.5e-3, 2.3), cache)
+    conductivity = CachedSuperconductorConductivity(
+        MattisBardeenSuperconductorConductivity(gap_energy, 2.4e7), cache
+    )
+    return conductivity.evaluate_sweep(4.2, frequencies), cache.statistics().hits()
+
+
+def test_sqlite_cache_processes(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    frequencies = np.array([100e9, 700e9, 1500e9])
+    expected, hits = evaluate_cached_conductivity(cache, frequencies)
+    assert hits == 0
+
+    # Read concurrently by other processes
+    cache = pickle.loads(pickle.dumps(cache))
+    with ProcessPoolExecutor(2) as executor:
+        futures = [
+            executor.submit(evaluate_cached_conductivity, cache, frequencies)
+            for _ in range(4)
+        ]
+        for future in futures:
+            data, hits = future.result()
+            assert np.array_equal(data, expected)
+            assert hits == len(frequencies)
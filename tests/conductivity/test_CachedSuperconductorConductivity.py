@@ -0,0 +1,102 @@
+import numpy as np
+
+from super_material.cache import LRUCache, quantized
+from super_material.conductivity import (
+    CachedSuperconductorConductivity,
+    MattisBardeenSuperconductorConductivity,
+    ZimmermannSuperconductorConductivity,
+)
+from super_material.gap_energy import BCSGapEnergy, CachedGapEnergy
+from super_material.integrate import RelativeTolerance
+
+
+def test_cached_superconductor_conductivity():
+    cache = LRUCache(1000)
+    base = MattisBardeenSuperconductorConductivity(BCSGapEnergy(1.5e-3, 2.3), 2.4e7)
+    conductivity = CachedSuperconductorConductivity(base, cache)
+    frequencies = np.array([10e9, 100e9, 700e9, 1500e9])
+
+    # Expected evaluation, from the cache the second time
+    expected = base.evaluate_sweep(4.2, frequencies)
+    for _ in range(2):
+        assert np.array_equal(conductivity.evaluate_sweep(4.2, frequencies), expected)
+
+    data = [conductivity.evaluate(4.2, frequency) for frequency in frequencies]
+    assert np.array_equal(data, expected)
+
+    statistics = cache.statistics()
+    assert statistics.misses() == 4
+    assert statistics.hits() == 8
+
+    # A partially cached sweep only evaluates the missing frequencies
+    conductivity.evaluate_sweep(4.2, [100e9, 200e9])
+    assert cache.statistics().misses() == 5
+
+
+def test_cached_superconductor_conductivity_keys():
+    cache = LRUCache(1000)
+    gap_energy = CachedGapEnergy(BCSGapEnergy(1.5e-3, 2.3), cache)
+
+    def zimmermann(scattering_time, tolerance=None):
+        base = ZimmermannSuperconductorConductivity(
+            gap_energy, 2.4e7, scattering_time, tolerance
+        )
+        return CachedSuperconductorConductivity(base, cache)
+
+    # Equal parameters share their entries, other parameters do not
+    zimmermann(1e-13).evaluate(4.2, 100e9)
+    zimmermann(1e-13).evaluate(4.2, 100e9)
+    zimmermann(1e-14).evaluate(4.2, 100e9)
+    zimmermann(1e-13, RelativeTolerance(1e-6)).evaluate(4.2, 100e9)
+    zimmermann(1e-13, RelativeTolerance(1e-6)).evaluate(4.2, 100e9)
+
+    # The gap energy is shared by the conductivities
+    mattis_bardeen = CachedSuperconductorConductivity(
+        MattisBardeenSuperconductorConductivity(gap_energy, 2.4e7), cache
+    )
+    mattis_bardeen.evaluate(4.2, 100e9)
+
+    statistics = cache.statistics()
+    assert statistics.size() == 5
+    assert statistics.misses() == 5
+    assert statistics.hits() == 2 + 3
+
+    # Conductivities of other resolutions do not share their entries
+    base = MattisBardeenSuperconductorConductivity(BCSGapEnergy(1.5e-3, 2.3), 2.4e7)
+    coarse = CachedSuperconductorConductivity(base, cache, frequency_resolution=1e9)
+    fine = CachedSuperconductorConductivity(base, cache, frequency_resolution=1e6)
+    coarse.evaluate(4.2, 100e9)
+    assert fine.evaluate(4.2, 100e6) == base.evaluate(4.2, 100e6)
+
+
+def test_cached_superconductor_conductivity_quantized():
+    base = MattisBardeenSuperconductorConductivity(BCSGapEnergy(1.5e-3, 2.3), 2.4e7)
+    frequencies = [100e9 + 0.3, 100e9 - 0.3]
+    temperature = 4.2 + 3e-10
+    quantized_temperature = quantized(temperature, 1e-9)
+    expected = base.evaluate(quantized_temperature, 100e9)
+
+    # The points within the resolutions give the same conductivity, in
+    # whichever order they are evaluated
+    for order in [frequencies, frequencies[::-1]]:
+        conductivity = CachedSuperconductorConductivity(base, LRUCache(1000), 1e-9, 1)
+        data = [conductivity.evaluate(temperature, frequency) for frequency in order]
+        assert data == [expected] * 2
+
+        conductivity = CachedSuperconductorConductivity(base, LRUCache(1000), 1e-9, 1)
+        data = conductivity.evaluate_sweep(temperature, order)
+        assert np.array_equal(
+            data, base.evaluate_sweep(quantized_temperature, [100e9]).repeat(2)
+        )
+
+        gap_energy = base.gap_energy().evaluate(temperature)
+        conductivity = CachedSuperconductorConductivity(base, LRUCache(1000), 1e-9, 1)
+        data = conductivity.evaluate_sweep_with_gap_energy(
+            gap_energy, temperature, order
+        )
+        assert np.array_equal(
+            data,
+            base.evaluate_sweep_with_gap_energy(
+                gap_energy, quantized_temperature, [100e9]
+            ).repeat(2),
+        )
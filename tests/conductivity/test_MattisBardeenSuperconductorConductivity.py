@@ -1,12 +1,24 @@
+import warnings
 from dataclasses import dataclass
 
 import numpy as np
 
 from super_material.conductivity.MattisBardeenSuperconductorConductivity import (
+    MattisBardeenImaginaryIntegrand,
+    MattisBardeenRealFirstIntegrand,
+    MattisBardeenRealSecondIntegrand,
     MattisBardeenSuperconductorConductivity,
+    remove_chebyshev_singularity,
 )
 
+from super_material.constants import h_bar
 from super_material.gap_energy import BCSGapEnergy
+from super_material.integrate import (
+    AbsoluteTolerance,
+    DisjunctionTolerance,
+    QuadpackIntegrator,
+    RelativeTolerance,
+)
 
 
 @dataclass
@@ -35,6 +47,18 @@ def assert_mattis_bardeen_superconductor_conductivity_test_case(
     ]
     assert np.allclose(data, test_case.expected)
 
+    # Expected evaluation of a frequency sweep
+    data = conductivity.evaluate_sweep(test_case.temperature, test_case.frequencies)
+    assert np.allclose(data, test_case.expected)
+
+    # Expected evaluation with a relative or an absolute tolerance in S/m
+    tolerance = DisjunctionTolerance([RelativeTolerance(1e-7), AbsoluteTolerance(1e-3)])
+    conductivity = MattisBardeenSuperconductorConductivity(
+        gap_energy, test_case.conductivity_0, tolerance
+    )
+    data = conductivity.evaluate_sweep(test_case.temperature, test_case.frequencies)
+    assert np.allclose(data, test_case.expected)
+
 
 def test_mattis_bardeen_complex_conductivity():
     niobium_4_2K_test_case = MattisBardeenSuperconductorConductivityTestCase(
@@ -58,3 +82,97 @@ def test_mattis_bardeen_complex_conductivity():
     )
 
     assert_mattis_bardeen_superconductor_conductivity_test_case(niobium_4_2K_test_case)
+
+
+def test_mattis_bardeen_integrands_evaluate_batch():
+    gap_energy, temperature, omega = 1.4e-3, 4.2, 2 * np.pi * 900e9
+
+    integrands = [
+        MattisBardeenRealFirstIntegrand(gap_energy, temperature, omega),
+        MattisBardeenRealSecondIntegrand(gap_energy, temperature, omega),
+        remove_chebyshev_singularity(
+            MattisBardeenImaginaryIntegrand(gap_energy, temperature, omega)
+        ),
+    ]
+
+    for integrand in integrands:
+        start = integrand.interval().start().value()
+        end = integrand.interval().end().value()
+        points = np.linspace(start, end, 9)[1:-1]
+
+        data = [integrand.evaluate(x) for x in points]
+        assert np.allclose(integrand.evaluate_batch(points), data, rtol=1e-12)
+
+
+def test_mattis_bardeen_evaluate_with_info():
+    gap_energy = BCSGapEnergy(1.5e-3, 2.3)
+    conductivity = MattisBardeenSuperconductorConductivity(gap_energy, 2.4e7)
+
+    # Below and above the gap frequency
+    for frequency in [100e9, 1500e9]:
+        value, results = conductivity.evaluate_with_info(4.2, frequency)
+        assert value == conductivity.evaluate(4.2, frequency)
+        assert set(results) == {"first_real", "second_real", "imaginary"}
+
+        for result in results.values():
+            assert result.converged()
+
+    # The second real integral vanishes below the gap frequency
+    _, results = conductivity.evaluate_with_info(4.2, 100e9)
+    assert results["second_real"].evaluations() == 0
+    assert results["first_real"].evaluations() > 0
+
+
+def test_mattis_bardeen_imaginary_integral_gap_edge():
+    conductivity = MattisBardeenSuperconductorConductivity(None, 2.4e7)
+    reference = QuadpackIntegrator(0, 1e-13, limit=200)
+    gap_energy, temperature = 1.4e-3, 4.2
+
+    # The singularities at the ends of the interval and just outside of it
+    # nearly merge next to the gap frequency
+    for ratio in [0.99999, 1.00001, 0.9999, 1.0001, 1.02]:
+        omega = ratio * 2 * gap_energy / h_bar
+        integrand = MattisBardeenImaginaryIntegrand(gap_energy, temperature, omega)
+        expected = reference.integrate(remove_chebyshev_singularity(integrand))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = conductivity.evaluate_imaginary_integral_with_info(
+                gap_energy, temperature, omega
+            )
+
+        assert result.converged()
+        assert np.isclose(result.value(), expected, rtol=1e-11, atol=0)
+
+
+def test_mattis_bardeen_golden_reference(golden_reference):
+    reference = golden_reference
+    material = reference["material"]
+    points = reference["mattis_bardeen"]
+
+    gap_energy = BCSGapEnergy(material["gap_energy_0"], material["kappa"])
+    expected = [complex(point["real"], point["imag"]) for point in points]
+
+    # Default integrators and a relative tolerance
+    for tolerance in [None, RelativeTolerance(1e-9)]:
+        conductivity = MattisBardeenSuperconductorConductivity(
+            gap_energy, material["conductivity_0"], tolerance
+        )
+        data = [
+            conductivity.evaluate(point["temperature"], point["frequency"])
+            for point in points
+        ]
+        assert np.allclose(data, expected, rtol=1e-10, atol=0)
+
+
+def test_mattis_bardeen_evaluate_sweep():
+    gap_energy = BCSGapEnergy(1.5e-3, 2.3)
+    conductivity = MattisBardeenSuperconductorConductivity(gap_energy, 2.4e7)
+
+    # Across the gap frequency, with one frequency at the gap edge
+    gap_frequency = 2 * gap_energy.evaluate(4.2) / (2 * np.pi * h_bar)
+    frequencies = np.append(np.linspace(10e9, 1500e9, 20), gap_frequency * 1.00001)
+
+    # The integrals evaluated together are those of each frequency
+    data = [conductivity.evaluate(4.2, frequency) for frequency in frequencies]
+    assert np.array_equal(conductivity.evaluate_sweep(4.2, frequencies), data)
@@ -0,0 +1,110 @@
+import pickle
+
+import numpy as np
+
+from super_material.cache import shared_cache
+from super_material.conductivity import (
+    CachedSuperconductorConductivity,
+    ParallelSweep,
+    ZimmermannSuperconductorConductivity,
+)
+from super_material.gap_energy import BCSGapEnergy, CachedGapEnergy
+
+
+def test_parallel_sweep():
+    conductivity = ZimmermannSuperconductorConductivity(
+        BCSGapEnergy(1.5e-3, 2.3), 2.4e7, 1e-13
+    )
+    temperatures = np.array([1.0, 4.2, 8.0])
+    frequencies = np.linspace(10e9, 1500e9, 7)
+    expected = np.array(
+        [
+            conductivity.evaluate_sweep(temperature, frequencies)
+            for temperature in temperatures
+        ]
+    )
+
+    for max_workers in [1, 2]:
+        with ParallelSweep(conductivity, max_workers) as sweep:
+            data = sweep.evaluate(temperatures, frequencies)
+            assert data.shape == (3, 7)
+            assert np.array_equal(data, expected)
+
+            # The workers are kept for the next sweep
+            assert np.array_equal(
+                sweep.evaluate(temperatures[:1], frequencies), expected[:1]
+            )
+
+
+class CountingGapEnergy(BCSGapEnergy):
+    evaluations: int = 0
+
+    def evaluate(self, temperature: float) -> float:
+        self.evaluations += 1
+        return super().evaluate(temperature)
+
+
+def test_parallel_sweep_gap_energy():
+    # The gap energy is evaluated once per temperature for the chunks of its row
+    gap_energy = CountingGapEnergy(1.5e-3, 2.3)
+    conductivity = ZimmermannSuperconductorConductivity(gap_energy, 2.4e7, 1e-13)
+    temperatures = np.array([1.0, 4.2])
+    frequencies = np.linspace(10e9, 1500e9, 7)
+
+    sweep = ParallelSweep(conductivity, 1, chunk_size=2)
+    assert len(sweep.chunks(2, 7)) == 8
+
+    data = sweep.evaluate(temperatures, frequencies)
+    assert gap_energy.evaluations == 2
+
+    expected = [
+        conductivity.evaluate_sweep(temperature, frequencies)
+        for temperature in temperatures
+    ]
+    assert np.array_equal(data, expected)
+
+
+def test_parallel_sweep_chunks():
+    sweep = ParallelSweep(None, 4)
+
+    # Rows are split into enough chunks for the workers, so that a single
+    # temperature is spread over the workers
+    assert sweep.chunks(1, 10) == [(0, slice(index, index + 1)) for index in range(10)]
+    assert sweep.chunks(1, 40) == [
+        (0, slice(start, min(start + 3, 40))) for start in range(0, 40, 3)
+    ]
+    assert len(sweep.chunks(3, 100)) == 18
+    assert sweep.chunks(20, 100) == [(row, slice(0, 100)) for row in range(20)]
+    assert sweep.chunks(0, 100) == []
+    assert sweep.chunks(2, 0) == []
+
+    for max_workers in [2, 3, 8]:
+        assert len(ParallelSweep(None, max_workers).chunks(1, 25)) > 1
+
+    # A single worker evaluates whole rows
+    assert ParallelSweep(None, 1).chunks(2, 10) == [
+        (0, slice(0, 10)),
+        (1, slice(0, 10)),
+    ]
+
+    assert ParallelSweep(None, 4, 60).chunks(1, 100) == [
+        (0, slice(0, 60)),
+        (0, slice(60, 100)),
+    ]
+
+
+def test_parallel_sweep_cached():
+    # Cached conductivities with the shared cache use the shared cache of the
+    # worker processes
+    gap_energy = CachedGapEnergy(BCSGapEnergy(1.5e-3, 2.3))
+    conductivity = CachedSuperconductorConductivity(
+        ZimmermannSuperconductorConductivity(gap_energy, 2.4e7, 1e-13)
+    )
+    assert pickle.loads(pickle.dumps(gap_energy)).cache() is shared_cache()
+    assert pickle.loads(pickle.dumps(conductivity)).cache() is shared_cache()
+
+    frequencies = np.array([100e9, 700e9])
+    with ParallelSweep(conductivity, 2) as sweep:
+        data = sweep.evaluate([4.2], frequencies)
+
+    assert np.array_equal(data[0], conductivity.base().evaluate_sweep(4.2, frequencies))
@@ -1,12 +1,19 @@
 from dataclasses import dataclass
 
 import numpy as np
+import pytest
 
 from super_material.conductivity.ZimmermannSuperconductorConductivity import (
     ZimmermannSuperconductorConductivity,
 )
 
+from super_material.constants import h_bar
 from super_material.gap_energy import BCSGapEnergy
+from super_material.integrate import (
+    AbsoluteTolerance,
+    DisjunctionTolerance,
+    RelativeTolerance,
+)
 
 
 @dataclass
@@ -37,6 +44,18 @@ def assert_zimmermann_superconductor_conductivity_test_case(
     print(data)
     assert np.allclose(data, test_case.expected)
 
+    # Expected evaluation of a frequency sweep
+    data = conductivity.evaluate_sweep(test_case.temperature, test_case.frequencies)
+    assert np.allclose(data, test_case.expected)
+
+    # Expected evaluation with a relative or an absolute tolerance in S/m
+    tolerance = DisjunctionTolerance([RelativeTolerance(1e-7), AbsoluteTolerance(1e-3)])
+    conductivity = ZimmermannSuperconductorConductivity(
+        gap_energy, test_case.conductivity_0, test_case.scattering_time, tolerance,
+    )
+    data = conductivity.evaluate_sweep(test_case.temperature, test_case.frequencies)
+    assert np.allclose(data, test_case.expected)
+
 
 def test_zimmermann_superconductor_conductivity():
     niobium_4_2K_test_case = ZimmermannSuperconductorConductivityTestCase(
@@ -61,3 +80,86 @@ def test_zimmermann_superconductor_conductivity():
     )
 
     assert_zimmermann_superconductor_conductivity_test_case(niobium_4_2K_test_case)
+
+
+def test_zimmermann_evaluate_with_info():
+    gap_energy = BCSGapEnergy(1.5e-3, 2.3)
+    conductivity = ZimmermannSuperconductorConductivity(gap_energy, 2.4e7, 1e-14)
+
+    value, results = conductivity.evaluate_with_info(4.2, 100e9)
+    assert value == conductivity.evaluate(4.2, 100e9)
+    assert set(results) == {"first", "second"}
+
+    value, results = conductivity.evaluate_with_info(4.2, 1500e9)
+    assert value == conductivity.evaluate(4.2, 1500e9)
+    assert set(results) == {"first", "second", "third"}
+
+    for result in results.values():
+        assert result.converged()
+        assert result.subdivisions() >= 1
+
+
+def test_zimmermann_golden_reference(golden_reference):
+    reference = golden_reference
+    material = reference["material"]
+    points = reference["zimmermann"]
+
+    gap_energy = BCSGapEnergy(material["gap_energy_0"], material["kappa"])
+    expected = [complex(point["real"], point["imag"]) for point in points]
+
+    # The default integrator resolves the integrals to 1e-6 absolute, a
+    # relative tolerance of the conductivity resolves them much further
+    for tolerance, rtol in [(None, 1e-5), (RelativeTolerance(1e-9), 1e-8)]:
+        data = [
+            ZimmermannSuperconductorConductivity(
+                gap_energy,
+                material["conductivity_0"],
+                point["scattering_time"],
+                tolerance,
+            ).evaluate(point["temperature"], point["frequency"])
+            for point in points
+        ]
+        assert np.allclose(data, expected, rtol=rtol, atol=0)
+
+
+def test_zimmermann_evaluate_sweep():
+    gap_energy = BCSGapEnergy(1.5e-3, 2.3)
+    frequencies = np.linspace(10e9, 1500e9, 20)
+
+    # The integrals evaluated together are those of each frequency
+    for tolerance in [None, RelativeTolerance(1e-9)]:
+        conductivity = ZimmermannSuperconductorConductivity(
+            gap_energy, 2.4e7, 1e-14, tolerance
+        )
+        data = [conductivity.evaluate(4.2, frequency) for frequency in frequencies]
+        assert np.array_equal(conductivity.evaluate_sweep(4.2, frequencies), data)
+
+    # Empty and two dimensional sweeps
+    assert conductivity.evaluate_sweep(4.2, []).shape == (0,)
+    grid = frequencies.reshape(4, 5)
+    assert np.array_equal(
+        conductivity.evaluate_sweep(4.2, grid),
+        conductivity.evaluate_sweep(4.2, frequencies).reshape(4, 5),
+    )
+
+
+def test_zimmermann_above_gap_edge():
+    gap_energy = BCSGapEnergy(1.5e-3, 1.0)
+    frequency = 2.001 * gap_energy.evaluate(4.0) / (2 * np.pi * h_bar)
+    expected = ZimmermannSuperconductorConductivity(gap_energy, 1e7, 1e-13).evaluate(
+        4.0, frequency
+    )
+
+    # The panels next to the gap edge are bisected onto its singularity
+    tolerance = DisjunctionTolerance(
+        [RelativeTolerance(1e-11), AbsoluteTolerance(1e-9)]
+    )
+    conductivity = ZimmermannSuperconductorConductivity(
+        gap_energy, 1e7, 1e-13, tolerance
+    )
+    with pytest.warns(RuntimeWarning):
+        value = conductivity.evaluate(4.0, frequency)
+        (sweep_value,) = conductivity.evaluate_sweep(4.0, [frequency])
+
+    assert np.isclose(value, expected, rtol=1e-6, atol=0)
+    assert np.isclose(sweep_value, expected, rtol=1e-6, atol=0)
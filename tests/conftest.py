@@ -0,0 +1,12 @@
+import json
+from pathlib import Path
+
+import pytest
+
+# Generated by the golden command of the benchmark suite
+GOLDEN_REFERENCE_PATH = Path(__file__).parent / "data" / "golden_reference.json"
+
+
+@pytest.fixture(scope="session")
+def golden_reference():
+    return json.loads(GOLDEN_REFERENCE_PATH.read_text())
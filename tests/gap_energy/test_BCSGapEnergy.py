@@ -1,3 +1,5 @@
+import gc
+import weakref
 from dataclasses import dataclass
 
 import numpy as np
@@ -26,6 +28,10 @@ def assert_bcs_gap_energy_test_case(test_case: BCSGapEnergyTestCase):
     data = [gap_energy.evaluate(temperature) for temperature in test_case.temperatures]
     assert np.allclose(data, test_case.expected)
 
+    # Expected evaluation of many temperatures at once
+    data = gap_energy.evaluate_many(test_case.temperatures)
+    assert np.allclose(data, test_case.expected)
+
 
 def test_bcs_gap_energy():
     niobium_test_case = BCSGapEnergyTestCase(
@@ -44,3 +50,73 @@ def test_bcs_gap_energy():
     )
 
     assert_bcs_gap_energy_test_case(niobium_test_case)
+
+
+def test_bcs_gap_energy_derived_quantities():
+    gap_energy = BCSGapEnergy(1.5e-3, 2.3)
+    critical_temperature = gap_energy.critical_temperature()
+    equation = gap_energy.equation()
+
+    # Derived once and kept by the gap energy
+    assert gap_energy.critical_temperature() is critical_temperature
+    assert gap_energy.equation() is equation
+
+    # Eta only depends on kappa
+    assert BCSGapEnergy(1.2e-3, 2.3).eta() == gap_energy.eta()
+
+    # Nothing else keeps the gap energy alive
+    gap_energy.evaluate(4.2)
+    reference = weakref.ref(gap_energy)
+    del gap_energy
+    gc.collect()
+    assert reference() is None
+
+
+def test_bcs_gap_energy_sweep():
+    for kappa in [2.3, 4000]:
+        gap_energy = BCSGapEnergy(1.5e-3, kappa)
+        temperatures = np.linspace(0, gap_energy.critical_temperature(), 101)
+        expected = gap_energy.evaluate_many(temperatures)
+
+        # Increasing temperatures
+        data = list(gap_energy.sweep(temperatures))
+        assert np.allclose(data, expected, rtol=1e-12, atol=0)
+
+        # Decreasing temperatures
+        data = list(gap_energy.sweep(temperatures[::-1]))
+        assert np.allclose(data, expected[::-1], rtol=1e-12, atol=0)
+
+
+def test_bcs_gap_energy_gap_energy_0_derivative():
+    for universal_table in [False, True]:
+        gap_energy = BCSGapEnergy(1.5e-3, 2.3, universal_table)
+        step = 1e-9
+        lower = BCSGapEnergy(1.5e-3 - step, 2.3, universal_table)
+        upper = BCSGapEnergy(1.5e-3 + step, 2.3, universal_table)
+
+        for temperature in [2.1, 4.2, 6.3, 8.4]:
+            difference = upper.evaluate(temperature) - lower.evaluate(temperature)
+            derivative = gap_energy.gap_energy_0_derivative(temperature)
+            assert np.isclose(derivative, difference / (2 * step), rtol=1e-5)
+
+
+def test_bcs_gap_energy_golden_reference(golden_reference):
+    reference = golden_reference
+    material = reference["material"]
+    points = reference["bcs_gap"]
+
+    temperatures = np.array([point["temperature"] for point in points])
+    expected = [point["gap_energy"] for point in points]
+
+    # Solved and interpolated from the universal table
+    for universal_table in [False, True]:
+        gap_energy = BCSGapEnergy(
+            material["gap_energy_0"], material["kappa"], universal_table
+        )
+        assert np.isclose(
+            gap_energy.critical_temperature(),
+            material["critical_temperature"],
+            rtol=1e-12,
+        )
+        data = gap_energy.evaluate_many(temperatures)
+        assert np.allclose(data, expected, rtol=1e-10, atol=0)
@@ -0,0 +1,67 @@
+import numpy as np
+from scipy.integrate import quad
+
+from super_material.constants import k_B
+from super_material.gap_energy.BCSGapEnergy import BCSGapEnergy
+
+
+def test_bcs_gap_equation():
+    for kappa in [2.3, 4000]:
+        gap_energy = BCSGapEnergy(1.5e-3, kappa)
+        equation = gap_energy.equation()
+
+        T_c = gap_energy.critical_temperature()
+        temperatures = np.linspace(0.05, 0.99, 11) * T_c
+
+        # Solution satisfies the gap equation
+        solution = equation.solve(temperatures)
+        assert np.allclose(equation.residual(solution, temperatures), 0, atol=1e-12)
+
+        # Gap energy derivative against central differences
+        step = 1e-9
+        integral = equation.integral_and_derivatives(solution, temperatures)
+        _, derivative, temperature_derivative = integral
+        forward = equation.integral(solution + step, temperatures)
+        backward = equation.integral(solution - step, temperatures)
+        assert np.allclose(derivative, (forward - backward) / (2 * step), rtol=1e-5)
+
+        # Temperature derivative against central differences
+        step = 1e-7
+        forward = equation.integral(solution, temperatures + step)
+        backward = equation.integral(solution, temperatures - step)
+        expected = (forward - backward) / (2 * step)
+        assert np.allclose(temperature_derivative, expected, rtol=1e-5)
+
+
+def test_bcs_gap_equation_integral():
+    for kappa in [2.3, 4000]:
+        gap_energy = BCSGapEnergy(1.5e-3, kappa)
+        equation = gap_energy.equation()
+
+        T_c = gap_energy.critical_temperature()
+        debye_energy = gap_energy.gap_energy_0() * np.sinh(gap_energy.eta())
+
+        for reduced_temperature in [0.05, 0.5, 0.95]:
+            for reduced_gap_energy in [1e-3, 0.3, 1]:
+                temperature = reduced_temperature * T_c
+                gap = reduced_gap_energy * gap_energy.gap_energy_0()
+
+                def integrand(z):
+                    energy = np.sqrt(gap ** 2 + z ** 2)
+                    return np.tanh(energy / (2 * k_B * temperature)) / energy
+
+                scale = 2 * k_B * temperature
+                expected, _ = quad(
+                    integrand,
+                    0,
+                    debye_energy,
+                    points=[scale, 40 * scale],
+                    epsabs=1e-14,
+                    epsrel=1e-14,
+                    limit=500,
+                )
+
+                integral = equation.integral(gap, temperature)
+                error = equation.integral_error_estimate(gap, temperature)
+                assert abs(integral - expected) <= max(error, 1e-13)
+                assert error < 1e-10
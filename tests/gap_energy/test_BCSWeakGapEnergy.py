@@ -0,0 +1,54 @@
+from math import cosh, exp, log, pi
+
+import numpy as np
+from scipy.integrate import quad
+from scipy.optimize import brentq
+
+from super_material.gap_energy.BCSGapEnergy import BCSGapEnergy
+from super_material.gap_energy.BCSWeakGapEnergy import BCSWeakGapEnergy
+
+from .test_GapEnergyInterface import assert_gap_energy_interface
+
+
+def weak_coupling_reduced_gap_energy(reduced_temperature: float) -> float:
+    # Solves ln(1 / d) = 2 \int_{0}^{\infty} \frac{1}{e^{d a \cosh(u) / t} + 1} du
+    a = pi / exp(np.euler_gamma)
+
+    def equation(d):
+        z = d * a / reduced_temperature
+        upper = np.arccosh(max(1, 700 / z))
+        integral, _ = quad(
+            lambda u: 1 / (exp(z * cosh(u)) + 1),
+            0,
+            upper,
+            epsabs=1e-16,
+            epsrel=1e-14,
+            limit=200,
+        )
+        return -log(d) - 2 * integral
+
+    return brentq(equation, 1e-9, 1, xtol=1e-16)
+
+
+def test_bcs_weak_gap_energy():
+    gap_energy_0 = 1.5e-3
+    gap_energy = BCSWeakGapEnergy(gap_energy_0)
+
+    # Interface
+    assert_gap_energy_interface(gap_energy)
+
+    # Universal weak coupling gap equation
+    T_c = gap_energy.critical_temperature()
+    reduced_temperatures = np.array([0.02, 0.1, 0.3, 0.5, 0.7, 0.9, 0.99, 0.9999])
+    expected = [weak_coupling_reduced_gap_energy(t) for t in reduced_temperatures]
+    data = gap_energy.evaluate_many(reduced_temperatures * T_c) / gap_energy_0
+    assert np.allclose(data, expected, rtol=1e-11, atol=1e-12)
+
+    # Weak coupling limit of the BCS gap energy
+    bcs_gap_energy = BCSGapEnergy(gap_energy_0, 1e6)
+    assert np.isclose(bcs_gap_energy.critical_temperature(), T_c, rtol=1e-9)
+
+    temperatures = np.linspace(0, T_c, 51)
+    data = gap_energy.evaluate_many(temperatures)
+    expected = bcs_gap_energy.evaluate_many(temperatures)
+    assert np.allclose(data, expected, rtol=0, atol=1e-9 * gap_energy_0)
@@ -0,0 +1,74 @@
+import numpy as np
+
+from super_material.cache import LRUCache, quantized
+from super_material.gap_energy.BCSGapEnergy import BCSGapEnergy
+from super_material.gap_energy.BCSWeakGapEnergy import BCSWeakGapEnergy
+from super_material.gap_energy.CachedGapEnergy import CachedGapEnergy
+
+from .test_GapEnergyInterface import assert_gap_energy_interface
+
+
+def test_cached_gap_energy():
+    base = BCSGapEnergy(1.5e-3, 4000)
+    gap_energy = CachedGapEnergy(base, LRUCache(1000))
+
+    # Interface, with the temperatures of the finite differences resolved
+    assert_gap_energy_interface(CachedGapEnergy(base, LRUCache(1000), 1e-14))
+    assert gap_energy.cache_key() == base.cache_key()
+
+    # Expected evaluation, from the cache the second time
+    temperatures = np.linspace(0, base.critical_temperature(), 11)
+    expected = base.evaluate_many(temperatures)
+    for _ in range(2):
+        data = gap_energy.evaluate_many(temperatures)
+        assert np.allclose(data, expected, rtol=1e-12)
+
+    cached = [gap_energy.evaluate(temperature) for temperature in temperatures]
+    assert np.array_equal(cached, data)
+
+
+def test_cached_gap_energy_sharing():
+    cache = LRUCache(1000)
+
+    # Equal gap energies share their entries, other gap energies do not
+    first = CachedGapEnergy(BCSGapEnergy(1.5e-3, 4000), cache)
+    second = CachedGapEnergy(BCSGapEnergy(1.5e-3, 4000), cache)
+    other = CachedGapEnergy(BCSGapEnergy(1.5e-3, 4000, True), cache)
+    weak = CachedGapEnergy(BCSWeakGapEnergy(1.5e-3), cache)
+
+    first.evaluate(4.2)
+    second.evaluate(4.2)
+    assert cache.statistics().hits() == 1
+
+    other.evaluate(4.2)
+    weak.evaluate(4.2)
+    assert cache.statistics().hits() == 1
+    assert cache.statistics().size() == 3
+
+    # Within the temperature resolution
+    second.evaluate(4.2 + 1e-12)
+    assert cache.statistics().hits() == 2
+
+    # Cached gap energies of other resolutions do not share their entries
+    coarse = CachedGapEnergy(BCSGapEnergy(1.5e-3, 4000), cache, 1e-3)
+    fine = CachedGapEnergy(BCSGapEnergy(1.5e-3, 4000), cache, 1e-6)
+    coarse.evaluate(4.2)
+    assert fine.evaluate(0.0042) == BCSGapEnergy(1.5e-3, 4000).evaluate(0.0042)
+
+
+def test_cached_gap_energy_quantized():
+    base = BCSGapEnergy(1.5e-3, 4000)
+    temperatures = [4.2, 4.2 + 3e-10, 4.2 - 3e-10]
+    expected = base.evaluate(quantized(4.2, 1e-9))
+
+    # The temperatures within the resolution give the same gap energy, in
+    # whichever order they are evaluated
+    for order in [temperatures, temperatures[::-1]]:
+        gap_energy = CachedGapEnergy(base, LRUCache(1000))
+        data = [gap_energy.evaluate(temperature) for temperature in order]
+        assert data == [expected] * 3
+
+        gap_energy = CachedGapEnergy(base, LRUCache(1000))
+        data = gap_energy.evaluate_many(order)
+        assert np.all(data == data[0])
+        assert np.isclose(data[0], expected, rtol=1e-15)
@@ -1,5 +1,7 @@
 from math import isclose
 
+import numpy as np
+
 from super_material.gap_energy.GapEnergyInterface import GapEnergyInterface
 
 
@@ -9,3 +11,30 @@ def assert_gap_energy_interface(gap_energy: GapEnergyInterface):
 
     assert isclose(gap_energy.evaluate(Tc), 0)
     assert isclose(gap_energy.evaluate(0), Delta0)
+
+    # Evaluating many temperatures at once
+    temperatures = np.linspace(0, Tc, 7)
+    data = [gap_energy.evaluate(temperature) for temperature in temperatures]
+    assert np.allclose(gap_energy.evaluate_many(temperatures), data, rtol=1e-8)
+
+    # Temperature derivative against central differences
+    step = 1e-6 * Tc
+    tol = 1e-6 * Delta0 / Tc
+    for temperature in np.linspace(0.1, 0.9, 5) * Tc:
+        value, derivative = gap_energy.evaluate_with_derivative(temperature)
+        difference = gap_energy.evaluate(temperature + step) - gap_energy.evaluate(
+            temperature - step
+        )
+        assert isclose(value, gap_energy.evaluate(temperature), rel_tol=1e-8)
+        assert isclose(derivative, difference / (2 * step), rel_tol=1e-5, abs_tol=tol)
+        assert derivative == gap_energy.derivative(temperature)
+
+    assert gap_energy.derivative(0) == 0
+    assert gap_energy.derivative(Tc) == 0
+
+    # Temperatures at which the gap energies are reached
+    temperatures = np.linspace(0.3, 1, 8) * Tc
+    gap_energies = gap_energy.evaluate_many(temperatures)
+    data = gap_energy.temperature_for_gap(gap_energies)
+    assert np.allclose(data, temperatures, rtol=1e-8)
+    assert gap_energy.temperature_for_gap(Delta0) == 0
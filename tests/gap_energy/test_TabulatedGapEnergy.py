@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from super_material.gap_energy.BCSGapEnergy import BCSGapEnergy
+from super_material.gap_energy.TabulatedGapEnergy import TabulatedGapEnergy
+from super_material.integrate import AbsoluteTolerance
+
+from .test_GapEnergyInterface import assert_gap_energy_interface
+
+
+def test_tabulated_gap_energy():
+    for kappa in [2.3, 4000]:
+        base = BCSGapEnergy(1.5e-3, kappa)
+        tolerance = 1e-12
+        gap_energy = TabulatedGapEnergy(base, AbsoluteTolerance(tolerance))
+
+        # Interface
+        assert_gap_energy_interface(gap_energy)
+        assert gap_energy.critical_temperature() == base.critical_temperature()
+        assert gap_energy.gap_energy_0() == base.gap_energy_0()
+
+        # Interpolation error
+        temperatures = np.linspace(0, base.critical_temperature(), 301)
+        expected = base.evaluate_many(temperatures)
+        data = gap_energy.evaluate_many(temperatures)
+        assert np.max(np.abs(data - expected)) < 10 * tolerance
+
+        # Above the critical temperature
+        assert gap_energy.evaluate(2 * base.critical_temperature()) == 0
+
+
+def test_tabulated_gap_energy_orders():
+    base = BCSGapEnergy(1.5e-3, 2.3)
+    coarse = AbsoluteTolerance(1e-3 * base.gap_energy_0())
+    fine = AbsoluteTolerance(1e-15 * base.gap_energy_0())
+
+    # The interpolant of the minimum order is tested at double the order
+    gap_energy = TabulatedGapEnergy(base, coarse, minimum_order=16, maximum_order=32)
+    assert gap_energy.order() == 32
+
+    with pytest.raises(RuntimeError):
+        TabulatedGapEnergy(base, fine, minimum_order=16, maximum_order=32)
+
+    with pytest.raises(AssertionError):
+        TabulatedGapEnergy(base, coarse, minimum_order=16, maximum_order=16)
@@ -0,0 +1,79 @@
+from os import listdir
+
+import numpy as np
+
+from super_material.gap_energy.BCSGapEnergy import BCSGapEnergy
+from super_material.gap_energy.UniversalBCSGapTable import (
+    TABLE_VERSION,
+    UniversalBCSGapTable,
+)
+
+from .test_GapEnergyInterface import assert_gap_energy_interface
+
+
+def test_universal_bcs_gap_table():
+    kappa = 2.3
+    gap_energy_a = BCSGapEnergy(1.5e-3, kappa, universal_table=True)
+    gap_energy_b = BCSGapEnergy(0.5e-3, kappa, universal_table=True)
+
+    # Interface
+    assert_gap_energy_interface(gap_energy_a)
+
+    # Shared between gap energies with the same kappa
+    table_a = UniversalBCSGapTable.for_gap_energy(gap_energy_a)
+    table_b = UniversalBCSGapTable.for_gap_energy(gap_energy_b)
+    assert table_a is table_b
+    assert table_a.kappa() == kappa
+
+    # Interpolated gap energies against solved gap energies
+    for gap_energy in [gap_energy_a, gap_energy_b]:
+        temperatures = np.linspace(0, gap_energy.critical_temperature(), 101)
+        data = gap_energy.evaluate_many(temperatures)
+        expected = gap_energy.solve_many(temperatures)
+        tolerance = 1e-9 * gap_energy.gap_energy_0()
+        assert np.allclose(data, expected, rtol=0, atol=tolerance)
+
+
+def test_universal_bcs_gap_table_persistence(tmp_path):
+    kappa = 3.1
+    gap_energy = BCSGapEnergy(1.5e-3, kappa, universal_table=True)
+
+    try:
+        UniversalBCSGapTable.set_directory(str(tmp_path))
+        built = UniversalBCSGapTable.for_gap_energy(gap_energy)
+        assert len(listdir(tmp_path)) == 1
+
+        UniversalBCSGapTable.clear()
+        loaded = UniversalBCSGapTable.for_gap_energy(gap_energy)
+        assert loaded is not built
+        assert np.array_equal(
+            loaded.interpolant().coefficients(), built.interpolant().coefficients()
+        )
+    finally:
+        UniversalBCSGapTable.set_directory(None)
+        UniversalBCSGapTable.clear()
+
+
+def test_universal_bcs_gap_table_version(tmp_path):
+    kappa = 3.7
+    gap_energy = BCSGapEnergy(1.5e-3, kappa, universal_table=True)
+
+    try:
+        UniversalBCSGapTable.set_directory(str(tmp_path))
+        built = UniversalBCSGapTable.for_gap_energy(gap_energy)
+        (path,) = tmp_path.iterdir()
+
+        # Tables of another version are built again and replaced
+        with np.load(path) as data:
+            coefficients = data["coefficients"]
+        np.savez(path, coefficients=coefficients, tolerance=1e-10, version=0)
+
+        UniversalBCSGapTable.clear()
+        rebuilt = UniversalBCSGapTable.for_gap_energy(gap_energy)
+        assert rebuilt is not built
+        assert list(tmp_path.iterdir()) == [path]
+        with np.load(path) as data:
+            assert data["version"] == TABLE_VERSION
+    finally:
+        UniversalBCSGapTable.set_directory(None)
+        UniversalBCSGapTable.clear()
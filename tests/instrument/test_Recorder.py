@@ -0,0 +1,90 @@
+from numpy import linspace
+
+from super_material.conductivity import (
+    MattisBardeenSuperconductorConductivity,
+    ZimmermannSuperconductorConductivity,
+)
+from super_material.gap_energy import BCSGapEnergy
+from super_material.instrument import (
+    Recorder,
+    active_recorder,
+    instrumented_call,
+    recording,
+)
+
+
+def test_recorder():
+    recorder = Recorder()
+    recorder.record("phase", 1.0, 10)
+    recorder.record("phase", 3.0, 20)
+
+    statistics = recorder.statistics("phase")
+    assert statistics.calls() == 2
+    assert statistics.wall_time() == 4.0
+    assert statistics.mean_wall_time() == 2.0
+    assert statistics.evaluations() == 30
+
+    with recorder.timed("timed"):
+        pass
+    assert recorder.statistics("timed").calls() == 1
+
+    assert recorder.statistics("missing").calls() == 0
+    assert "phase" in recorder.report()
+
+    recorder.reset()
+    assert recorder.phases() == {}
+
+
+def test_recording():
+    assert active_recorder() is None
+    assert instrumented_call("phase", abs, -1) == 1
+
+    with recording() as recorder:
+        assert active_recorder() is recorder
+        assert instrumented_call("phase", abs, -1) == 1
+
+        # Nested recording contexts restore the outer recorder
+        with recording() as inner_recorder:
+            assert active_recorder() is inner_recorder
+        assert active_recorder() is recorder
+
+    assert active_recorder() is None
+    assert recorder.statistics("phase").calls() == 1
+
+
+def test_recording_conductivity_phases():
+    gap_energy = BCSGapEnergy(1.5e-3, 2.3)
+    mattis_bardeen = MattisBardeenSuperconductorConductivity(gap_energy, 2.4e7)
+    zimmermann = ZimmermannSuperconductorConductivity(gap_energy, 2.4e7, 1e-14)
+    frequencies = linspace(100e9, 1500e9, 4)
+
+    with recording() as recorder:
+        mattis_bardeen.evaluate_sweep(4.2, frequencies)
+        zimmermann.evaluate_sweep(4.2, frequencies)
+
+    phases = recorder.phases()
+
+    for phase in [
+        "mattis_bardeen.gap_energy",
+        "zimmermann.gap_energy",
+        "bcs_gap_equation.solve",
+    ]:
+        assert phases[phase].calls() >= 1
+
+    for phase in [
+        "mattis_bardeen.first_real",
+        "mattis_bardeen.second_real",
+        "mattis_bardeen.imaginary",
+        "zimmermann.first",
+        "zimmermann.second",
+        "zimmermann.j",
+    ]:
+        assert phases[phase].calls() == len(frequencies)
+
+    assert phases["mattis_bardeen.first_real"].evaluations() > 0
+    assert phases["bcs_gap_equation.solve"].evaluations() > 0
+
+    # J is the sum of the first and the third integral
+    first_and_third = phases["zimmermann.first"].evaluations()
+    first_and_third += phases["zimmermann.third"].evaluations()
+    assert phases["zimmermann.j"].evaluations() == first_and_third
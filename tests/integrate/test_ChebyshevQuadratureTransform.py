@@ -1,5 +1,7 @@
 from math import isclose, atanh, atan, sqrt, pi
 
+import numpy as np
+
 from super_material.integrate.ChebyshevQuadratureTransform import *
 
 
@@ -92,6 +94,9 @@ def test_chebyshev_lower_singularity_transform():
 
     # Transformed evaluations
     assert isclose(transformed_test.evaluate(1), 2 / sqrt(3))
+    points = np.linspace(0.1, 1, 5)
+    data = [transformed_test.evaluate(u) for u in points]
+    assert np.allclose(transformed_test.evaluate_batch(points), data)
 
     # Integration
     transformed_result = integrator.integrate(transformed_test)
@@ -116,6 +121,9 @@ def test_mattis_bardeen_remove_upper_singularity_transform():
 
     # Transformed evaluations
     assert isclose(transformed_test.evaluate(1), -2 / sqrt(3))
+    points = np.linspace(0.1, 1, 5)
+    data = [transformed_test.evaluate(u) for u in points]
+    assert np.allclose(transformed_test.evaluate_batch(points), data)
 
     # Integration
     transformed_result = integrator.integrate(transformed_test)
@@ -136,6 +144,10 @@ def test_mattis_bardeen_remove_upper_and_lower_singularity_transform():
     integrand_test = ChebyshevSingularityTestIntegrand()
     transformed_test = TransformedIntegrand(integrand_test, transform)
 
+    points = np.linspace(0.1, 3, 5)
+    data = [transformed_test.evaluate(u) for u in points]
+    assert np.allclose(transformed_test.evaluate_batch(points), data)
+
     result = integrator.integrate(transformed_test)
     assert isclose(
         result,
@@ -0,0 +1,78 @@
+from math import isclose
+
+import numpy as np
+from numpy.polynomial.chebyshev import chebval
+
+from super_material.integrate import (
+    AbsoluteTolerance,
+    ClenshawCurtisIntegrator,
+    IntegrandBoundary,
+    IntegrandInterface,
+    IntegrandInterval,
+    RelativeTolerance,
+)
+
+from .test_IntegratorInterface import (
+    ParabolicTestIntegrand,
+    assert_integrator_interface,
+)
+
+
+class ExponentialTestIntegrand(IntegrandInterface):
+    # \int_{1}^{3} e^{i x}, optionally not evaluated on the endpoints
+    _defined_on_boundary: bool
+
+    def __init__(self, defined_on_boundary: bool):
+        self._defined_on_boundary = defined_on_boundary
+
+    def evaluate(self, x: float) -> complex:
+        assert self._defined_on_boundary or 1 < x < 3
+        return np.exp(1j * x)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(1, self._defined_on_boundary)
+        end = IntegrandBoundary(3, self._defined_on_boundary)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+    @staticmethod
+    def analytical() -> complex:
+        return (np.exp(3j) - np.exp(1j)) / 1j
+
+
+def test_clenshaw_curtis_integrator():
+    integrator = ClenshawCurtisIntegrator(tolerance=RelativeTolerance(1e-12))
+    assert_integrator_interface(integrator)
+
+    parabolic_test = ParabolicTestIntegrand()
+    parabolic_result = integrator.integrate(parabolic_test)
+    assert isclose(parabolic_result, parabolic_test.analytical())
+
+    # Clenshaw-Curtis with and Fejer's second rule without the endpoints
+    integrator = ClenshawCurtisIntegrator(tolerance=AbsoluteTolerance(1e-12))
+    for defined_on_boundary in [True, False]:
+        exponential_test = ExponentialTestIntegrand(defined_on_boundary)
+        exponential_result = integrator.integrate(exponential_test)
+        assert abs(exponential_result - exponential_test.analytical()) < 1e-13
+
+
+def test_clenshaw_curtis_integrator_interpolate():
+    integrator = ClenshawCurtisIntegrator(tolerance=AbsoluteTolerance(1e-12))
+
+    exponential_test = ExponentialTestIntegrand(True)
+    integral, coefficients = integrator.interpolate(exponential_test)
+    assert abs(integral - exponential_test.analytical()) < 1e-13
+
+    # Interpolant in the variable mapping [1, 3] to [-1, 1]
+    points = np.linspace(1, 3, 11)
+    data = chebval(points - 2, coefficients)
+    assert np.allclose(data, np.exp(1j * points), rtol=0, atol=1e-13)
+
+
+def test_clenshaw_curtis_integrator_default_tolerance():
+    integrator = ClenshawCurtisIntegrator()
+    assert integrator.tolerance().absolute_and_relative() == (1.49e-8, 1.49e-8)
+
+    parabolic_test = ParabolicTestIntegrand()
+    parabolic_result = integrator.integrate(parabolic_test)
+    assert isclose(parabolic_result, parabolic_test.analytical())
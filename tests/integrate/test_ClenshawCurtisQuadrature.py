@@ -0,0 +1,27 @@
+import numpy as np
+
+from super_material.integrate import ClenshawCurtisQuadrature
+
+
+def test_clenshaw_curtis_quadrature():
+    for order in [2, 3, 8, 9, 64]:
+        for include_endpoints in [True, False]:
+            quadrature = ClenshawCurtisQuadrature(order, include_endpoints)
+            abscissae = quadrature.abscissae()
+            weights = quadrature.weights()
+
+            expected_points = order + 1 if include_endpoints else order - 1
+            assert quadrature.num_quadrature_points() == expected_points
+            assert np.all(weights > 0)
+
+            # Exact for polynomials up to degree n, or n - 2 without the
+            # endpoints
+            for degree in range(expected_points):
+                expected = 2 / (degree + 1) if degree % 2 == 0 else 0
+                data = weights @ abscissae ** degree
+                assert np.isclose(data, expected, atol=1e-14)
+
+    # Nested under doubling of the order
+    coarse = ClenshawCurtisQuadrature(8).abscissae()
+    fine = ClenshawCurtisQuadrature(16).abscissae()
+    assert np.allclose(fine[::2], coarse)
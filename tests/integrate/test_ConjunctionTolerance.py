@@ -42,3 +42,6 @@ def test_relative_tolerance():
     assert tolerance_r.within_tolerance(1, 1.0005)
     assert tolerance_ar.within_tolerance(1, 1.0005)
     assert tolerance_ra.within_tolerance(1, 1.0005)
+
+    # Not the larger of an absolute and a relative tolerance
+    assert tolerance_ar.absolute_and_relative() is None
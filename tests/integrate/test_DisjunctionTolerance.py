@@ -42,3 +42,8 @@ def test_relative_tolerance():
     assert tolerance_r.within_tolerance(1, 1.0005)
     assert tolerance_ar.within_tolerance(1, 1.0005)
     assert tolerance_ra.within_tolerance(1, 1.0005)
+
+    # The larger of the absolute and relative tolerances of the children
+    assert tolerance_a.absolute_and_relative() == (1e-3, 0)
+    assert tolerance_ar.absolute_and_relative() == (1e-3, 1e-3)
+    assert tolerance_ra.absolute_and_relative() == (1e-3, 1e-3)
@@ -0,0 +1,107 @@
+import warnings
+from math import exp, isclose, pi, sqrt
+from typing import Tuple
+
+import numpy as np
+import pytest
+from scipy.special import i0
+
+from super_material.integrate import (
+    GaussJacobiIntegrator,
+    IntegrandBoundary,
+    IntegrandFamily,
+    IntegrandInterface,
+    IntegrandInterval,
+)
+
+from .test_IntegratorInterface import (
+    ParabolicTestIntegrand,
+    assert_integrator_interface,
+)
+
+
+class GapEdgeTestIntegrand(IntegrandInterface):
+    # \int_{a}^{b} \frac{e^{x}}{\sqrt{(x - a) (b - x)}}
+    _a: float
+    _b: float
+
+    def __init__(self, a, b):
+        self._a = a
+        self._b = b
+
+    def evaluate(self, x: float) -> float:
+        return exp(x) / sqrt((x - self._a) * (self._b - x))
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        return np.exp(xs) / np.sqrt((xs - self._a) * (self._b - xs))
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(self._a, False)
+        end = IntegrandBoundary(self._b, False)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+    def endpoint_exponents(self) -> Tuple[float, float]:
+        return -0.5, -0.5
+
+    def analytical(self) -> float:
+        middle = (self._a + self._b) / 2
+        half_width = (self._b - self._a) / 2
+        return pi * exp(middle) * i0(half_width)
+
+
+def test_gauss_jacobi_integrator():
+    integrator = GaussJacobiIntegrator(1e-13, 1e-13)
+    assert_integrator_interface(integrator)
+
+    # Smooth integrands are integrated with the Gauss-Legendre rule
+    parabolic_test = ParabolicTestIntegrand()
+    parabolic_result = integrator.integrate(parabolic_test)
+    assert isclose(parabolic_result, parabolic_test.analytical())
+
+    # Inverse square root singularities at both ends
+    for a, b in [(-1, 1), (1e-3, 4e-3), (2, 5)]:
+        gap_edge_test = GapEdgeTestIntegrand(a, b)
+        gap_edge_result = integrator.integrate(gap_edge_test)
+        assert isclose(gap_edge_result, gap_edge_test.analytical(), rel_tol=1e-13)
+
+    # A low fixed order is exact to double precision for a smooth remainder
+    gap_edge_test = GapEdgeTestIntegrand(2, 5)
+    gap_edge_result = integrator.integrate_order(gap_edge_test, 16)
+    assert isclose(gap_edge_result, gap_edge_test.analytical(), rel_tol=1e-13)
+
+    # Not converging at the maximum order warns, unless integrated by orders
+    integrator = GaussJacobiIntegrator(0, 1e-300, maximum_order=16)
+    with pytest.warns(RuntimeWarning):
+        assert not integrator.integrate_with_info(gap_edge_test).converged()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = integrator.integrate_orders(gap_edge_test)
+
+    assert not result.converged()
+    assert result.evaluations() == 8 + 16
+
+
+def test_gauss_jacobi_integrator_family():
+    integrator = GaussJacobiIntegrator(1e-13, 1e-13, maximum_order=32)
+    starts = np.array([-1, 1e-3, 2, -30])
+    ends = np.array([1, 4e-3, 5, 30])
+
+    family = IntegrandFamily(
+        [GapEdgeTestIntegrand(a, b) for a, b in zip(starts, ends)],
+        lambda indices: GapEdgeTestIntegrand(
+            starts[indices, None], ends[indices, None]
+        ),
+    )
+
+    # The members are integrated to the orders they are on their own, the
+    # widest one without converging
+    for a, b, result in zip(starts, ends, integrator.integrate_family_orders(family)):
+        expected = integrator.integrate_orders(GapEdgeTestIntegrand(a, b))
+
+        assert result.converged() == expected.converged()
+        assert result.value() == expected.value()
+        assert result.evaluations() == expected.evaluations()
+
+    assert not result.converged()
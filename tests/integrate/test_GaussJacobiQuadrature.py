@@ -0,0 +1,22 @@
+import numpy as np
+from scipy.special import beta
+
+from super_material.integrate import GaussJacobiQuadrature
+
+
+def test_gauss_jacobi_quadrature():
+    for lower_exponent, upper_exponent in [(-0.5, -0.5), (0.5, -0.5), (-0.25, 0)]:
+        quadrature = GaussJacobiQuadrature(6, lower_exponent, upper_exponent)
+        abscissae = quadrature.abscissae()
+        weights = quadrature.weights()
+
+        assert quadrature.num_quadrature_points() == 6
+        assert np.all(np.abs(abscissae) < 1)
+
+        # \int_{-1}^{1} (1 + x)^{a + k} (1 - x)^{b} dx, exact up to degree 11
+        for degree in range(12):
+            expected = 2 ** (lower_exponent + upper_exponent + degree + 1) * beta(
+                lower_exponent + degree + 1, upper_exponent + 1
+            )
+            data = weights @ (1 + abscissae) ** degree
+            assert np.isclose(data, expected, rtol=1e-13)
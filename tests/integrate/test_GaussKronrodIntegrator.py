@@ -0,0 +1,210 @@
+from math import cos, isclose, sin, sqrt
+
+import numpy as np
+import pytest
+from scipy.integrate import quad
+
+from super_material.integrate import (
+    AbsoluteTolerance,
+    DisjunctionTolerance,
+    GaussKronrodIntegrator,
+    IntegrandBoundary,
+    IntegrandFamily,
+    IntegrandInterface,
+    IntegrandInterval,
+    RelativeTolerance,
+)
+
+from .test_IntegratorInterface import (
+    ParabolicTestIntegrand,
+    assert_integrator_interface,
+)
+
+
+class OscillatingTestIntegrand(IntegrandInterface):
+    # \int_{0}^{10} e^{i k x} \sqrt{x} dx, with the square root not smooth at 0
+    def __init__(self, k=20):
+        self._k = k
+
+    def evaluate(self, x: float) -> complex:
+        return np.exp(1j * self._k * x) * np.sqrt(x)
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        return np.exp(1j * self._k * xs) * np.sqrt(xs)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(0, True)
+        end = IntegrandBoundary(10, True)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+
+class SineTestIntegrand(IntegrandInterface):
+    def evaluate(self, x: float) -> float:
+        return sin(x)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(0, True)
+        end = IntegrandBoundary(30, True)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+    @staticmethod
+    def analytical() -> float:
+        return 1 - cos(30)
+
+
+def test_gauss_kronrod_integrator():
+    integrator = GaussKronrodIntegrator()
+    assert_integrator_interface(integrator)
+
+    parabolic_test = ParabolicTestIntegrand()
+    parabolic_result = integrator.integrate(parabolic_test)
+    assert isclose(parabolic_result, parabolic_test.analytical())
+
+    # Scalar integrand evaluated through the default batch evaluation
+    integrator = GaussKronrodIntegrator(1e-12, 1e-12)
+    sine_test = SineTestIntegrand()
+    sine_result = integrator.integrate(sine_test)
+    assert isclose(sine_result, sine_test.analytical(), rel_tol=1e-12)
+
+
+def test_gauss_kronrod_integrator_complex():
+    integrator = GaussKronrodIntegrator(1e-10, 1e-10, limit=200)
+
+    oscillating_test = OscillatingTestIntegrand()
+    result = integrator.integrate(oscillating_test)
+
+    # QUADPACK reference with the oscillating factor as weight function
+    real, _ = quad(sqrt, 0, 10, weight="cos", wvar=20, epsabs=1e-13)
+    imaginary, _ = quad(sqrt, 0, 10, weight="sin", wvar=20, epsabs=1e-13)
+
+    assert abs(result - (real + 1j * imaginary)) < 1e-9
+
+
+def test_gauss_kronrod_integrator_tolerance():
+    # Stops as soon as either the relative or the absolute tolerance is met
+    relative_tolerance = RelativeTolerance(1e-12)
+    absolute_tolerance = AbsoluteTolerance(1e-3)
+    tolerance = DisjunctionTolerance([relative_tolerance, absolute_tolerance])
+    integrator = GaussKronrodIntegrator(limit=200, tolerance=tolerance)
+
+    oscillating_test = OscillatingTestIntegrand()
+    coarse_result = integrator.integrate(oscillating_test)
+
+    real, _ = quad(sqrt, 0, 10, weight="cos", wvar=20, epsabs=1e-13)
+    imaginary, _ = quad(sqrt, 0, 10, weight="sin", wvar=20, epsabs=1e-13)
+    error = abs(coarse_result - (real + 1j * imaginary))
+
+    assert error < 1e-3
+    assert error > 1e-9
+
+
+def test_gauss_kronrod_integrator_family():
+    integrator = GaussKronrodIntegrator(1e-10, 1e-10, limit=200)
+    ks = np.array([0.5, 5, 20, 40])
+    tolerances = [RelativeTolerance(1e-6)] + [RelativeTolerance(1e-8)] * 3
+
+    family = IntegrandFamily(
+        [OscillatingTestIntegrand(k) for k in ks],
+        lambda indices: OscillatingTestIntegrand(ks[indices, None]),
+    )
+    results = integrator.integrate_family_with_info(family, tolerances)
+
+    # The members are refined as they are on their own
+    for k, tolerance, result in zip(ks, tolerances, results):
+        expected = GaussKronrodIntegrator(
+            limit=200, tolerance=tolerance
+        ).integrate_with_info(OscillatingTestIntegrand(k))
+
+        assert result.converged()
+        assert result.value() == expected.value()
+        assert result.evaluations() == expected.evaluations()
+        assert result.subdivisions() == expected.subdivisions()
+
+
+class PoleTestIntegrand(IntegrandInterface):
+    # 1 / (x - p) on [0, 1], not finite at the pole p
+    def __init__(self, pole=0.25):
+        self._pole = pole
+
+    def evaluate(self, x: float) -> float:
+        return 1 / (x - self._pole)
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore"):
+            return 1 / (xs - self._pole)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(0, True)
+        end = IntegrandBoundary(1, True)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+
+class StepTestIntegrand(IntegrandInterface):
+    # The step from 0 to 1 at the start of the interval
+    def __init__(self, start, end):
+        self._start = start
+        self._end = end
+
+    def evaluate(self, x: float) -> float:
+        return float(x > self._start)
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        return (xs > self._start).astype(float)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(self._start, True)
+        end = IntegrandBoundary(self._end, True)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+
+def test_gauss_kronrod_integrator_not_finite():
+    integrator = GaussKronrodIntegrator()
+    coarse_result = GaussKronrodIntegrator(limit=1).integrate_with_info(
+        PoleTestIntegrand()
+    )
+
+    # The halves of [0, 1] are evaluated at the pole, so [0, 1] keeps its own
+    # estimate and is not refined further
+    with pytest.warns(RuntimeWarning, match="not finite"):
+        result = integrator.integrate_with_info(PoleTestIntegrand())
+
+    assert not result.converged()
+    assert result.value() == coarse_result.value()
+    assert result.subdivisions() == 1
+
+    family = IntegrandFamily([PoleTestIntegrand()], lambda indices: PoleTestIntegrand())
+    with pytest.warns(RuntimeWarning, match="not finite"):
+        (family_result,) = integrator.integrate_family_with_info(family)
+
+    assert not family_result.converged()
+    assert family_result.value() == result.value()
+
+
+def test_gauss_kronrod_integrator_narrow_panels():
+    integrator = GaussKronrodIntegrator(tolerance=AbsoluteTolerance(0))
+
+    # The only panel is too narrow to be bisected
+    end = np.nextafter(1.0, 2.0)
+    integrand = StepTestIntegrand(1.0, end)
+    with pytest.warns(RuntimeWarning, match="refined further"):
+        result = integrator.integrate_with_info(integrand)
+
+    assert not result.converged()
+    assert np.isfinite(result.value())
+    assert result.subdivisions() == 1
+
+    # Only the panels that are wide enough are bisected
+    panels = np.array([[1.0, end], [0.0, 1.0]])
+    refinable = np.ones(2, dtype=bool)
+    keep, bisect, new_panels = integrator.bisect_panels(
+        AbsoluteTolerance(1e-9), panels, np.array([1.0, 0.5]), refinable, 0.0, 1.5
+    )
+
+    assert list(refinable) == [False, True]
+    assert list(keep) == [0]
+    assert list(bisect) == [1]
+    assert np.array_equal(new_panels, [[0.0, 0.5], [0.5, 1.0]])
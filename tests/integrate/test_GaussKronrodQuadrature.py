@@ -0,0 +1,29 @@
+import numpy as np
+
+from super_material.integrate import GaussKronrodQuadrature, GaussLegendreQuadrature
+
+
+def test_gauss_kronrod_quadrature():
+    for order in [1, 2, 7, 10, 15]:
+        quadrature = GaussKronrodQuadrature(order)
+        abscissae = quadrature.abscissae()
+        weights = quadrature.weights()
+        gauss_weights = quadrature.gauss_weights()
+
+        assert quadrature.num_quadrature_points() == 2 * order + 1
+        assert np.all(np.diff(abscissae) > 0)
+
+        # The Gauss abscissae are embedded in the Kronrod abscissae
+        gauss = GaussLegendreQuadrature(order)
+        assert np.allclose(abscissae[gauss_weights != 0], gauss.abscissae())
+
+        # Exact for polynomials up to degree 3 n + 1
+        for degree in range(3 * order + 2):
+            expected = 2 / (degree + 1) if degree % 2 == 0 else 0
+            assert np.isclose(weights @ abscissae ** degree, expected, atol=1e-14)
+
+    # Tabulated 15 point Kronrod rule
+    quadrature = GaussKronrodQuadrature(7)
+    assert np.isclose(quadrature.abscissae()[-1], 0.991455371120812639206854697526329)
+    assert np.isclose(quadrature.weights()[-1], 0.022935322010529224963732008058970)
+    assert np.isclose(quadrature.weights()[7], 0.209482141084727828012999174891714)
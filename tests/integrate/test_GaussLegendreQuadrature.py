@@ -0,0 +1,23 @@
+import numpy as np
+
+from super_material.integrate import GaussLegendreQuadrature
+
+
+def test_gauss_legendre_quadrature():
+    for order in [1, 2, 5, 20]:
+        quadrature = GaussLegendreQuadrature(order)
+        abscissae = quadrature.abscissae()
+        weights = quadrature.weights()
+
+        assert quadrature.num_quadrature_points() == order
+        assert len(abscissae) == len(weights) == order
+
+        # Exact for polynomials up to degree 2 n - 1
+        for degree in range(2 * order):
+            expected = 2 / (degree + 1) if degree % 2 == 0 else 0
+            assert np.isclose(weights @ abscissae ** degree, expected, atol=1e-14)
+
+    # Shared between quadratures of the same order
+    first = GaussLegendreQuadrature(5)
+    second = GaussLegendreQuadrature(5)
+    assert first.abscissae() is second.abscissae()
@@ -1,7 +1,14 @@
+from math import isclose, isnan
+
+import numpy as np
+import pytest
+from scipy.integrate import IntegrationWarning, quad
+
 from super_material.integrate import (
     IntegrandInterface,
     IntegrandBoundary,
     IntegrandInterval,
+    IntegratorInterface,
 )
 
 
@@ -18,3 +25,72 @@ class ParabolicTestIntegrand(IntegrandInterface):
     @staticmethod
     def analytical() -> float:
         return 4 ** 3 / 3
+
+
+class MidpointTestIntegrator(IntegratorInterface):
+    # Composite midpoint rule without its own diagnostics
+    def integrate(self, integrand: IntegrandInterface) -> float:
+        interval = integrand.interval()
+        start = interval.start().value()
+        end = interval.end().value()
+        width = (end - start) / 1000
+        points = start + width * (np.arange(1000) + 0.5)
+        return width * integrand.evaluate_batch(points).sum()
+
+
+class QuadTestIntegrator(IntegratorInterface):
+    # QUADPACK without its own diagnostics
+    def __init__(self, limit=50):
+        self._limit = limit
+
+    def integrate(self, integrand: IntegrandInterface) -> float:
+        interval = integrand.interval()
+        start = interval.start().value()
+        end = interval.end().value()
+        value, _ = quad(integrand.evaluate, start, end, limit=self._limit)
+        return value
+
+
+class AbsoluteValueTestIntegrand(IntegrandInterface):
+    def evaluate(self, x: float) -> float:
+        return abs(x - 0.3)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(0, True)
+        end = IntegrandBoundary(1, True)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+
+def assert_integrator_interface(integrator: IntegratorInterface):
+    parabolic_test = ParabolicTestIntegrand()
+    result = integrator.integrate_with_info(parabolic_test)
+
+    assert isclose(result.value(), parabolic_test.analytical(), rel_tol=1e-6)
+    assert result.value() == integrator.integrate(parabolic_test)
+    assert result.evaluations() > 0
+    assert result.subdivisions() >= 1
+    assert result.wall_time() >= 0
+    assert result.converged()
+
+
+def test_integrator_interface_integrate_with_info():
+    integrator = MidpointTestIntegrator()
+    assert_integrator_interface(integrator)
+
+    result = integrator.integrate_with_info(ParabolicTestIntegrand())
+    assert result.evaluations() == 1000
+    assert isnan(result.error())
+
+
+def test_integrator_interface_integrate_with_info_warning():
+    integrator = QuadTestIntegrator()
+    assert integrator.integrate_with_info(AbsoluteValueTestIntegrand()).converged()
+
+    # The integration warnings of SciPy are user warnings
+    integrator = QuadTestIntegrator(limit=1)
+    with pytest.warns(IntegrationWarning):
+        result = integrator.integrate_with_info(AbsoluteValueTestIntegrand())
+
+    assert not result.converged()
+    assert result.evaluations() == 21
@@ -1,5 +1,7 @@
 from math import isclose
 
+import numpy as np
+
 from super_material.integrate import (
     QuadpackIntegrator,
     LinearIntegrandIntervalTransform,
@@ -24,6 +26,11 @@ def test_linear_integrand_transform():
     assert isclose(transformed_interval.start().value(), 1)
     assert isclose(transformed_interval.end().value(), 9)
 
+    # Transformed evaluations
+    points = np.linspace(1, 9, 5)
+    data = [transformed_test.evaluate(u) for u in points]
+    assert np.allclose(transformed_test.evaluate_batch(points), data)
+
     # Integration
     transformed_result = integrator.integrate(transformed_test)
     assert isclose(transformed_result, parabolic_test.analytical())
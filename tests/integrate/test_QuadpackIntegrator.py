@@ -1,13 +1,77 @@
-from math import isclose
+from math import isclose, sqrt
 
-from super_material.integrate import QuadpackIntegrator
+import pytest
+from scipy.integrate import IntegrationWarning
 
-from .test_IntegratorInterface import ParabolicTestIntegrand
+from super_material.integrate import (
+    AbsoluteTolerance,
+    ConjunctionTolerance,
+    DisjunctionTolerance,
+    IntegrandBoundary,
+    IntegrandInterface,
+    IntegrandInterval,
+    QuadpackIntegrator,
+    RelativeTolerance,
+)
+
+from .test_IntegratorInterface import (
+    ParabolicTestIntegrand,
+    assert_integrator_interface,
+)
+
+
+class SquareRootTestIntegrand(IntegrandInterface):
+    def evaluate(self, x: float) -> float:
+        return sqrt(abs(x - 0.3))
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(0, True)
+        end = IntegrandBoundary(1, True)
+        interval = IntegrandInterval(start, end)
+        return interval
 
 
 def test_quadpack_integrator():
     integrator = QuadpackIntegrator()
+    assert_integrator_interface(integrator)
 
     parabolic_test = ParabolicTestIntegrand()
     parabolic_result = integrator.integrate(parabolic_test)
     assert isclose(parabolic_result, parabolic_test.analytical())
+
+
+def test_quadpack_integrator_tolerance():
+    tolerance = DisjunctionTolerance.absolute_or_relative(1e-10, 1e-10)
+    integrator = QuadpackIntegrator(tolerance=tolerance)
+    assert integrator.tolerance() is tolerance
+
+    parabolic_test = ParabolicTestIntegrand()
+    parabolic_result = integrator.integrate(parabolic_test)
+    assert isclose(parabolic_result, parabolic_test.analytical(), rel_tol=1e-10)
+
+    # The tolerance is given to a single integration of QUADPACK
+    square_root_test = SquareRootTestIntegrand()
+    result = integrator.integrate_with_info(square_root_test)
+    expected = QuadpackIntegrator(1e-10, 1e-10).integrate_with_info(square_root_test)
+    assert result.value() == expected.value()
+    assert result.evaluations() == expected.evaluations()
+
+    # Conjunctions are integrated to progressively tighter tolerances
+    tolerance = ConjunctionTolerance(
+        [AbsoluteTolerance(1e-10), RelativeTolerance(1e-10)]
+    )
+    integrator = QuadpackIntegrator(tolerance=tolerance)
+    result = integrator.integrate_with_info(square_root_test)
+    assert result.converged()
+    assert isclose(result.value(), expected.value(), rel_tol=1e-10)
+
+
+def test_quadpack_integrator_limit():
+    integrator = QuadpackIntegrator(1e-14, 1e-14, limit=1)
+
+    with pytest.warns(IntegrationWarning):
+        result = integrator.integrate_with_info(SquareRootTestIntegrand())
+
+    assert not result.converged()
+    assert result.subdivisions() == 1
+    assert result.error() > 0
@@ -0,0 +1,42 @@
+import numpy as np
+
+from super_material.integrate import (
+    AbsoluteTolerance,
+    DisjunctionTolerance,
+    RelativeTolerance,
+    ScaledTolerance,
+)
+
+from .test_ToleranceInterface import assert_tolerance_interface
+
+
+def test_scaled_tolerance():
+    absolute_tolerance = ScaledTolerance(AbsoluteTolerance(1e-3), 1e3)
+    relative_tolerance = ScaledTolerance(RelativeTolerance(1e-3), 1e3)
+    either_tolerance = ScaledTolerance(
+        DisjunctionTolerance.absolute_or_relative(1e-3, 1e-3), 1e3
+    )
+
+    assert_tolerance_interface(absolute_tolerance)
+    assert_tolerance_interface(relative_tolerance)
+    assert_tolerance_interface(either_tolerance)
+
+    # The absolute tolerance applies to the scaled difference
+    assert not absolute_tolerance.within_tolerance(1, 1 + 1e-5)
+    assert absolute_tolerance.within_tolerance(1, 1 + 1e-7)
+
+    # The relative tolerance does not depend on the scale
+    assert relative_tolerance.within_tolerance(1, 1 + 1e-4)
+    assert not relative_tolerance.within_tolerance(1, 1 + 1e-2)
+
+    # The absolute tolerance of the integral is divided by the scale
+    assert absolute_tolerance.absolute_and_relative() == (1e-6, 0)
+    assert relative_tolerance.absolute_and_relative() == (0, 1e-3)
+    assert either_tolerance.absolute_and_relative() == (1e-6, 1e-3)
+
+    assert np.array_equal(
+        either_tolerance.within_tolerance_batch(
+            [1e-9, 1, 1], [2e-9, 1 + 1e-4, 1 + 1e-2]
+        ),
+        [True, True, False],
+    )
@@ -0,0 +1,28 @@
+from math import exp, isclose
+
+from super_material.integrate import (
+    IntegrandBoundary,
+    IntegrandInterval,
+    ScipyQuadratureIntegrator,
+)
+from super_material.integrate.BaseIntegrand import BaseIntegrand
+
+from .test_IntegratorInterface import (
+    ParabolicTestIntegrand,
+    assert_integrator_interface,
+)
+
+
+def test_scipy_quadrature_integrator():
+    integrator = ScipyQuadratureIntegrator()
+    assert_integrator_interface(integrator)
+
+    parabolic_test = ParabolicTestIntegrand()
+    parabolic_result = integrator.integrate(parabolic_test)
+    assert isclose(parabolic_result, parabolic_test.analytical())
+
+    # Converges with increasing order
+    interval = IntegrandInterval(IntegrandBoundary(0, True), IntegrandBoundary(1, True))
+    exponential_test = BaseIntegrand(exp, interval)
+    exponential_result = integrator.integrate(exponential_test)
+    assert isclose(exponential_result, exp(1) - 1, rel_tol=1e-12)
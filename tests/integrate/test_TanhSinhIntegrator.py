@@ -0,0 +1,89 @@
+from math import isclose, sqrt
+
+import numpy as np
+
+from super_material.integrate import (
+    IntegrandBoundary,
+    IntegrandInterface,
+    IntegrandInterval,
+    TanhSinhIntegrator,
+)
+
+from .test_IntegratorInterface import (
+    ParabolicTestIntegrand,
+    assert_integrator_interface,
+)
+
+
+class InverseSquareRootTestIntegrand(IntegrandInterface):
+    # \int_{a}^{b} \frac{1}{\sqrt{x - a}}, never evaluated at the singularity
+    _a: float
+    _b: float
+
+    def __init__(self, a, b):
+        self._a = a
+        self._b = b
+
+    def evaluate(self, x: float) -> float:
+        assert x > self._a
+        return 1 / sqrt(x - self._a)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(self._a, False)
+        end = IntegrandBoundary(self._b, True)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+    def analytical(self) -> float:
+        return 2 * sqrt(self._b - self._a)
+
+
+class LogarithmicTestIntegrand(IntegrandInterface):
+    # \int_{0}^{1} \frac{i \ln{x}}{\sqrt{1 - x}}
+    def evaluate(self, x: float) -> complex:
+        return 1j * np.log(x) / np.sqrt(1 - x)
+
+    def evaluate_batch(self, xs: np.ndarray) -> np.ndarray:
+        return 1j * np.log(xs) / np.sqrt(1 - xs)
+
+    def interval(self) -> IntegrandInterval:
+        start = IntegrandBoundary(0, False)
+        end = IntegrandBoundary(1, False)
+        interval = IntegrandInterval(start, end)
+        return interval
+
+    @staticmethod
+    def analytical() -> complex:
+        return 1j * (4 * np.log(2) - 4)
+
+
+def test_tanh_sinh_integrator():
+    integrator = TanhSinhIntegrator()
+    assert_integrator_interface(integrator)
+
+    parabolic_test = ParabolicTestIntegrand()
+    parabolic_result = integrator.integrate(parabolic_test)
+    assert isclose(parabolic_result, parabolic_test.analytical())
+
+
+def test_tanh_sinh_integrator_singularities():
+    integrator = TanhSinhIntegrator(1e-12, 1e-12)
+
+    # Nodes are placed at their exact distance from a singularity at zero
+    singular_test = InverseSquareRootTestIntegrand(0, 4)
+    singular_result = integrator.integrate(singular_test)
+    assert isclose(singular_result, singular_test.analytical(), rel_tol=1e-12)
+
+    # Away from zero the nodes closest to the singularity round onto it and are
+    # skipped, which limits the accuracy to about the square root of the
+    # machine precision
+    singular_test = InverseSquareRootTestIntegrand(1, 2)
+    integrator = TanhSinhIntegrator(1e-7, 1e-7)
+    singular_result = integrator.integrate(singular_test)
+    assert isclose(singular_result, singular_test.analytical(), rel_tol=1e-7)
+
+    # Complex valued with singularities at both ends
+    integrator = TanhSinhIntegrator(1e-7, 1e-7)
+    logarithmic_test = LogarithmicTestIntegrand()
+    logarithmic_result = integrator.integrate(logarithmic_test)
+    assert abs(logarithmic_result - logarithmic_test.analytical()) < 1e-7
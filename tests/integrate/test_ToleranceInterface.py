@@ -1,6 +1,19 @@
+import numpy as np
+
 from super_material.integrate import ToleranceInterface
 
 
 def assert_tolerance_interface(tolerance: ToleranceInterface):
     # Should always be True
     assert tolerance.within_tolerance(1, 1)
+
+    # Batch evaluation agrees with the element-wise evaluation
+    values = np.array([1, 1, 1, 1, 1, 1000, 1e-3, 0, 0])
+    references = np.array([1, 1.5, 1.05, 1.005, 1.0005, 1000.5, 1e-4, 0, 1e-5])
+    expected = [
+        tolerance.within_tolerance(value, reference)
+        for value, reference in zip(values, references)
+    ]
+    assert np.array_equal(
+        tolerance.within_tolerance_batch(values, references), expected
+    )
@@ -0,0 +1,36 @@
+from math import isclose
+
+import scipy.constants as const
+
+from super_material import constants
+
+# Relative revisions of the constants in later CODATA editions are within
+# this tolerance, such as of the reduced Planck constant by 8e-9 in CODATA
+# 2018 and of mu_0 and eps_0 by 7e-10 in CODATA 2022
+CODATA_TOLERANCE = 2e-8
+
+
+def test_constants_match_scipy():
+    assert constants.c0 == const.speed_of_light
+    assert constants.pi == const.pi
+
+    pinned = [
+        (constants.mu_0, const.mu_0),
+        (
+            constants.h_bar,
+            const.physical_constants["reduced Planck constant in eV s"][0],
+        ),
+        (constants.k_B, const.physical_constants["Boltzmann constant in eV/K"][0]),
+        (constants.eps_0, const.epsilon_0),
+    ]
+    for value, scipy_value in pinned:
+        assert isclose(value, scipy_value, rel_tol=CODATA_TOLERANCE)
+
+
+def test_constants_codata():
+    # The values of CODATA 2018, except for the reduced Planck constant of
+    # CODATA 2014
+    assert constants.mu_0 == 1.25663706212e-06
+    assert constants.h_bar == 6.582119514e-16
+    assert constants.k_B == 8.617333262e-05
+    assert constants.eps_0 == 8.8541878128e-12
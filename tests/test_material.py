@@ -1 +1,26 @@
-from super_material import __version__
+import subprocess
+import sys
+
+import super_material
+from super_material import __version__, conductivity, gap_energy
+
+
+def test_lazy_exports():
+    for name in super_material.__all__:
+        subpackage = conductivity if hasattr(conductivity, name) else gap_energy
+        assert getattr(super_material, name) is getattr(subpackage, name)
+
+    assert super_material.integrate.__name__ == "super_material.integrate"
+
+
+def test_import_does_not_import_scipy():
+    # In a fresh interpreter, this one has imported SciPy already
+    code = (
+        "import sys\n"
+        "import super_material\n"
+        "from super_material.constants import h_bar, k_B\n"
+        "from super_material import BCSGapEnergy\n"
+        "import super_material.conductivity\n"
+        "assert 'scipy' not in sys.modules, sorted(sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)